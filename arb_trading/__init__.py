@@ -49,7 +49,16 @@ def create_config_template(path: str = "config.json"):
             "exit_percent": 0.5,
             "spread_hold_count": 3,
             "top_symbol_limit": 300,
-            "min_volume_usdt": 5000000
+            "min_volume_usdt": 5000000,
+            "spread_mode": "last",
+            "min_net_edge_pct": 0.0,
+            "stats_window": 120,
+            "stats_ewma_halflife": 30.0,
+            "entry_min_zscore": 0.0,
+            "funding_horizon_hours": 0.0,
+            "leverage": 1,
+            "margin_mode": "isolated",
+            "live_execution": False
         },
         "exchanges": {
             "binance": {
@@ -69,12 +78,45 @@ def create_config_template(path: str = "config.json"):
             "default_type": "limit",
             "market_order_enabled": False,
             "stop_loss_enabled": False,
-            "limit_order_slippage": 0.001
+            "limit_order_slippage": 0.001,
+            "leg_timeout_seconds": 2.0,
+            "entry_cooldown_seconds": 60.0
         },
         "monitoring": {
             "performance_logging": False,
             "fetch_interval": 5,
-            "log_buffer_size": 100
+            "log_buffer_size": 100,
+            "market_data_mode": "rest",
+            "stream_stale_seconds": 10.0,
+            "http_pool_size": 100,
+            "http_pool_per_host": 20,
+            "http_keepalive_timeout": 120.0,
+            "http_warm_connections": 2,
+            "http_keepalive_interval": 30.0,
+            "fetch_deadline_ratio": 0.8,
+            "request_hedging": False,
+            "hedge_max_ratio": 0.1,
+            "hedge_rate_headroom": 0.2,
+            "circuit_failure_threshold": 5,
+            "circuit_recovery_seconds": 10.0,
+            "retry_max_attempts": 3,
+            "retry_base_delay": 0.1,
+            "retry_max_delay": 2.0,
+            "event_driven": False,
+            "event_window_ms": 5.0,
+            "universe_refresh_seconds": 3600.0,
+            "volume_refresh_seconds": 300.0,
+            "funding_refresh_seconds": 60.0,
+            "pipeline_queue_size": 1,
+            "loop_lag_interval": 0.1,
+            "slow_callback_ms": 0.0
+        },
+        "filters": {
+            "max_price_ratio": 10.0,
+            "price_tiers": [[1000.0, 1.0], [10.0, 2.0], [0.1, 5.0], [0.0, 10.0]],
+            "max_spread_pct": 5.0,
+            "max_quote_age_seconds": 10.0,
+            "max_skew_seconds": 0.0
         },
         "notifications": {
             "slack_webhook": "",
@@ -150,6 +192,7 @@ USAGE_EXAMPLES = """
   python -m arb_trading --spread-threshold 0.3         # 스프레드 임계값 0.3%
   python -m arb_trading --max-positions 5              # 최대 5개 포지션
   python -m arb_trading --fetch-interval 3             # 3초 간격 조회
+  python -m arb_trading --market-data stream           # WebSocket 스트리밍 시세
 
 조합 사용:
   python -m arb_trading \\
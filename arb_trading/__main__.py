@@ -7,7 +7,7 @@ from pathlib import Path
 from arb_trading.config.settings import ConfigManager
 from arb_trading.core.arbitrage_engine import ArbitrageEngine
 from arb_trading.utils.logger import setup_logger
-from arb_trading.utils.platform_utils import setup_windows_event_loop
+from arb_trading.utils.platform_utils import setup_windows_event_loop, install_event_loop
 
 
 def parse_arguments():
@@ -20,6 +20,7 @@ def parse_arguments():
   python -m arb_trading --performance --log-level DEBUG # 디버그 + 성능 모니터링
   python -m arb_trading --config custom.json           # 커스텀 설정 파일
   python -m arb_trading --spread-threshold 0.3         # 스프레드 임계값 0.3%
+  python -m arb_trading --loop uvloop                  # uvloop 이벤트 루프 (미설치 시 기본 루프)
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
@@ -92,6 +93,22 @@ def parse_arguments():
         help='데이터 조회 간격 초 (기본: 5)'
     )
 
+    parser.add_argument(
+        '--market-data',
+        type=str,
+        default=None,
+        choices=['rest', 'stream'],
+        help='시세 수집 방식 (기본: rest, stream: WebSocket 스트리밍)'
+    )
+
+    parser.add_argument(
+        '--loop',
+        type=str,
+        default='asyncio',
+        choices=['asyncio', 'uvloop'],
+        help='이벤트 루프 구현 (기본: asyncio, uvloop: pip install uvloop 필요)'
+    )
+
     parser.add_argument(
         '--create-config',
         type=str,
@@ -108,12 +125,13 @@ def parse_arguments():
     return parser.parse_args()
 
 
-async def main():
+async def main(args=None):
     """메인 함수"""
     # Windows 환경 설정
     setup_windows_event_loop()
 
-    args = parse_arguments()
+    if args is None:
+        args = parse_arguments()
 
     # 설정 파일 생성 요청 처리
     if args.create_config:
@@ -136,6 +154,10 @@ async def main():
         logger.info(f"📁 작업 디렉토리: {Path.cwd()}")
         logger.info(f"🐍 Python 버전: {sys.version.split()[0]}")
         logger.info(f"💻 플랫폼: {sys.platform}")
+        loop_backend = type(asyncio.get_running_loop()).__module__.split('.')[0]
+        logger.info(f"🔁 이벤트 루프: {loop_backend}")
+        if args.loop == 'uvloop' and loop_backend != 'uvloop':
+            logger.warning("⚠️ uvloop를 사용할 수 없어 기본 이벤트 루프로 실행합니다 (pip install uvloop)")
         logger.info("=" * 60)
 
         # 설정 로드
@@ -174,6 +196,10 @@ async def main():
             config_manager.update_config('monitoring', 'fetch_interval', args.fetch_interval)
             config_updates.append(f"조회 간격: {args.fetch_interval}초")
 
+        if args.market_data:
+            config_manager.update_config('monitoring', 'market_data_mode', args.market_data)
+            config_updates.append(f"시세 수집: {args.market_data}")
+
         if config_updates:
             logger.info(f"⚙️ 설정 업데이트: {', '.join(config_updates)}")
 
@@ -186,6 +212,7 @@ async def main():
         logger.info(f"   스프레드 임계값: {trading_config.spread_threshold}%")
         logger.info(f"   최대 포지션: {trading_config.max_positions}개")
         logger.info(f"   조회 간격: {monitoring_config.fetch_interval}초")
+        logger.info(f"   시세 수집: {'📡 스트리밍' if monitoring_config.market_data_mode == 'stream' else '🔁 REST 폴링'}")
         logger.info(f"   성능 모니터링: {'✅' if monitoring_config.performance_logging else '❌'}")
 
         # 거래소 설정 표시
@@ -227,8 +254,11 @@ def run():
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
+    args = parse_arguments()
+    install_event_loop(args.loop)
+
     try:
-        asyncio.run(main())
+        asyncio.run(main(args))
     except KeyboardInterrupt:
         print("\n🏁 프로그램이 종료되었습니다.")
     except Exception as e:
@@ -1,8 +1,8 @@
 # arb_trading/config/settings.py
 import json
 import os
-from typing import Dict, Any
-from dataclasses import dataclass
+from typing import Dict, Any, List, Optional
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -17,6 +17,15 @@ class TradingConfig:
     spread_hold_count: int
     top_symbol_limit: int
     min_volume_usdt: int
+    spread_mode: str = "last"  # last: 체결가 차이, executable: 호가(bid/ask) - 수수료 순 기대수익
+    min_net_edge_pct: float = 0.0  # executable 모드에서 이 미만 순 기대수익은 계산 단계에서 제외 (%)
+    stats_window: int = 120  # 심볼별 롤링 스프레드 통계 창 (사이클 수)
+    stats_ewma_halflife: float = 30.0  # EWMA 반감기 (사이클 수)
+    entry_min_zscore: float = 0.0  # 진입 시 스프레드 z-score 절댓값 하한 (0이면 미사용)
+    funding_horizon_hours: float = 0.0  # 예상 보유 기간 (시간, 이 안의 펀딩 캐리를 기대수익에 반영, 0이면 미사용)
+    leverage: int = 1  # 진입 후보 심볼에 미리 설정할 레버리지
+    margin_mode: str = "isolated"  # isolated / crossed
+    live_execution: bool = False  # 실제 주문 실행 (simulation_mode와 별개로 명시적으로 켜야 함)
 
 
 @dataclass
@@ -25,6 +34,9 @@ class ExchangeConfig:
     fetch_only: bool
     api_key: str
     secret: str
+    base_urls: List[str] = field(default_factory=list)  # 동등 API 호스트 (비우면 거래소 기본값)
+    maker_fee_pct: Optional[float] = None  # 계정 등급 수수료 (%, 비우면 거래소 기본값)
+    taker_fee_pct: Optional[float] = None
 
 
 @dataclass
@@ -33,6 +45,8 @@ class OrderConfig:
     market_order_enabled: bool
     stop_loss_enabled: bool
     limit_order_slippage: float
+    leg_timeout_seconds: float = 2.0  # 2-다리 동시 주문의 다리별 응답 마감 (초, 넘기면 진입 취소 후 되돌림)
+    entry_cooldown_seconds: float = 60.0  # 진입 실패 후 같은 심볼 재시도까지 대기 (초)
 
 
 @dataclass
@@ -40,6 +54,43 @@ class MonitoringConfig:
     performance_logging: bool
     fetch_interval: int
     log_buffer_size: int
+    market_data_mode: str = "rest"  # rest: REST 폴링, stream: WebSocket 스트림
+    stream_stale_seconds: float = 10.0
+    http_pool_size: int = 100  # 세션별 최대 연결 수
+    http_pool_per_host: int = 20  # 호스트별 최대 연결 수
+    http_keepalive_timeout: float = 120.0  # 유휴 연결 유지 시간 (초)
+    http_warm_connections: int = 2  # 시작 시 미리 열어둘 연결 수
+    http_keepalive_interval: float = 30.0  # 유휴 연결 ping 간격 (초)
+    fetch_deadline_ratio: float = 0.8  # 시세 조회 마감 = fetch_interval × 비율 (0이면 마감 없음)
+    request_hedging: bool = False  # p95 초과 시 시세 조회 중복 요청
+    hedge_max_ratio: float = 0.1  # 요청 대비 최대 헤지 비율
+    hedge_rate_headroom: float = 0.2  # 헤지 후 남겨둘 레이트 리밋 용량 비율
+    circuit_failure_threshold: int = 5  # 회로 차단 연속 실패 수
+    circuit_recovery_seconds: float = 10.0  # 회로 차단 후 시험 요청까지 대기 (초)
+    retry_max_attempts: int = 3
+    retry_base_delay: float = 0.1  # 재시도 지터 최소 대기 (초)
+    retry_max_delay: float = 2.0  # 재시도 지터 최대 대기 (초)
+    event_driven: bool = False  # 스트리밍 모드에서 심볼별 스프레드 이벤트로 즉시 진입 판단
+    event_window_ms: float = 5.0  # 이벤트 병합 창 (밀리초, 0이면 같은 루프 턴만 병합)
+    universe_refresh_seconds: float = 3600.0  # 상장 목록 백그라운드 갱신 주기 (초)
+    volume_refresh_seconds: float = 300.0  # 거래대금 순위 백그라운드 갱신 주기 (초)
+    funding_refresh_seconds: float = 60.0  # 펀딩비 갱신 주기 (초, funding_horizon_hours > 0 일 때)
+    pipeline_queue_size: int = 1  # 단계 간 큐 크기 (가득 차면 가장 오래된 스냅샷 버림)
+    loop_lag_interval: float = 0.1  # 이벤트 루프 지연 샘플링 간격 (초, 성능 모니터링 시, 0이면 미사용)
+    slow_callback_ms: float = 0.0  # 이보다 오래 루프를 막은 콜백 기록 (밀리초, asyncio 디버그 모드, 0이면 미사용)
+
+
+@dataclass
+class FilterConfig:
+    """시세 정상성 필터 (순위 계산 전 비정상 시세 제외)"""
+    max_price_ratio: float = 10.0  # 거래소 간 가격 비율 상한
+    # [평균 가격 하한, 최대 허용 스프레드 %] (고가 코인일수록 좁게)
+    price_tiers: List[List[float]] = field(
+        default_factory=lambda: [[1000.0, 1.0], [10.0, 2.0], [0.1, 5.0], [0.0, 10.0]]
+    )
+    max_spread_pct: float = 5.0  # 최종 스프레드 상한 (%)
+    max_quote_age_seconds: float = 10.0  # 이보다 오래 전에 수신한 시세는 제외 (초, 0이면 미사용)
+    max_skew_seconds: float = 0.0  # 두 거래소 시세의 이벤트 시각 차이 상한 (초, 0이면 미사용)
 
 
 @dataclass
@@ -60,6 +111,16 @@ class RiskConfig:
 
 
 class ConfigManager:
+    # 섹션 → 설정 클래스 (설정 파일에 없어도 기본값이 있는 키는 update_config 허용)
+    _SECTION_TYPES = {
+        'trading': TradingConfig,
+        'orders': OrderConfig,
+        'monitoring': MonitoringConfig,
+        'filters': FilterConfig,
+        'notifications': NotificationConfig,
+        'risk_management': RiskConfig,
+    }
+
     def __init__(self, config_path: str = None):
         self.config_path = config_path or self._get_default_config_path()
         self._config = self._load_config()
@@ -106,6 +167,11 @@ class ConfigManager:
     def monitoring(self) -> MonitoringConfig:
         return MonitoringConfig(**self._config['monitoring'])
 
+    @property
+    def filters(self) -> FilterConfig:
+        # 이전 설정 파일에는 없는 섹션 → 기본값
+        return FilterConfig(**self._config.get('filters', {}))
+
     @property
     def notifications(self) -> NotificationConfig:
         return NotificationConfig(**self._config['notifications'])
@@ -115,9 +181,12 @@ class ConfigManager:
         return RiskConfig(**self._config['risk_management'])
 
     def update_config(self, section: str, key: str, value: Any):
-        """설정 값 동적 업데이트"""
-        if section in self._config and key in self._config[section]:
-            self._config[section][key] = value
+        """설정 값 동적 업데이트 (설정 파일 또는 설정 클래스에 있는 키만, 오타 키는 무시)"""
+        config_type = self._SECTION_TYPES.get(section)
+        known = key in self._config.get(section, {}) or (
+            config_type is not None and key in {f.name for f in fields(config_type)})
+        if known:
+            self._config.setdefault(section, {})[key] = value
 
     def save_config(self, path: str = None):
         """설정을 파일로 저장"""
@@ -1,17 +1,26 @@
 # arb_trading/core/arbitrage_engine.py (종료 처리 수정)
 import asyncio
+import math
 import time
 import signal
 import sys
-from typing import Dict, List, Optional
-from collections import defaultdict, deque
-from ..exchanges.base import BaseExchange, OrderType, OrderSide, Direction
+from typing import Dict, List, Optional, Sequence
+from ..exchanges.base import BaseExchange, FeeSchedule, OrderType, OrderSide, Direction
+from ..exchanges.streams import MarketDataStream
 from ..config.settings import ConfigManager, TradingConfig, OrderConfig, RiskConfig
-from .spread_monitor import SpreadMonitor, SpreadData
+from .spread_monitor import SpreadMonitor, SpreadData, UniverseDiff
+from .spread_engine import SpreadTable
+from .spread_filters import SpreadFilters
+from .symbol_universe import SymbolUniverse, IdHistory
 from .position_manager import PositionManager, ArbitragePosition, PositionStatus
+from .pipeline import Pipeline, BLOCK
+from .execution_prep import ExecutionPrep
+from .execution_engine import ExecutionEngine
 from ..utils.performance import PerformanceMonitor
+from ..utils.loop_monitor import LoopLagMonitor
 from ..utils.notifications import NotificationManager
 from ..utils.logger import setup_logger
+from ..utils.http_session import session_registry
 import logging
 import traceback
 
@@ -33,19 +42,36 @@ class ArbitrageEngine:
         # 컴포넌트 초기화
         self.exchanges: Dict[str, BaseExchange] = {}
         self.spread_monitor: Optional[SpreadMonitor] = None
+        self.market_stream: Optional[MarketDataStream] = None
         self.position_manager: Optional[PositionManager] = None
+        self.execution_prep: Optional[ExecutionPrep] = None
+        self.execution_engine: Optional[ExecutionEngine] = None
         self.performance_monitor: Optional[PerformanceMonitor] = None
         self.notification_manager: Optional[NotificationManager] = None
+        self.loop_monitor: Optional[LoopLagMonitor] = None
 
         # 상태 관리
         self.is_running = False
         self.shutdown_event = asyncio.Event()
         self._shutdown_requested = False
 
-        # 스프레드 히스토리 (진입 조건 판단용)
-        self.spread_history = defaultdict(lambda: deque(maxlen=self.trading_config.spread_hold_count))
-        self.top1_history = defaultdict(lambda: deque(maxlen=self.trading_config.spread_hold_count))
-        self.exit_condition_history = defaultdict(lambda: deque(maxlen=self.trading_config.spread_hold_count))
+        # 부팅 단계별 소요 시간 (초)
+        self.boot_timings: Dict[str, float] = {}
+        self._boot_started_at: Optional[float] = None
+        self._resubscribe_task: Optional[asyncio.Task] = None
+
+        # 메인 파이프라인 (run()에서 구성)
+        self.pipeline: Optional[Pipeline] = None
+        self._loop_count = 0
+
+        # 심볼 ↔ 정수 ID (스프레드 모니터/엔진/히스토리 공유)
+        self.universe = SymbolUniverse()
+
+        # 스프레드 히스토리 (진입 조건 판단용, 심볼 ID로 인덱싱)
+        hold_count = self.trading_config.spread_hold_count
+        self.spread_history = IdHistory(hold_count)
+        self.top1_history = IdHistory(hold_count, dtype=bool)
+        self.exit_condition_history = IdHistory(hold_count, dtype=bool)
 
         # 로그 버퍼
         self.log_buffer = []
@@ -75,6 +101,10 @@ class ArbitrageEngine:
 
     async def initialize(self):
         """엔진 초기화"""
+        if self._boot_started_at is None:
+            self._boot_started_at = time.perf_counter()
+        self.boot_timings.clear()
+
         try:
             # 성능 모니터 초기화
             try:
@@ -85,6 +115,17 @@ class ArbitrageEngine:
                 self.logger.error(f"❌ 성능 모니터 초기화 실패: {e}")
                 raise
 
+            # 이벤트 루프 지연 측정 (성능 모니터링 활성화 시)
+            monitoring_config = self.config.monitoring
+            if self.performance_monitor.enabled and monitoring_config.loop_lag_interval > 0:
+                self.loop_monitor = LoopLagMonitor(
+                    self.performance_monitor,
+                    interval=monitoring_config.loop_lag_interval,
+                    slow_callback_ms=monitoring_config.slow_callback_ms,
+                    logger=self.logger
+                )
+                self.loop_monitor.start()
+
             # 알림 관리자 초기화
             try:
                 notification_config = self.config.notifications
@@ -102,25 +143,71 @@ class ArbitrageEngine:
                 self.logger.error(f"❌ 알림 관리자 초기화 실패: {e}")
                 raise
 
-            # 거래소 초기화
+            # 거래소 초기화 (동시 연결)
             try:
+                phase_start = time.perf_counter()
                 await self._initialize_exchanges()
+                self.boot_timings["거래소 연결"] = time.perf_counter() - phase_start
             except Exception as e:
                 self.logger.error(f"❌ 거래소 초기화 실패: {e}")
                 raise
 
+            # 실시간 시세 스트림 초기화 (스트리밍 모드)
+            if monitoring_config.market_data_mode == "stream":
+                self.market_stream = MarketDataStream(
+                    self.exchanges,
+                    stale_after=monitoring_config.stream_stale_seconds
+                )
+
             # 스프레드 모니터 초기화
             try:
                 self.spread_monitor = SpreadMonitor(
                     exchanges=self.exchanges,
                     min_volume_usdt=self.trading_config.min_volume_usdt,
                     top_symbol_limit=self.trading_config.top_symbol_limit,
-                    performance_monitor=self.performance_monitor
+                    performance_monitor=self.performance_monitor,
+                    market_stream=self.market_stream,
+                    fetch_deadline=(monitoring_config.fetch_interval * monitoring_config.fetch_deadline_ratio
+                                    if monitoring_config.fetch_deadline_ratio > 0 else None),
+                    universe=self.universe,
+                    event_window=monitoring_config.event_window_ms / 1000,
+                    symbols_ttl=monitoring_config.universe_refresh_seconds,
+                    volume_refresh_interval=monitoring_config.volume_refresh_seconds,
+                    spread_mode=self.trading_config.spread_mode,
+                    min_net_edge_pct=self.trading_config.min_net_edge_pct,
+                    stats_window=self.trading_config.stats_window,
+                    stats_halflife=self.trading_config.stats_ewma_halflife,
+                    funding_horizon_hours=self.trading_config.funding_horizon_hours,
+                    funding_refresh_interval=monitoring_config.funding_refresh_seconds,
+                    filters=SpreadFilters.from_config(self.config.filters)
                 )
             except Exception as e:
                 self.logger.error(f"❌ 스프레드 모니터 초기화 실패: {e}")
                 raise
 
+            # 백그라운드 유니버스 갱신 → 심볼 단위 구독 스트림 갱신
+            if self.market_stream:
+                self.spread_monitor.add_universe_listener(self._on_universe_change)
+
+            # 이벤트 기반 판단: 가격이 바뀐 심볼만 즉시 진입 조건 확인 (폴링 주기 대기 없음)
+            if self.market_stream and monitoring_config.event_driven:
+                self.spread_monitor.subscribe(self._on_spread_event)
+                self.logger.info(f"⚡ 이벤트 기반 진입 판단 활성화 (병합 창 {monitoring_config.event_window_ms}ms)")
+
+            # 웜 스타트: 커넥션 풀 예열 + 심볼 메타데이터/거래대금 유니버스 선행 로드
+            phase_start = time.perf_counter()
+            symbols = await self._warm_start()
+            self.boot_timings["웜 스타트"] = time.perf_counter() - phase_start
+
+            # 스트림 구독 시작 (공통 심볼 기준)
+            if self.market_stream:
+                try:
+                    phase_start = time.perf_counter()
+                    await self.market_stream.start(symbols)
+                    self.boot_timings["스트림 시작"] = time.perf_counter() - phase_start
+                except Exception as e:
+                    self.logger.error(f"❌ 시세 스트림 시작 실패 (REST 폴링으로 동작): {e}")
+
             # 포지션 관리자 초기화
             try:
                 self.position_manager = PositionManager(
@@ -133,6 +220,11 @@ class ArbitrageEngine:
                 self.logger.error(f"❌ 포지션 관리자 초기화 실패: {e}")
                 raise
 
+            # 주문 준비/실행 (trading.live_execution을 켠 경우만)
+            self._initialize_execution()
+
+            self._log_boot_timings()
+
             # self.logger.info("✅ 차익거래 엔진 초기화 완료")
 
         except Exception as e:
@@ -140,6 +232,47 @@ class ArbitrageEngine:
             self.logger.error(f"상세 오류: {traceback.format_exc()}")
             raise
 
+    def _initialize_execution(self):
+        """주문 준비/실행 초기화 (실거래: 진입 후보 심볼의 레버리지/마진을 미리 설정, 두 다리 동시 주문)
+
+        simulation_mode가 꺼져 있어도 trading.live_execution을 명시적으로 켜지 않으면 주문하지 않는다.
+        주문 API가 구현되지 않은 거래소(시뮬레이션 스텁)가 주문 대상이면 시작을 거부한다.
+        """
+        if self.trading_config.simulation_mode:
+            return
+        if not self.trading_config.live_execution:
+            self.logger.warning("⚠️ 실주문 비활성 (trading.live_execution=false): 진입 조건 충족만 기록합니다")
+            return
+
+        tradeable = {
+            name: exchange for name, exchange in self.exchanges.items()
+            if not self.config.exchanges[name].fetch_only
+        }
+        unsupported = [name for name, exchange in tradeable.items() if not exchange.supports_orders]
+        if unsupported:
+            raise Exception(f"주문 API가 구현되지 않은 거래소는 실거래 불가 "
+                            f"(fetch_only로 설정하세요): {', '.join(unsupported)}")
+
+        self.execution_prep = ExecutionPrep(
+            tradeable,
+            leverage=self.trading_config.leverage,
+            margin_mode=self.trading_config.margin_mode,
+            logger=self.logger
+        )
+        self.execution_engine = ExecutionEngine(
+            tradeable,
+            self.position_manager,
+            self.execution_prep,
+            order_type=OrderType(self.order_config.default_type),
+            limit_slippage=self.order_config.limit_order_slippage,
+            leg_timeout=self.order_config.leg_timeout_seconds,
+            entry_cooldown=self.order_config.entry_cooldown_seconds,
+            performance_monitor=self.performance_monitor,
+            notification_manager=self.notification_manager,
+            logger=self.logger
+        )
+        self.logger.warning(f"🔴 실주문 활성화: {', '.join(tradeable)}")
+
     async def _initialize_exchanges(self):
         """거래소 초기화"""
         try:
@@ -152,6 +285,15 @@ class ArbitrageEngine:
         exchange_configs = self.config.exchanges
         # self.logger.info(f"설정된 거래소: {list(exchange_configs.keys())}")
 
+        # 공유 커넥션 풀 설정
+        monitoring_config = self.config.monitoring
+        session_registry.configure(
+            pool_size=monitoring_config.http_pool_size,
+            pool_per_host=monitoring_config.http_pool_per_host,
+            keepalive_timeout=monitoring_config.http_keepalive_timeout
+        )
+
+        created: Dict[str, BaseExchange] = {}
         for exchange_name, config in exchange_configs.items():
 
             if not config.enabled:
@@ -162,40 +304,136 @@ class ArbitrageEngine:
                 if exchange_name == 'binance':
                     exchange = BinanceExchange(
                         api_key=config.api_key,
-                        secret=config.secret
+                        secret=config.secret,
+                        base_urls=config.base_urls or None
                     )
                 elif exchange_name == 'bybit':
                     exchange = BybitExchange(
                         api_key=config.api_key,
-                        secret=config.secret
+                        secret=config.secret,
+                        base_urls=config.base_urls or None
                     )
                 else:
                     self.logger.warning(f"지원하지 않는 거래소: {exchange_name}")
                     continue
 
-                # 연결 테스트
-                await exchange.connect()
+                # 하위 요청 타이밍 / 회로 차단 상태 기록용
+                exchange.performance_monitor = self.performance_monitor
+                exchange.configure_resilience(
+                    failure_threshold=monitoring_config.circuit_failure_threshold,
+                    recovery_timeout=monitoring_config.circuit_recovery_seconds,
+                    max_attempts=monitoring_config.retry_max_attempts,
+                    retry_base_delay=monitoring_config.retry_base_delay,
+                    retry_max_delay=monitoring_config.retry_max_delay
+                )
+
+                # 계정 등급 수수료 (설정이 없으면 거래소 기본값)
+                if config.maker_fee_pct is not None or config.taker_fee_pct is not None:
+                    default_fees = exchange.fee_schedule
+                    exchange.fee_schedule = FeeSchedule(
+                        maker_pct=(config.maker_fee_pct if config.maker_fee_pct is not None
+                                   else default_fees.maker_pct),
+                        taker_pct=(config.taker_fee_pct if config.taker_fee_pct is not None
+                                   else default_fees.taker_pct)
+                    )
 
-                self.exchanges[exchange_name] = exchange
+                created[exchange_name] = exchange
 
             except Exception as e:
                 self.logger.error(f"❌ '{exchange_name}' 거래소 초기화 실패: {e}")
                 self.logger.error(f"상세 오류: {traceback.format_exc()}")
                 # 거래소 초기화 실패는 치명적이므로 중단하지 않고 계속 진행
 
+        # 연결 테스트 (모든 거래소 동시 진행)
+        results = await asyncio.gather(
+            *(self._connect_exchange(name, exchange) for name, exchange in created.items()),
+            return_exceptions=True
+        )
+        for (exchange_name, exchange), result in zip(created.items(), results):
+            if isinstance(result, Exception):
+                self.logger.error(f"❌ '{exchange_name}' 거래소 연결 실패: {result}")
+                continue
+            self.exchanges[exchange_name] = exchange
+
         if len(self.exchanges) < 2:
             error_msg = f"최소 2개의 거래소가 필요합니다 (현재: {len(self.exchanges)}개)"
             self.logger.error(error_msg)
             raise Exception(error_msg)
 
+        # 시세 조회 헤지 (멱등 GET 전용, 주문에는 적용되지 않음)
+        if monitoring_config.request_hedging:
+            for exchange in self.exchanges.values():
+                exchange.configure_hedging(
+                    max_ratio=monitoring_config.hedge_max_ratio,
+                    headroom=monitoring_config.hedge_rate_headroom
+                )
+
         # self.logger.info(f"✅ 총 {len(self.exchanges)}개 거래소 초기화 완료: {list(self.exchanges.keys())}")
 
+    async def _connect_exchange(self, exchange_name: str, exchange: BaseExchange):
+        """거래소 연결 (소요 시간 기록)"""
+        start_time = time.perf_counter()
+        try:
+            await exchange.connect()
+        finally:
+            self.boot_timings[f"  └ {exchange_name} 연결"] = time.perf_counter() - start_time
+
+    async def _warm_start(self) -> List[str]:
+        """부팅 예열 (서로 독립인 작업을 동시에 실행)
+
+        - 거래소별 keep-alive 커넥션 예열 (콜드 TLS 핸드셰이크 제거)
+        - 심볼 메타데이터 + 거래대금 기준 심볼 유니버스 선행 로드
+
+        Returns:
+            공통 심볼 목록 (실패 시 빈 목록)
+        """
+        monitoring_config = self.config.monitoring
+        warm_connections = monitoring_config.http_warm_connections
+
+        async def timed(label: str, coro):
+            start_time = time.perf_counter()
+            try:
+                return await coro
+            finally:
+                self.boot_timings[f"  └ {label}"] = time.perf_counter() - start_time
+
+        tasks = []
+        if warm_connections > 0:
+            tasks.extend(
+                timed(f"{name} 커넥션 예열", exchange.warm_up(warm_connections))
+                for name, exchange in self.exchanges.items()
+            )
+        tasks.append(timed("심볼 유니버스", self.spread_monitor.get_common_symbols()))
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        # keep-alive 연결 유지 (주문 시 콜드 TLS 핸드셰이크 방지)
+        if warm_connections > 0:
+            for exchange in self.exchanges.values():
+                exchange.start_keepalive(monitoring_config.http_keepalive_interval, warm_connections)
+
+        symbols = results[-1]
+        if isinstance(symbols, Exception):
+            self.logger.error(f"❌ 심볼 유니버스 선행 로드 실패: {symbols}")
+            return []
+        return symbols
+
+    def _log_boot_timings(self):
+        """부팅 단계별 소요 시간 출력"""
+        total = time.perf_counter() - self._boot_started_at
+        self.logger.info("=" * 60)
+        self.logger.info(f"🚀 엔진 부팅 완료: {total:.3f}초")
+        for label, duration in self.boot_timings.items():
+            self.logger.info(f"   {label}: {duration:.3f}초")
+        self.logger.info("=" * 60)
+
     async def run(self):
         """엔진 실행"""
         try:
             # self.logger.info("✅ 차익거래 엔진 실행 단계 시작...")
 
             # 초기화
+            self._boot_started_at = time.perf_counter()
             await self.initialize()
             self.is_running = True
             # self.logger.info("✅ initialize() 완료, is_running = True")
@@ -207,6 +445,9 @@ class ArbitrageEngine:
             try:
                 initial_spreads = await self.spread_monitor.fetch_spread_data()
                 self.logger.info(f"✅ 초기 스프레드 데이터 조회 성공: {len(initial_spreads)}개 심볼")
+                self.logger.info(
+                    f"🏁 시작 → 첫 판단까지: {time.perf_counter() - self._boot_started_at:.3f}초"
+                )
 
             except Exception as e:
                 self.logger.error(f"❌ 초기 스프레드 데이터 조회 실패: {e}")
@@ -214,82 +455,10 @@ class ArbitrageEngine:
                 self.logger.error(f"상세 오류: {traceback.format_exc()}")
                 raise
 
-            # 메인 루프 시작
-            self.logger.info("🚀 메인 모니터링 루프 시작...")
-            loop_count = 0
-
-            while self.is_running and not self.shutdown_event.is_set():
-                try:
-                    self.logger.debug(f"루프 {loop_count + 1} 시작...")
-
-                    # 종료 요청 확인
-                    if self._shutdown_requested:
-                        self.logger.info("종료 요청 감지됨")
-                        break
-
-                    loop_start_time = time.time()
-
-                    # 스프레드 데이터 조회
-                    self.logger.debug("스프레드 데이터 조회 중...")
-                    spread_data = await self.spread_monitor.fetch_spread_data()
-
-                    if not spread_data:
-                        self.logger.warning("스프레드 데이터를 조회할 수 없습니다")
-                        await asyncio.sleep(self.config.monitoring.fetch_interval)
-                        continue
-
-                    # 상위 3개 스프레드 표시
-                    await self._display_top_spreads(spread_data[:3])
-
-                    # Top1 기록 업데이트
-                    self._update_top1_history(spread_data)
-
-                    # 포지션 상태 업데이트
-                    await self._update_positions()
-
-                    # 진입 조건 확인
-                    await self._check_entry_conditions(spread_data)
-
-                    # 청산 조건 확인
-                    await self._check_exit_conditions(spread_data)
-
-                    # 로그 버퍼 플러시
-                    loop_count += 1
-                    if loop_count % 3 == 0:
-                        await self._flush_logs()
-
-                    # 성능 정보 표시
-                    if self.performance_monitor and self.performance_monitor.enabled:
-                        if loop_count % 10 == 0:  # 10회마다 표시
-                            perf_summary = self.performance_monitor.get_performance_summary()
-                            self.logger.info(f"📈 성능 정보: {perf_summary}")
-
-                    # 대기 (종료 신호 확인과 함께)
-                    loop_duration = time.time() - loop_start_time
-                    sleep_time = max(0, self.config.monitoring.fetch_interval - loop_duration)
-
-                    self.logger.debug(f"루프 {loop_count} 완료 (소요: {loop_duration:.3f}초, 대기: {sleep_time:.3f}초)")
-
-                    if sleep_time > 0:
-                        try:
-                            await asyncio.wait_for(self.shutdown_event.wait(), timeout=sleep_time)
-                            self.logger.info("종료 신호를 받아 루프 종료")
-                            break  # 종료 신호 받음
-                        except asyncio.TimeoutError:
-                            pass  # 정상적인 타임아웃, 계속 진행
-
-                except KeyboardInterrupt:
-                    self.logger.info("KeyboardInterrupt 감지")
-                    break
-                except Exception as e:
-                    self.logger.error(f"❌ 메인 루프 오류: {e}")
-                    import traceback
-                    self.logger.error(f"상세 오류: {traceback.format_exc()}")
-
-                    if self.performance_monitor:
-                        self.performance_monitor.record_error("main_loop_error")
-
-                    await asyncio.sleep(5)  # 오류 시 5초 대기
+            # 메인 파이프라인 시작 (시세 조회 → 시그널 → 실행 → 기록)
+            self.logger.info("🚀 메인 모니터링 파이프라인 시작...")
+            self.pipeline = self._build_pipeline()
+            await self.pipeline.run(self.shutdown_event)
 
             self.logger.info("메인 루프 종료됨")
 
@@ -304,12 +473,68 @@ class ArbitrageEngine:
             self.logger.info("🛑 엔진 종료 처리 시작...")
             await self.shutdown()
 
+    def _build_pipeline(self) -> Pipeline:
+        """시세 조회 → 시그널 → 실행 → 기록 파이프라인 구성
+
+        시세 조회는 fetch_interval 간격을 그대로 유지하고, 뒤 단계가 밀리면 시그널/실행 큐에서
+        가장 오래된 스냅샷을 버린다 (느린 주문 조회가 다음 시세를 늦추지 않음).
+        기록 단계는 가벼우므로 역압(block)으로 빠짐없이 처리한다.
+        """
+        queue_size = self.config.monitoring.pipeline_queue_size
+        pipeline = Pipeline("arbitrage", self.performance_monitor, self.logger, error_delay=5)
+
+        signal_queue = pipeline.queue("signal_queue", queue_size)
+        execution_queue = pipeline.queue("execution_queue", queue_size)
+        bookkeeping_queue = pipeline.queue("bookkeeping_queue", queue_size, BLOCK)
+
+        pipeline.add_source("market_data", self._market_data_stage,
+                            self.config.monitoring.fetch_interval, signal_queue)
+        pipeline.add_stage("signal", self._signal_stage, signal_queue, execution_queue)
+        pipeline.add_stage("execution", self._execution_stage, execution_queue, bookkeeping_queue)
+        pipeline.add_stage("bookkeeping", self._bookkeeping_stage, bookkeeping_queue)
+        return pipeline
+
+    async def _market_data_stage(self) -> Optional[Sequence[SpreadData]]:
+        """시세 조회 단계 (스냅샷은 이후 갱신과 분리된 사본)"""
+        spread_data = await self.spread_monitor.fetch_spread_data()
+        if not spread_data:
+            self.logger.warning("스프레드 데이터를 조회할 수 없습니다")
+            return None
+        return spread_data
+
+    async def _signal_stage(self, spread_data: Sequence[SpreadData]) -> Sequence[SpreadData]:
+        """시그널 단계: 표시, Top1 기록, 진입/청산 조건 확인"""
+        await self._display_top_spreads(spread_data[:3])
+        self._update_top1_history(spread_data)
+        await self._check_entry_conditions(spread_data)
+        await self._check_exit_conditions(spread_data)
+        return spread_data
+
+    async def _execution_stage(self, spread_data: Sequence[SpreadData]) -> Sequence[SpreadData]:
+        """실행 단계: 거래소 주문 상태 조회/포지션 갱신"""
+        await self._update_positions()
+        return spread_data
+
+    async def _bookkeeping_stage(self, spread_data: Sequence[SpreadData]):
+        """기록 단계: 로그 버퍼 플러시, 성능 정보 표시"""
+        self._loop_count += 1
+        if self._loop_count % 3 == 0:
+            await self._flush_logs()
+
+        if self.performance_monitor and self.performance_monitor.enabled:
+            if self._loop_count % 10 == 0:  # 10회마다 표시
+                perf_summary = self.performance_monitor.get_performance_summary()
+                self.logger.info(f"📈 성능 정보: {perf_summary}")
+
+        self.logger.debug(f"사이클 {self._loop_count} 완료 ({len(spread_data)}개 심볼)")
+
     async def _display_top_spreads(self, top_spreads: List[SpreadData]):
         """상위 스프레드 표시"""
         try:
             if top_spreads:
                 spreads_text = " | ".join([
-                    f"{item.symbol} ({item.spread_pct:+.2f}%)"
+                    f"{item.symbol} ({item.spread_pct:+.2f}% {item.buy_exchange}→{item.sell_exchange}"
+                    f"{self._zscore_text(item)})"
                     for item in top_spreads
                 ])
                 self.logger.info(f"🔝 Top 3 스프레드: {spreads_text}")
@@ -318,19 +543,41 @@ class ArbitrageEngine:
         except Exception as e:
             self.logger.error(f"❌ 스프레드 표시 중 오류: {e}")
 
-    def _update_top1_history(self, spread_data: List[SpreadData]):
+    def _zscore_text(self, spread_data: SpreadData) -> str:
+        if not self.spread_monitor or spread_data.symbol_id < 0:
+            return ""
+        zscore = self.spread_monitor.spread_stats.zscore_of(spread_data.symbol_id)
+        return f" z={zscore:+.1f}" if math.isfinite(zscore) else ""
+
+    def _update_top1_history(self, spread_data: Sequence[SpreadData]):
         """Top1 히스토리 업데이트"""
         try:
             if spread_data:
-                top1_symbol = spread_data[0].symbol
-                self.top1_history[top1_symbol].append(True)
+                self.top1_history.append(self._symbol_id(spread_data[0]), True)
 
                 # 나머지 심볼들은 False
                 for item in spread_data[1:4]:  # 상위 4개 정도만 체크
-                    self.top1_history[item.symbol].append(False)
+                    self.top1_history.append(self._symbol_id(item), False)
         except Exception as e:
             self.logger.error(f"❌ Top1 히스토리 업데이트 중 오류: {e}")
 
+    def _on_universe_change(self, diff: UniverseDiff):
+        """유니버스 교체 시 스트림 구독 심볼 갱신"""
+        if self.market_stream and self.is_running:
+            self._resubscribe_task = asyncio.create_task(self._resubscribe_stream(diff.symbols))
+
+    async def _resubscribe_stream(self, symbols: List[str]):
+        try:
+            await self.market_stream.update_symbols(symbols)
+        except Exception as e:
+            self.logger.error(f"❌ 스트림 구독 갱신 실패: {e}")
+
+    def _symbol_id(self, spread_data: SpreadData) -> int:
+        """스프레드 항목의 심볼 ID (엔진 외부에서 만든 항목은 등록)"""
+        if spread_data.symbol_id >= 0:
+            return spread_data.symbol_id
+        return self.universe.register(spread_data.symbol)
+
     async def _update_positions(self):
         """포지션 상태 업데이트"""
         try:
@@ -347,70 +594,157 @@ class ArbitrageEngine:
         except Exception as e:
             self.logger.error(f"❌ 포지션 업데이트 중 오류: {e}")
 
-    async def _check_entry_conditions(self, spread_data: List[SpreadData]):
+    async def _check_entry_conditions(self, spread_data: Sequence[SpreadData]):
         """진입 조건 확인"""
         try:
             if not self.position_manager or not self.position_manager.can_open_position():
                 return
 
-            # 스프레드 임계값 이상인 항목들만 필터링
-            filtered_spreads = [
-                item for item in spread_data
-                if item.abs_spread_pct >= self.trading_config.spread_threshold
-            ]
+            # 스프레드 임계값 이상인 항목들만 필터링 (내림차순 정렬 상태 이용)
+            threshold = self.trading_config.spread_threshold
+            if isinstance(spread_data, SpreadTable):
+                filtered_spreads = spread_data.above(threshold)
+            else:
+                filtered_spreads = [item for item in spread_data if item.abs_spread_pct >= threshold]
 
             if filtered_spreads:
                 self.logger.debug(f"임계값 이상 스프레드: {len(filtered_spreads)}개")
 
-            for spread_item in filtered_spreads:
-                symbol = spread_item.symbol
+            self._evaluate_entries(filtered_spreads, record_history=True)
+        except Exception as e:
+            self.logger.error(f"❌ 진입 조건 확인 중 오류: {e}")
+
+    async def _on_spread_event(self, changed: List[SpreadData]):
+        """심볼별 스프레드 이벤트 → 바뀐 심볼만 진입 조건 확인
 
-                # 이미 포지션이 있는 경우 건너뛰기
-                if symbol in self.position_manager.positions:
-                    continue
+        지속 조건(히스토리)은 폴링 사이클에서 쌓고, 여기서는 현재 스프레드가
+        임계값 이상인 심볼을 즉시 판단한다.
+        """
+        try:
+            if not self.is_running or not self.position_manager or not self.position_manager.can_open_position():
+                return
+
+            threshold = self.trading_config.spread_threshold
+            self._evaluate_entries([item for item in changed if item.abs_spread_pct >= threshold],
+                                   record_history=False)
+        except Exception as e:
+            self.logger.error(f"❌ 스프레드 이벤트 처리 중 오류: {e}")
 
-                # 스프레드 히스토리 업데이트
-                self.spread_history[symbol].append(spread_item.spread_pct)
+    def _evaluate_entries(self, candidates: Sequence[SpreadData], record_history: bool):
+        """임계값 이상 후보의 진입 조건 확인"""
+        for spread_item in candidates:
+            symbol = spread_item.symbol
 
-                # 진입 조건 확인
-                if self._should_enter_position(symbol, spread_item):
+            # 이미 포지션이 있는 경우 건너뛰기
+            if symbol in self.position_manager.positions:
+                continue
+
+            # 스프레드 히스토리 업데이트
+            if record_history:
+                self.spread_history.append(self._symbol_id(spread_item), spread_item.spread_pct)
+
+                # 지속 조건을 쌓는 동안 양쪽 거래소 레버리지/마진 미리 설정
+                if self.execution_prep:
+                    self.execution_prep.schedule(symbol, (spread_item.sell_exchange, spread_item.buy_exchange))
+
+            # 진입 조건 확인
+            if self._should_enter_position(symbol, spread_item):
+                if not self.execution_engine:
                     self.logger.info(f"🟢 조건 충족: {symbol} → 시뮬레이션 진입")
-        except Exception as e:
-            self.logger.error(f"❌ 진입 조건 확인 중 오류: {e}")
+                elif self.execution_engine.submit(spread_item, self.trading_config.target_usdt):
+                    self.logger.info(f"🟢 조건 충족: {symbol} → 동시 주문 진입")
 
     def _should_enter_position(self, symbol: str, spread_data: SpreadData) -> bool:
         """포지션 진입 조건 확인"""
         try:
+            symbol_id = self._symbol_id(spread_data)
+
             # 스프레드 지속 조건
-            spread_hist = self.spread_history[symbol]
-            if len(spread_hist) < self.trading_config.spread_hold_count:
+            if not self.spread_history.is_full(symbol_id):
                 return False
 
             # 모든 히스토리가 임계값 이상인지 확인
-            if not all(abs(s) >= self.trading_config.spread_threshold for s in spread_hist):
+            spread_hist = self.spread_history.values(symbol_id)
+            if not (abs(spread_hist) >= self.trading_config.spread_threshold).all():
                 return False
 
             # Top1 지속 조건
-            top1_hist = self.top1_history[symbol]
-            if len(top1_hist) < self.trading_config.spread_hold_count:
+            if not self.top1_history.is_full(symbol_id):
                 return False
 
-            if not all(top1_hist):
+            if not self.top1_history.values(symbol_id).all():
                 return False
 
+            # 평소 스프레드 분포 대비 이탈 조건 (구조적 베이시스/노이즈 제외)
+            min_zscore = self.trading_config.entry_min_zscore
+            if min_zscore > 0 and self.spread_monitor:
+                zscore = self.spread_monitor.spread_stats.zscore_of(symbol_id)
+                if not abs(zscore) >= min_zscore:  # 샘플 부족(NaN) 포함
+                    return False
+
             return True
         except Exception as e:
             self.logger.error(f"❌ 진입 조건 확인 중 오류 ({symbol}): {e}")
             return False
 
-    async def _check_exit_conditions(self, spread_data: List[SpreadData]):
-        """청산 조건 확인 (시뮬레이션용)"""
+    async def _check_exit_conditions(self, spread_data: Sequence[SpreadData]):
+        """청산 조건 확인 → 충족한 OPEN 포지션을 PositionManager로 동시 청산"""
         try:
-            # 시뮬레이션에서는 실제 포지션이 없으므로 간단히 처리
-            pass
+            if not self.position_manager:
+                return
+
+            open_positions = {
+                symbol: position for symbol, position in self.position_manager.positions.items()
+                if position.status == PositionStatus.OPEN
+            }
+            if not open_positions:
+                return
+
+            current = {item.symbol: item for item in spread_data if item.symbol in open_positions}
+            exits = {}
+            for symbol, position in open_positions.items():
+                reason = self._exit_reason(position, current.get(symbol))
+                if reason:
+                    self.logger.info(f"🔴 청산 조건 충족: {symbol} ({reason})")
+                    exits[symbol] = reason
+
+            results = await asyncio.gather(*(self.position_manager.close_position(symbol, reason)
+                                             for symbol, reason in exits.items()))
+            for symbol, closed in zip(exits, results):
+                if closed:
+                    self.position_manager.remove_position(symbol)  # 같은 심볼 재진입 허용
         except Exception as e:
             self.logger.error(f"❌ 청산 조건 확인 중 오류: {e}")
 
+    def _exit_reason(self, position: ArbitragePosition, spread_item: Optional[SpreadData]) -> Optional[str]:
+        """청산 사유 (없으면 None)
+
+        현재 스프레드는 포지션 방향(숏 거래소 - 롱 거래소) 기준 부호 있는 값:
+        - 스프레드 축소 익절: |현재| < 진입 - exit_percent
+        - 방향 반전 손절: 현재 < 0 이고 진입 - 현재 > exit_percent
+        - 보유 시간 초과: position_timeout 경과
+        현재 최적 쌍이 포지션 거래소 쌍이 아니면 (3개 이상 거래소) 스프레드 조건은 판단하지 않는다.
+        """
+        if time.time() - position.entry_timestamp > self.position_manager.position_timeout:
+            return "보유 시간 초과"
+        if spread_item is None:
+            return None
+
+        pair = (spread_item.sell_exchange, spread_item.buy_exchange)
+        if pair == (position.short_exchange.name, position.long_exchange.name):
+            current_spread = spread_item.abs_spread_pct
+        elif pair == (position.long_exchange.name, position.short_exchange.name):
+            current_spread = -spread_item.abs_spread_pct
+        else:
+            return None
+
+        exit_percent = self.trading_config.exit_percent
+        if current_spread < 0 and position.entry_spread - current_spread > exit_percent:
+            return "방향 반전 손절"
+        if abs(current_spread) < position.entry_spread - exit_percent:
+            return "스프레드 축소"
+        return None
+
     async def _flush_logs(self):
         """로그 버퍼 플러시"""
         try:
@@ -428,7 +762,9 @@ class ArbitrageEngine:
             self.logger.info("차익거래 시스템 종료 시작...")
             self.is_running = False
 
-            # 모든 포지션 청산 (시뮬레이션에서는 생략)
+            # 진행 중인 진입 마무리 후 모든 포지션 청산 (시뮬레이션에서는 생략)
+            if self.execution_engine:
+                await self.execution_engine.close()
             if self.position_manager and not self.trading_config.simulation_mode:
                 await self.position_manager.close_all_positions("시스템 종료")
 
@@ -439,6 +775,16 @@ class ArbitrageEngine:
     async def cleanup(self):
         """리소스 정리"""
         try:
+            # 시세 스트림 중지
+            if self.market_stream:
+                await self.market_stream.stop()
+            if self.spread_monitor:
+                self.spread_monitor.close()
+            if self.execution_engine:
+                await self.execution_engine.close()
+            if self.execution_prep:
+                await self.execution_prep.close()
+
             # 거래소 연결 해제
             cleanup_tasks = []
             for exchange in self.exchanges.values():
@@ -447,7 +793,12 @@ class ArbitrageEngine:
             if cleanup_tasks:
                 await asyncio.gather(*cleanup_tasks, return_exceptions=True)
 
+            if self.notification_manager:
+                await self.notification_manager.close()
+
             # 성능 모니터 정리
+            if self.loop_monitor:
+                await self.loop_monitor.stop()
             if self.performance_monitor:
                 self.performance_monitor.stop_monitoring()
 
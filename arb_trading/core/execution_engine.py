@@ -0,0 +1,335 @@
+# arb_trading/core/execution_engine.py
+"""2-다리 동시 주문 실행
+
+기존 trading/ 스크립트는 매수 주문 → 매도 주문을 차례로 보낸 뒤 0.5초 쉬고 체결을 확인했다.
+두 주문 사이 간격(다리 간 시차)이 슬리피지의 가장 큰 원인이므로, 여기서는 주문 인자를
+모두 미리 만든 뒤 두 다리를 같은 루프 턴에 동시에 보낸다.
+
+- 다리별 마감(leg_timeout) 안에 두 다리 모두 응답해야 진입 성공 → PositionManager에 PENDING 등록
+  (체결 확인은 기존 update_position_status)
+- 한쪽이 실패/마감 초과면 응답한 다리를 되돌린다 (지정가는 취소 후 체결분, 시장가는 주문 수량을
+  반대 방향 시장가로 청산). 마감 뒤 늦게 응답한 다리도 응답 즉시 같은 방식으로 되돌린다.
+- 되돌리기 주문은 포지션 축소 전용(reduceOnly)으로 보내고, 다리마다 한 번만 되돌린다.
+- 주문 요청은 재전송하지 않고 클라이언트 주문 ID를 붙여 보낸다. 오류가 나면 그 ID로 접수 여부를
+  조회해 접수된 다리는 실패로 치되 되돌리기 대상에 넣는다 (중복/미확인 주문 방지).
+- 다리별 전송 시각/응답 지연, 전송 시차/응답 시차를 PerformanceMonitor로 기록
+"""
+
+import asyncio
+import logging
+import math
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Dict, Optional, Set
+
+from ..exchanges.base import BaseExchange, Order, OrderSide, OrderType
+from .execution_prep import ExecutionPrep
+from .position_manager import ArbitragePosition, PositionManager, PositionStatus
+from .spread_monitor import SpreadData
+
+
+@dataclass
+class LegResult:
+    """한 다리 주문 결과 (시각은 perf_counter 초)"""
+    exchange: str
+    side: OrderSide
+    amount: float
+    order: Optional[Order] = None
+    error: Optional[str] = None
+    sent_at: float = 0.0
+    acked_at: float = 0.0
+    client_order_id: str = ""
+    rolled_back: bool = False  # 되돌리기 시작 여부 (마감 경로/늦은 응답 경로 중복 방지)
+
+    @property
+    def accepted(self) -> bool:
+        """거래소가 주문을 접수했는지 (오류 후 조회로 확인된 경우 포함 → 되돌리기 대상)"""
+        return self.order is not None
+
+    @property
+    def ok(self) -> bool:
+        return self.accepted and self.error is None
+
+    @property
+    def ack_latency(self) -> float:
+        return self.acked_at - self.sent_at if self.acked_at else math.nan
+
+
+@dataclass
+class EntryResult:
+    """진입 시도 결과"""
+    symbol: str
+    long: LegResult
+    short: LegResult
+    position: Optional[ArbitragePosition] = None
+    rolled_back: bool = False
+
+    @property
+    def success(self) -> bool:
+        return self.position is not None
+
+    @property
+    def send_skew(self) -> float:
+        """두 다리 전송 시차 (초)"""
+        return abs(self.long.sent_at - self.short.sent_at)
+
+    @property
+    def ack_skew(self) -> float:
+        """두 다리 응답 시차 (초, 한쪽이라도 응답이 없으면 NaN)"""
+        if not (self.long.acked_at and self.short.acked_at):
+            return math.nan
+        return abs(self.long.acked_at - self.short.acked_at)
+
+
+class ExecutionEngine:
+    """두 거래소 반대 방향 주문 동시 실행 + 실패 다리 되돌리기"""
+
+    def __init__(self, exchanges: Dict[str, BaseExchange], position_manager: PositionManager,
+                 execution_prep: ExecutionPrep, order_type: OrderType = OrderType.MARKET,
+                 limit_slippage: float = 0.001, leg_timeout: float = 2.0,
+                 entry_cooldown: float = 60.0, performance_monitor=None,
+                 notification_manager=None, logger: Optional[logging.Logger] = None):
+        """
+        Args:
+            exchanges: 주문 가능한 거래소
+            order_type: 진입 주문 타입 (시장가/지정가)
+            limit_slippage: 지정가 주문 가격 여유 (비율, 매수는 위로/매도는 아래로)
+            leg_timeout: 다리별 주문 응답 마감 (초)
+            entry_cooldown: 진입 실패 후 같은 심볼 재시도까지 대기 (초)
+        """
+        self.exchanges = exchanges
+        self.position_manager = position_manager
+        self.execution_prep = execution_prep
+        self.order_type = order_type
+        self.limit_slippage = limit_slippage
+        self.leg_timeout = leg_timeout
+        self.entry_cooldown = entry_cooldown
+        self.performance_monitor = performance_monitor
+        self.notification_manager = notification_manager
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._in_flight: Set[str] = set()
+        self._failed_at: Dict[str, float] = {}
+        self._tasks: Set[asyncio.Task] = set()  # 진입/늦은 다리 되돌리기
+
+    def _spawn(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def can_submit(self, symbol: str) -> bool:
+        """진행 중/보유 중/재시도 대기 중이 아니고 포지션 한도 여유가 있는지"""
+        if symbol in self._in_flight or symbol in self.position_manager.positions:
+            return False
+        if time.monotonic() - self._failed_at.get(symbol, -math.inf) < self.entry_cooldown:
+            return False
+        open_count = sum(1 for position in self.position_manager.positions.values()
+                         if position.status in (PositionStatus.PENDING, PositionStatus.OPEN))
+        return open_count + len(self._in_flight) < self.position_manager.max_positions
+
+    def submit(self, spread_data: SpreadData, target_usdt: float) -> bool:
+        """백그라운드 진입 시작 (호출한 시그널 단계는 기다리지 않음)"""
+        if not self.can_submit(spread_data.symbol):
+            return False
+        self._in_flight.add(spread_data.symbol)
+        self._spawn(self._enter_and_release(spread_data, target_usdt))
+        return True
+
+    async def _enter_and_release(self, spread_data: SpreadData, target_usdt: float):
+        try:
+            result = await self.enter(spread_data, target_usdt)
+            if not result.success:
+                self._failed_at[spread_data.symbol] = time.monotonic()
+        except Exception as e:
+            self._failed_at[spread_data.symbol] = time.monotonic()
+            self.logger.error(f"❌ 진입 실행 중 오류 ({spread_data.symbol}): {e}")
+        finally:
+            self._in_flight.discard(spread_data.symbol)
+
+    async def enter(self, spread_data: SpreadData, target_usdt: float) -> EntryResult:
+        """싼 거래소 매수(롱) + 비싼 거래소 매도(숏) 동시 주문"""
+        symbol = spread_data.symbol
+        long_name, short_name = spread_data.buy_exchange, spread_data.sell_exchange
+        long_price, short_price = spread_data.buy_price, spread_data.sell_price
+
+        # 임계 경로 밖: 레버리지/마진 확인 (보통 미리 설정되어 요청 없음), 수량/주문 인자 준비
+        if not await self.execution_prep.arm(symbol, (long_name, short_name)):
+            raise Exception(f"레버리지/마진 설정 안 됨: {symbol} ({long_name}/{short_name})")
+
+        quantity = self.execution_prep.pair_quantity(symbol, long_name, short_name,
+                                                     (long_price + short_price) / 2, target_usdt)
+        if quantity <= 0:
+            raise Exception(f"주문 수량 계산 실패: {symbol}")
+
+        long_kwargs = self.execution_prep.template(long_name, symbol).order(
+            OrderSide.BUY, self.order_type, quantity, long_price * (1 + self.limit_slippage))
+        short_kwargs = self.execution_prep.template(short_name, symbol).order(
+            OrderSide.SELL, self.order_type, quantity, short_price * (1 - self.limit_slippage))
+        long_leg = LegResult(long_name, OrderSide.BUY, quantity)
+        short_leg = LegResult(short_name, OrderSide.SELL, quantity)
+
+        # 두 다리 동시 전송 (같은 루프 턴에 시작)
+        legs = {
+            asyncio.create_task(self._send(long_leg, long_kwargs)): long_leg,
+            asyncio.create_task(self._send(short_leg, short_kwargs)): short_leg,
+        }
+        done, late = await asyncio.wait(legs, timeout=self.leg_timeout)
+        result = EntryResult(symbol, long_leg, short_leg)
+
+        if not late and long_leg.ok and short_leg.ok:
+            result.position = self._register_position(spread_data, quantity, long_leg, short_leg)
+        if not result.success:
+            result.rolled_back = True
+            for task in late:
+                leg = legs[task]
+                leg.error = leg.error or f"응답 마감 초과 ({self.leg_timeout:.1f}초)"
+                self._spawn(self._rollback_when_acked(symbol, task, leg))
+            # 마감 안에 응답한 다리 (늦은 다리는 아직 order가 없음 → 위에서 따로 처리)
+            await asyncio.gather(*(self._rollback(symbol, leg) for leg in (long_leg, short_leg) if leg.accepted))
+            await self._report_failure(result)
+
+        self._record(result)
+        self.logger.info(
+            f"{'🟢 진입' if result.success else '🔴 진입 실패'}: {symbol} {quantity} "
+            f"(롱 {long_name} / 숏 {short_name}, 전송 시차 {result.send_skew * 1000:.2f}ms, "
+            f"응답 {long_leg.ack_latency * 1000:.1f}ms / {short_leg.ack_latency * 1000:.1f}ms)"
+        )
+        return result
+
+    def _with_client_id(self, exchange_name: str, kwargs: Dict) -> Dict:
+        """주문 인자에 새 클라이언트 주문 ID 추가 (거래소별 파라미터 이름)"""
+        param = self.exchanges[exchange_name].client_order_id_param
+        if not param:
+            return kwargs
+        params = dict(kwargs['params'] or {})
+        params[param] = f"arb-{uuid.uuid4().hex[:24]}"
+        return {**kwargs, 'params': params}
+
+    def _reduce_order(self, exchange_name: str, symbol: str, side: OrderSide, amount: float) -> Dict:
+        """포지션 축소 전용 시장가 주문 인자 (반대 포지션을 새로 열지 않도록 reduceOnly)"""
+        kwargs = self.execution_prep.template(exchange_name, symbol).order(side, OrderType.MARKET, amount)
+        kwargs['params'] = {**(kwargs['params'] or {}), **self.exchanges[exchange_name].reduce_only_params}
+        return self._with_client_id(exchange_name, kwargs)
+
+    async def _send(self, leg: LegResult, kwargs: Dict):
+        exchange = self.exchanges[leg.exchange]
+        kwargs = self._with_client_id(leg.exchange, kwargs)
+        if exchange.client_order_id_param:
+            leg.client_order_id = kwargs['params'][exchange.client_order_id_param]
+        leg.sent_at = time.perf_counter()
+        try:
+            leg.order = await exchange.create_order(**kwargs)
+            leg.acked_at = time.perf_counter()
+        except Exception as e:
+            leg.acked_at = time.perf_counter()
+            leg.error = str(e)
+            # 레버리지/마진 불일치로 거부되면 확인된 상태 폐기 (다음 진입 전에 다시 설정)
+            if "leverage" in leg.error.lower() or "margin" in leg.error.lower():
+                self.execution_prep.invalidate(leg.exchange, kwargs['symbol'])
+            # 응답을 못 받았어도 접수됐을 수 있음 (타임아웃/연결 끊김/5xx)
+            leg.order = await self._confirm(leg, kwargs['symbol'])
+
+    async def _confirm(self, leg: LegResult, symbol: str) -> Optional[Order]:
+        """실패한 다리의 접수 여부를 클라이언트 주문 ID로 확인 (접수됐으면 주문, 아니면 None)"""
+        if not leg.client_order_id:
+            return None
+        try:
+            order = await self.exchanges[leg.exchange].fetch_order_by_client_id(leg.client_order_id, symbol)
+        except Exception as e:
+            self.logger.error(f"❌ {leg.exchange.upper()} {symbol} 주문 접수 여부 확인 실패 "
+                              f"({leg.client_order_id}): {e}")
+            if self.notification_manager:
+                await self.notification_manager.send_slack_notification(
+                    f"⚠️ 주문 접수 여부 확인 실패: {symbol} ({leg.exchange}, {leg.client_order_id})\n"
+                    f"수동 확인 필요: {e}",
+                    level="ERROR"
+                )
+            return None
+        if order is not None:
+            self.logger.warning(f"⚠️ 오류 응답이었지만 접수된 주문: {symbol} {leg.exchange} "
+                                f"({leg.client_order_id}) → 되돌리기 대상")
+        return order
+
+    async def _rollback_when_acked(self, symbol: str, task: asyncio.Task, leg: LegResult):
+        """마감 뒤 늦게 응답한 다리 되돌리기"""
+        await task
+        if leg.accepted:
+            self.logger.warning(f"⚠️ 마감 뒤 응답한 다리 되돌리기: {symbol} {leg.exchange}")
+            await self._rollback(symbol, leg)
+
+    async def _rollback(self, symbol: str, leg: LegResult):
+        """응답한 다리 되돌리기 (지정가는 취소 후 체결분, 시장가는 주문 수량 반대 주문)"""
+        if leg.rolled_back:
+            return
+        leg.rolled_back = True
+        exchange = self.exchanges[leg.exchange]
+        order = leg.order
+        try:
+            if order.type == OrderType.LIMIT:
+                await exchange.cancel_order(order.id, symbol)
+                filled = (await exchange.fetch_order(order.id, symbol)).filled
+            else:
+                filled = order.filled or order.amount
+
+            if filled > 0:
+                await exchange.create_order(**self._reduce_order(
+                    leg.exchange, symbol, OrderSide.SELL if leg.side == OrderSide.BUY else OrderSide.BUY, filled))
+            self.logger.info(f"↩️ {leg.exchange.upper()} {symbol} 다리 되돌림 ({filled}개)")
+        except Exception as e:
+            self.logger.error(f"❌ {leg.exchange.upper()} {symbol} 다리 되돌리기 실패: {e}")
+            if self.notification_manager:
+                await self.notification_manager.send_slack_notification(
+                    f"⚠️ 한쪽 다리 되돌리기 실패: {symbol} ({leg.exchange})\n"
+                    f"수동 확인 필요: {e}",
+                    level="ERROR"
+                )
+
+    def _register_position(self, spread_data: SpreadData, quantity: float,
+                           long_leg: LegResult, short_leg: LegResult) -> Optional[ArbitragePosition]:
+        position = ArbitragePosition(
+            symbol=spread_data.symbol,
+            long_exchange=self.exchanges[long_leg.exchange],
+            short_exchange=self.exchanges[short_leg.exchange],
+            long_symbol=spread_data.symbol,
+            short_symbol=spread_data.symbol,
+            quantity=quantity,
+            entry_spread=spread_data.abs_spread_pct,
+            entry_spread_signed=spread_data.spread_pct,
+            entry_timestamp=time.time(),
+            long_order_id=long_leg.order.id,
+            short_order_id=short_leg.order.id,
+            long_filled=long_leg.order.filled,
+            short_filled=short_leg.order.filled,
+            long_entry_price=long_leg.order.average,
+            short_entry_price=short_leg.order.average,
+        )
+        if not self.position_manager.add_position(position):
+            return None
+        return position
+
+    async def _report_failure(self, result: EntryResult):
+        errors = ", ".join(f"{leg.exchange}: {leg.error}" for leg in (result.long, result.short) if leg.error) \
+            or "포지션 등록 실패"
+        self.logger.warning(f"⚠️ 진입 취소 후 응답한 다리 되돌림: {result.symbol} ({errors})")
+        if self.performance_monitor:
+            self.performance_monitor.record_error("leg_rollback")
+        if self.notification_manager:
+            await self.notification_manager.send_slack_notification(
+                f"⚠️ 진입 취소 (다리 되돌림): {result.symbol}\n{errors}",
+                level="WARNING"
+            )
+
+    def _record(self, result: EntryResult):
+        if not self.performance_monitor:
+            return
+        self.performance_monitor.record_leg_execution(
+            result.send_skew, result.ack_skew,
+            {leg.exchange: leg.ack_latency for leg in (result.long, result.short) if leg.acked_at}
+        )
+
+    async def close(self):
+        """진행 중인 진입/되돌리기 대기 (종료 시 한쪽 다리만 남지 않도록 취소하지 않음)"""
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
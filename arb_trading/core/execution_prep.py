@@ -0,0 +1,199 @@
+# arb_trading/core/execution_prep.py
+"""진입 전 주문 준비 (레버리지/마진 사전 설정 + 주문 템플릿)
+
+기존 trading/ 스크립트는 진입할 때마다 양쪽 거래소에 레버리지 조회/설정과 마진 모드
+설정을 호출했다. 여기서는 진입 후보가 된 심볼을 미리 설정해 두고 확인된 상태를 캐시하므로
+진입 시점 임계 경로에는 두 주문 요청만 남는다.
+
+- arm/schedule: 심볼 × 거래소 단위로 마진 모드 → 레버리지를 한 번만 설정 (동시 요청 병합,
+  실패 시 retry_after 초 동안 재시도 보류)
+- template: 수량/가격 단위, 최소 수량, 거래소 고정 파라미터를 미리 계산한 주문 템플릿
+"""
+
+import asyncio
+import logging
+import math
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from ..exchanges.base import BaseExchange, OrderSide, OrderType
+
+
+def _decimals(step: float) -> int:
+    """단위 → 소수점 자릿수 (0.001 → 3, 0이면 8)"""
+    if step <= 0:
+        return 8
+    return max(0, -Decimal(repr(step)).normalize().as_tuple().exponent)
+
+
+@dataclass(frozen=True)
+class OrderTemplate:
+    """거래소 × 심볼 주문 템플릿 (진입 시 수량 계산/파라미터 조립만 남김)"""
+    exchange: str
+    symbol: str
+    min_qty: float = 0.0
+    qty_step: float = 0.0
+    tick_size: float = 0.0
+    params: Dict[str, Any] = field(default_factory=dict)
+    qty_decimals: int = field(init=False)
+    price_decimals: int = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'qty_decimals', _decimals(self.qty_step))
+        object.__setattr__(self, 'price_decimals', _decimals(self.tick_size))
+
+    def quantity(self, amount: float) -> float:
+        """수량 단위로 내림 (최소 수량 미만이면 최소 수량 - calculate_quantity와 같은 규칙)"""
+        amount = max(amount, self.min_qty)
+        if self.qty_step > 0:
+            amount = math.floor(amount / self.qty_step + 1e-9) * self.qty_step
+        return float(f"{amount:.{self.qty_decimals}f}")  # 부동소수 오차 제거 (str() 시 단위 자릿수)
+
+    def price(self, price: float) -> float:
+        """호가 단위로 반올림"""
+        if self.tick_size > 0:
+            price = round(price / self.tick_size) * self.tick_size
+        return float(f"{price:.{self.price_decimals}f}")
+
+    def order(self, side: OrderSide, order_type: OrderType, amount: float,
+              price: Optional[float] = None) -> Dict[str, Any]:
+        """BaseExchange.create_order 인자"""
+        return {
+            'symbol': self.symbol,
+            'side': side,
+            'order_type': order_type,
+            'amount': amount,
+            'price': self.price(price) if price is not None and order_type == OrderType.LIMIT else None,
+            'params': dict(self.params) if self.params else None,
+        }
+
+
+class ExecutionPrep:
+    """심볼별 레버리지/마진 사전 설정과 주문 템플릿 캐시"""
+
+    def __init__(self, exchanges: Dict[str, BaseExchange], leverage: int = 1,
+                 margin_mode: str = "isolated", retry_after: float = 60.0,
+                 logger: Optional[logging.Logger] = None):
+        """
+        Args:
+            exchanges: 주문 가능한 거래소 (fetch_only 제외)
+            leverage: 심볼별로 미리 설정할 레버리지
+            margin_mode: isolated / crossed
+            retry_after: 설정 실패 후 재시도까지 대기 (초)
+        """
+        self.exchanges = exchanges
+        self.leverage = leverage
+        self.margin_mode = margin_mode
+        self.retry_after = retry_after
+        self.logger = logger or logging.getLogger(__name__)
+
+        # (거래소, 심볼) → 확인된 (레버리지, 마진 모드)
+        self._armed: Dict[Tuple[str, str], Tuple[int, str]] = {}
+        self._arming: Dict[Tuple[str, str], asyncio.Task] = {}
+        self._failed_at: Dict[Tuple[str, str], float] = {}
+        self._templates: Dict[Tuple[str, str], OrderTemplate] = {}
+        self._background: Set[asyncio.Task] = set()
+
+    def _venues(self, exchanges: Optional[Iterable[str]]) -> Tuple[str, ...]:
+        names = self.exchanges if exchanges is None else exchanges
+        return tuple(name for name in names if name in self.exchanges)
+
+    def is_armed(self, exchange: str, symbol: str) -> bool:
+        return self._armed.get((exchange, symbol)) == (self.leverage, self.margin_mode)
+
+    def armed(self, symbol: str, exchanges: Optional[Iterable[str]] = None) -> bool:
+        """지정 거래소(기본: 전체) 모두 설정 완료 여부"""
+        return all(self.is_armed(name, symbol) for name in self._venues(exchanges))
+
+    async def arm(self, symbol: str, exchanges: Optional[Iterable[str]] = None) -> bool:
+        """심볼 레버리지/마진 설정 (이미 확인된 거래소는 요청 없음, 거래소끼리 동시 진행)"""
+        venues = [name for name in self._venues(exchanges) if not self.is_armed(name, symbol)]
+        if not venues:
+            return True
+        results = await asyncio.gather(*(self._arm_one(name, symbol) for name in venues))
+        return all(results)
+
+    def schedule(self, symbol: str, exchanges: Optional[Iterable[str]] = None):
+        """백그라운드로 arm (진행 중/설정 완료/재시도 보류 중인 거래소는 건너뜀)"""
+        now = time.monotonic()
+        pending = [
+            name for name in self._venues(exchanges)
+            if not self.is_armed(name, symbol) and (name, symbol) not in self._arming
+            and now - self._failed_at.get((name, symbol), -math.inf) >= self.retry_after
+        ]
+        if not pending:
+            return
+        task = asyncio.create_task(self.arm(symbol, pending))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _arm_one(self, exchange_name: str, symbol: str) -> bool:
+        key = (exchange_name, symbol)
+        task = self._arming.get(key)
+        if task is None:
+            task = asyncio.create_task(self._apply(exchange_name, symbol))
+            self._arming[key] = task
+            task.add_done_callback(lambda _: self._arming.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _apply(self, exchange_name: str, symbol: str) -> bool:
+        exchange = self.exchanges[exchange_name]
+        try:
+            # 마진 모드는 포지션/레버리지보다 먼저 (바이낸스는 포지션이 있으면 변경 불가)
+            await exchange.set_margin_mode(symbol, self.margin_mode)
+            await exchange.set_leverage(symbol, self.leverage)
+        except Exception as e:
+            self._failed_at[(exchange_name, symbol)] = time.monotonic()
+            self.logger.warning(f"⚠️ {exchange_name.upper()} {symbol} 레버리지/마진 사전 설정 실패: {e}")
+            return False
+
+        self._armed[(exchange_name, symbol)] = (self.leverage, self.margin_mode)
+        self._failed_at.pop((exchange_name, symbol), None)
+        self.template(exchange_name, symbol)  # 템플릿도 미리 계산
+        self.logger.debug(f"{exchange_name.upper()} {symbol} 준비 완료 "
+                          f"(레버리지 {self.leverage}배, {self.margin_mode})")
+        return True
+
+    def invalidate(self, exchange: Optional[str] = None, symbol: Optional[str] = None):
+        """확인된 상태/템플릿 삭제 (거래소 쪽 설정이 바뀌었거나 주문이 설정 오류로 거부된 경우)"""
+        for cache in (self._armed, self._templates, self._failed_at):
+            for key in [key for key in cache
+                        if (exchange is None or key[0] == exchange) and (symbol is None or key[1] == symbol)]:
+                del cache[key]
+
+    def template(self, exchange_name: str, symbol: str) -> OrderTemplate:
+        """거래소 × 심볼 주문 템플릿 (캐시)"""
+        key = (exchange_name, symbol)
+        template = self._templates.get(key)
+        if template is None:
+            exchange = self.exchanges[exchange_name]
+            rules = exchange.market_rules(symbol)
+            template = OrderTemplate(exchange=exchange_name, symbol=symbol,
+                                     min_qty=rules.min_qty, qty_step=rules.qty_step,
+                                     tick_size=rules.tick_size, params=exchange.order_params(symbol))
+            self._templates[key] = template
+        return template
+
+    def pair_quantity(self, symbol: str, long_exchange: str, short_exchange: str,
+                      price: float, target_usdt: float) -> float:
+        """양쪽 다리에 같은 수량 (두 거래소 수량 단위/최소 수량을 모두 만족하도록 큰 단위 기준)"""
+        long_template = self.template(long_exchange, symbol)
+        short_template = self.template(short_exchange, symbol)
+        coarse = long_template if long_template.qty_step >= short_template.qty_step else short_template
+
+        required = max(long_template.min_qty, short_template.min_qty)
+        amount = coarse.quantity(max(target_usdt / price, required))
+        if amount < required and coarse.qty_step > 0:
+            amount = coarse.quantity(amount + coarse.qty_step)
+        return amount
+
+    async def close(self):
+        """진행 중인 백그라운드 설정 취소"""
+        tasks = list(self._background) + list(self._arming.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._background.clear()
+        self._arming.clear()
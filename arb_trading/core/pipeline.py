@@ -0,0 +1,190 @@
+# arb_trading/core/pipeline.py
+"""단계별 비동기 파이프라인
+
+시세 조회 → 시그널 → 실행 → 기록 단계를 각각 독립 태스크로 돌리고
+크기 제한 큐로 연결한다. 뒤 단계가 느려도 앞 단계(특히 일정 주기 시세 조회)는 멈추지 않는다.
+
+큐 정책:
+    drop_oldest: 가득 차면 가장 오래된 항목을 버리고 넣는다 (생산자는 기다리지 않음, 버림 수 집계)
+    block: 가득 차면 생산자가 빈자리를 기다린다 (역압)
+
+단계마다 처리 시간과 큐 대기 시간을 기록해 PerformanceMonitor로 넘긴다.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+DROP_OLDEST = 'drop_oldest'
+BLOCK = 'block'
+
+
+class StageQueue:
+    """크기 제한 단계 간 큐 (항목은 넣은 시각과 함께 보관)"""
+
+    def __init__(self, name: str, maxsize: int = 1, policy: str = DROP_OLDEST):
+        if maxsize < 1:
+            raise Exception(f"큐 크기는 1 이상이어야 합니다: {name}={maxsize}")
+        if policy not in (DROP_OLDEST, BLOCK):
+            raise Exception(f"지원하지 않는 큐 정책: {policy}")
+
+        self.name = name
+        self.policy = policy
+        self.dropped = 0
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize)
+
+    def __len__(self) -> int:
+        return self._queue.qsize()
+
+    async def put(self, item: Any) -> bool:
+        """항목 추가 (drop_oldest 정책에서 오래된 항목을 버렸으면 True)"""
+        entry = (time.perf_counter(), item)
+        if self.policy == BLOCK:
+            await self._queue.put(entry)
+            return False
+
+        dropped = False
+        while True:
+            try:
+                self._queue.put_nowait(entry)
+                return dropped
+            except asyncio.QueueFull:
+                self._queue.get_nowait()
+                self._queue.task_done()
+                self.dropped += 1
+                dropped = True
+
+    async def get(self):
+        """(항목, 큐 대기 시간) 반환"""
+        enqueued_at, item = await self._queue.get()
+        self._queue.task_done()
+        return item, time.perf_counter() - enqueued_at
+
+
+class Pipeline:
+    """주기 소스 1개 + 큐로 연결된 처리 단계들"""
+
+    def __init__(self, name: str = "pipeline", performance_monitor=None,
+                 logger: Optional[logging.Logger] = None, error_delay: float = 0.0):
+        """
+        Args:
+            performance_monitor: 단계 지연/큐 버림 기록 대상 (None이면 단계 자체 통계만)
+            error_delay: 단계 처리 실패 후 다음 항목까지 대기 (초)
+        """
+        self.name = name
+        self.performance_monitor = performance_monitor
+        self.logger = logger or logging.getLogger(__name__)
+        self.error_delay = error_delay
+
+        self.queues: List[StageQueue] = []
+        self._runners: List[Callable[[], Awaitable[None]]] = []
+        # 단계별 처리 시간 (초, 최근 100개)
+        self.latencies: Dict[str, deque] = {}
+        self.counts: Dict[str, int] = {}
+
+    def queue(self, name: str, maxsize: int = 1, policy: str = DROP_OLDEST) -> StageQueue:
+        stage_queue = StageQueue(name, maxsize, policy)
+        self.queues.append(stage_queue)
+        return stage_queue
+
+    def _register(self, stage: str):
+        self.latencies[stage] = deque(maxlen=100)
+        self.counts[stage] = 0
+
+    def _record(self, stage: str, duration: float, wait: float = 0.0):
+        self.latencies[stage].append(duration)
+        self.counts[stage] += 1
+        if self.performance_monitor:
+            self.performance_monitor.record_stage(stage, duration, wait)
+
+    async def _emit(self, output: Optional[StageQueue], item: Any):
+        if output is None or item is None:
+            return
+        if await output.put(item) and self.performance_monitor:
+            self.performance_monitor.record_queue_drop(output.name)
+
+    def _on_error(self, stage: str, error: Exception):
+        self.logger.error(f"❌ {stage} 단계 오류: {error}")
+        if self.performance_monitor:
+            self.performance_monitor.record_error(f"{stage}_stage_error")
+
+    def add_source(self, stage: str, produce: Callable[[], Awaitable[Any]],
+                   interval: float, output: StageQueue):
+        """interval 초마다 produce() 결과를 output에 넣는 소스 단계
+
+        주기는 시작 시각 기준 고정 격자로 유지한다 (처리 시간만큼 밀리지 않음).
+        produce()가 주기보다 오래 걸리면 지난 격자는 건너뛴다.
+        None 결과는 내보내지 않는다.
+        """
+        self._register(stage)
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            next_at = loop.time()
+            while True:
+                start = time.perf_counter()
+                try:
+                    item = await produce()
+                except Exception as e:
+                    self._on_error(stage, e)
+                    item = None
+                self._record(stage, time.perf_counter() - start)
+                await self._emit(output, item)
+
+                next_at += interval
+                now = loop.time()
+                if next_at < now:
+                    next_at += ((now - next_at) // interval + 1) * interval
+                await asyncio.sleep(next_at - now)
+
+        self._runners.append(run)
+
+    def add_stage(self, stage: str, handle: Callable[[Any], Awaitable[Any]],
+                  source: StageQueue, output: Optional[StageQueue] = None):
+        """source 항목마다 handle(item)을 실행하고 None이 아닌 결과를 output에 넣는 단계"""
+        self._register(stage)
+
+        async def run():
+            while True:
+                item, wait = await source.get()
+                start = time.perf_counter()
+                try:
+                    result = await handle(item)
+                except Exception as e:
+                    self._on_error(stage, e)
+                    if self.error_delay > 0:
+                        await asyncio.sleep(self.error_delay)
+                    continue
+                self._record(stage, time.perf_counter() - start, wait)
+                await self._emit(output, result)
+
+        self._runners.append(run)
+
+    async def run(self, stop_event: asyncio.Event):
+        """stop_event가 설정될 때까지 모든 단계 실행 (종료 시 단계 태스크 취소)"""
+        tasks = [asyncio.create_task(runner(), name=f"{self.name}-{i}")
+                 for i, runner in enumerate(self._runners)]
+        stopper = asyncio.create_task(stop_event.wait())
+        try:
+            done, _ = await asyncio.wait(tasks + [stopper], return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task is not stopper and not task.cancelled() and task.exception():
+                    raise task.exception()
+        finally:
+            for task in tasks + [stopper]:
+                task.cancel()
+            await asyncio.gather(*tasks, stopper, return_exceptions=True)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """단계별 처리 수/평균 처리 시간, 큐별 대기 항목/버림 수"""
+        stats: Dict[str, Dict[str, Any]] = {}
+        for stage, latencies in self.latencies.items():
+            stats[stage] = {
+                "count": self.counts[stage],
+                "avg": sum(latencies) / len(latencies) if latencies else 0.0,
+            }
+        for stage_queue in self.queues:
+            stats[stage_queue.name] = {"pending": len(stage_queue), "dropped": stage_queue.dropped}
+        return stats
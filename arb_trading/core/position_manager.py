@@ -90,6 +90,14 @@ class PositionManager:
 
         return True
 
+    def remove_position(self, symbol: str) -> bool:
+        """청산 완료된 포지션 제거 (같은 심볼 재진입 허용)"""
+        position = self.positions.get(symbol)
+        if position is None or position.status != PositionStatus.CLOSED:
+            return False
+        del self.positions[symbol]
+        return True
+
     async def update_position_status(self, symbol: str) -> bool:
         """포지션 상태 업데이트"""
         if symbol not in self.positions:
@@ -266,6 +274,13 @@ class PositionManager:
 
             return False
 
+    @staticmethod
+    def _close_params(exchange: BaseExchange) -> Dict[str, Any]:
+        """청산 주문 파라미터 (포지션 축소 전용 → 반대 포지션을 새로 열지 않음)"""
+        params = {'category': 'linear'} if exchange.name == 'bybit' else {}
+        params.update(exchange.reduce_only_params)
+        return params
+
     async def _close_long_position(self, position: ArbitragePosition):
         """롱 포지션 청산"""
         order = await position.long_exchange.create_order(
@@ -273,7 +288,7 @@ class PositionManager:
             side=OrderSide.SELL,
             order_type=OrderType.MARKET,
             amount=position.long_filled,
-            params={'category': 'linear'} if position.long_exchange.name == 'bybit' else {}
+            params=self._close_params(position.long_exchange)
         )
 
         self.logger.info(f"롱 포지션 청산: {position.symbol} - {order.filled}개")
@@ -285,7 +300,7 @@ class PositionManager:
             side=OrderSide.BUY,
             order_type=OrderType.MARKET,
             amount=position.short_filled,
-            params={'category': 'linear'} if position.short_exchange.name == 'bybit' else {}
+            params=self._close_params(position.short_exchange)
         )
 
         self.logger.info(f"숏 포지션 청산: {position.symbol} - {order.filled}개")
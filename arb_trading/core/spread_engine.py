@@ -0,0 +1,588 @@
+# arb_trading/core/spread_engine.py
+"""NumPy 벡터 기반 스프레드 계산 엔진
+
+거래소별 가격을 SymbolUniverse ID로 인덱싱되는 float64 벡터로 두고
+활성 심볼(거래대금 상위)만 골라 스프레드/방향/필터를 몇 번의 벡터 연산으로 처리한다.
+거래소가 N개면 (매도 거래소 × 매수 거래소 × 심볼) 행렬로 심볼별 최적 거래소 쌍을 고르므로
+거래소 추가는 배열 폭만 늘린다.
+보유 기간(funding_horizon_hours)을 주면 그 안에 정산될 펀딩비(숏 수취 - 롱 지급)를
+캐리로 더해 펀딩을 감안한 기대수익으로 순위를 매긴다.
+순위 전에 시세 정상성 필터(spread_filters)로 비정상 가격/오래된 시세/비현실적 쌍을 뺀다.
+순서는 질의한 만큼만 만들고 (spread_ranking), SpreadData 객체는 소비자가 실제로
+읽는 행에 대해서만 만든다 (SpreadTable).
+"""
+
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple, Union, overload
+
+import numpy as np
+
+from ..exchanges.base import Direction, FeeSchedule, FundingBatch, TickerBatch
+from .spread_filters import SpreadFilters
+from .spread_ranking import SpreadRanking, VectorRanking
+from .symbol_universe import SymbolUniverse
+
+if TYPE_CHECKING:
+    from .spread_monitor import SpreadData  # 순환 import 방지 (실행 시에는 spread_data()에서 import)
+
+
+def _utc_text(epoch: float) -> str:
+    """epoch 초 → SpreadData 표시 시각 (UTC)"""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(epoch))
+
+
+def _direction(sell_exchange: str, buy_exchange: str, spread_pct: float) -> Direction:
+    """매도/매수 거래소 이름 → 방향 (바이낸스/바이빗이 없는 쌍은 부호 기준)"""
+    if sell_exchange == 'binance' or buy_exchange == 'bybit':
+        return Direction.BINANCE_GT_BYBIT
+    if sell_exchange == 'bybit' or buy_exchange == 'binance':
+        return Direction.BYBIT_GT_BINANCE
+    return Direction.BINANCE_GT_BYBIT if spread_pct > 0 else Direction.BYBIT_GT_BINANCE
+
+
+class SpreadColumns:
+    """활성 심볼 행 단위 스프레드 결과 배열 묶음"""
+
+    def __init__(self, venues: Sequence[str], venue_prices: np.ndarray,
+                 sell_venue: np.ndarray, buy_venue: np.ndarray,
+                 spread_pct: np.ndarray, abs_spread_pct: np.ndarray, volumes: np.ndarray,
+                 carry_pct: Optional[np.ndarray] = None):
+        self.venues = venues
+        self.venue_prices = venue_prices  # (거래소, 행) 표시/판단용 가격 (모드별 체결가 또는 호가)
+        self.sell_venue = sell_venue  # 행 → 매도 거래소 인덱스
+        self.buy_venue = buy_venue  # 행 → 매수 거래소 인덱스
+        self.spread_pct = spread_pct
+        self.abs_spread_pct = abs_spread_pct
+        self.volumes = volumes
+        self.carry_pct = carry_pct if carry_pct is not None else np.zeros(len(spread_pct))  # 기대수익 중 펀딩 캐리
+
+    @classmethod
+    def empty(cls, venues: Sequence[str], n: int) -> 'SpreadColumns':
+        return cls(venues, np.full((len(venues), n), np.nan),
+                   np.zeros(n, dtype=np.intp), np.ones(n, dtype=np.intp),
+                   np.zeros(n), np.zeros(n), np.zeros(n))
+
+    def copy(self) -> 'SpreadColumns':
+        return SpreadColumns(self.venues, self.venue_prices.copy(), self.sell_venue.copy(),
+                             self.buy_venue.copy(), self.spread_pct.copy(),
+                             self.abs_spread_pct.copy(), self.volumes, self.carry_pct.copy())
+
+    def price(self, venue: str, row: int) -> float:
+        if venue not in self.venues:
+            return float('nan')
+        return float(self.venue_prices[self.venues.index(venue), row])
+
+    def spread_data(self, timestamp: str, symbol: str, symbol_id: int, row: int) -> 'SpreadData':
+        """한 행 → SpreadData"""
+        from .spread_monitor import SpreadData
+
+        spread_pct = float(self.spread_pct[row])
+        sell, buy = int(self.sell_venue[row]), int(self.buy_venue[row])
+        sell_exchange, buy_exchange = self.venues[sell], self.venues[buy]
+        return SpreadData(
+            timestamp=timestamp,
+            symbol=symbol,
+            binance_price=self.price('binance', row),
+            bybit_price=self.price('bybit', row),
+            spread_pct=spread_pct,
+            abs_spread_pct=float(self.abs_spread_pct[row]),
+            direction=_direction(sell_exchange, buy_exchange, spread_pct),
+            volume_24h=float(self.volumes[row]),
+            symbol_id=symbol_id,
+            sell_exchange=sell_exchange,
+            buy_exchange=buy_exchange,
+            sell_price=float(self.venue_prices[sell, row]),
+            buy_price=float(self.venue_prices[buy, row]),
+            carry_pct=float(self.carry_pct[row])
+        )
+
+
+class SpreadTable(Sequence):
+    """스프레드 내림차순 결과 (지연 생성 시퀀스)
+
+    list[SpreadData]처럼 인덱싱/슬라이싱/순회할 수 있다. 순서는 순위 구조에 필요한
+    만큼만 질의하고, 접근한 행만 SpreadData로 변환해 캐시한다.
+    """
+
+    def __init__(self, symbols: Sequence[str], row_of: np.ndarray,
+                 ranking: Union[VectorRanking, SpreadRanking],
+                 columns: SpreadColumns, created_at: float):
+        self._symbols = symbols  # ID → 표준 심볼
+        self._row_of = row_of  # 심볼 ID → 배열 행
+        self._ranking = ranking  # 심볼 ID 순위 (abs_spread_pct 내림차순)
+        self._columns = columns
+        self._created_at = created_at  # 계산 시각 (epoch 초, 행을 만들 때 한 번만 문자열로 변환)
+        self._timestamp: Optional[str] = None
+        self._prefix: Sequence[int] = []  # 지금까지 질의한 상위 심볼 ID
+        self._rows: Dict[int, 'SpreadData'] = {}
+
+    @classmethod
+    def empty(cls) -> 'SpreadTable':
+        no_ids = np.empty(0, dtype=np.intp)
+        return cls([], no_ids, VectorRanking(no_ids, np.empty(0)), SpreadColumns.empty((), 0), 0.0)
+
+    def __len__(self) -> int:
+        return len(self._ranking)
+
+    @overload
+    def __getitem__(self, index: int) -> 'SpreadData': ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List['SpreadData']: ...
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            positions = range(*index.indices(len(self)))
+            if not positions:
+                return []
+            keys = self._top(max(positions) + 1)  # 음수 step이면 start가 가장 깊은 위치
+            return [self._row(int(keys[i])) for i in positions]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("SpreadTable 인덱스 범위 초과")
+        if index >= len(self._prefix):
+            # 다음 접근에 대비해 넉넉히 질의
+            self._top(max(index + 1, 2 * len(self._prefix), 8))
+        return self._row(int(self._prefix[index]))
+
+    def __iter__(self):
+        for symbol_id in self._top(len(self)):
+            yield self._row(int(symbol_id))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (SpreadTable, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def _top(self, k: int) -> Sequence[int]:
+        if k > len(self._prefix):
+            self._prefix = self._ranking.top(min(k, len(self)))
+        return self._prefix
+
+    def _row(self, symbol_id: int) -> 'SpreadData':
+        row = self._rows.get(symbol_id)
+        if row is None:
+            if self._timestamp is None:
+                self._timestamp = _utc_text(self._created_at)
+            row = self._columns.spread_data(self._timestamp, self._symbols[symbol_id], symbol_id,
+                                            int(self._row_of[symbol_id]))
+            self._rows[symbol_id] = row
+        return row
+
+    def count_above(self, threshold: float) -> int:
+        """abs_spread_pct >= threshold 인 행 수"""
+        return self._ranking.count_above(threshold)
+
+    def above(self, threshold: float) -> List['SpreadData']:
+        """abs_spread_pct >= threshold 인 행만 SpreadData로 반환 (내림차순)"""
+        return [self._row(int(symbol_id)) for symbol_id in self._ranking.above(threshold)]
+
+
+class SpreadEngine:
+    """활성 심볼 ID 목록 + 거래소별 가격 벡터
+
+    REST 배치는 compute()로 한 번에 계산하고, 스트리밍 갱신은 update_quote()로
+    가격이 바뀐 심볼만 다시 계산해 인덱스 힙 순위(SpreadRanking)를 조정한다.
+
+    스프레드 모드:
+        last: 최근 체결가 차이 (가장 비싼 거래소 매도 / 가장 싼 거래소 매수)
+        executable: 매도 거래소 bid vs 매수 거래소 ask 에서 양쪽 테이커 수수료를 뺀 순 기대수익
+
+    두 모드 모두 funding_horizon_hours > 0 이면 보유 기간 펀딩 캐리를 더한다.
+    """
+
+    MODES = ('last', 'executable')
+    LAST, BID, ASK = 0, 1, 2  # 시세 배열 행
+
+    def __init__(self, universe: Optional[SymbolUniverse] = None, max_spread_pct: float = 5.0,
+                 mode: str = 'last', fees: Optional[Dict[str, FeeSchedule]] = None,
+                 min_net_edge_pct: float = 0.0,
+                 venues: Sequence[str] = ('binance', 'bybit'),
+                 funding_horizon_hours: float = 0.0,
+                 filters: Optional[SpreadFilters] = None):
+        if mode not in self.MODES:
+            raise Exception(f"지원하지 않는 스프레드 모드: {mode} (가능: {', '.join(self.MODES)})")
+
+        self.universe = universe if universe is not None else SymbolUniverse()
+        # 시세 정상성 규칙 (미지정 시 기본 규칙 + max_spread_pct 상한)
+        self.filters = filters if filters is not None else SpreadFilters(max_spread_pct=max_spread_pct)
+        self.mode = mode
+        self.min_net_edge_pct = min_net_edge_pct  # executable 모드에서 이 미만 순 기대수익은 제외
+        self.venues: Tuple[str, ...] = tuple(venues)
+        self._venue_index = {venue: i for i, venue in enumerate(self.venues)}
+        # 스프레드 부호 기준: 거래소 이름 순 (설정 순서와 무관, binance < bybit 이면 기존 부호와 동일)
+        self._venue_rank = np.argsort(np.argsort(np.array(self.venues, dtype=object)))
+        self._pair_mask = ~np.eye(len(self.venues), dtype=bool)  # 같은 거래소 쌍 제외
+
+        self.fees: Dict[str, FeeSchedule] = {}
+        self._fee_matrix = np.zeros((len(self.venues), len(self.venues)))  # [매도, 매수] 테이커 수수료 합 (%)
+        self.set_fees(fees or {})
+
+        # 펀딩 캐리: 거래소별 (ID 인덱스) 보유 기간 동안 숏이 받는 펀딩 합계 (%)
+        self.funding_horizon_hours = funding_horizon_hours
+        self._carry_by_id: Dict[str, np.ndarray] = {}
+
+        self.active_ids = np.empty(0, dtype=np.intp)  # 계산 대상 심볼 ID (거래대금 순)
+        self._volumes = np.empty(0)
+
+        # 증분 갱신 상태 (활성 심볼 행 단위)
+        self.ranking = SpreadRanking()
+        self.primed = False  # 전체 가격이 한 번 이상 적재됐는지
+        self._ranking_synced = False
+        self._reset_state()
+
+    @property
+    def needs_quotes(self) -> bool:
+        """호가(bid/ask)가 필요한 모드인지"""
+        return self.mode == 'executable'
+
+    def set_fees(self, fees: Dict[str, FeeSchedule]):
+        """거래소별 수수료 등록 (거래소 쌍별 진입 비용 미리 계산)"""
+        self.fees.update(fees)
+        taker = np.array([self.fees[v].taker_pct if v in self.fees else 0.0 for v in self.venues])
+        self._fee_matrix = taker[:, None] + taker[None, :]
+
+    def _reset_state(self):
+        n = len(self.active_ids)
+        self._row_of = np.full(len(self.universe), -1, dtype=np.intp)
+        self._row_of[self.active_ids] = np.arange(n)
+        self._quotes = np.full((len(self.venues), 3, n), np.nan)  # (거래소, 체결가/bid/ask, 행)
+        self._stamps = np.full((len(self.venues), n), np.nan)  # 수신 시각 (초, 오래된 시세 필터용)
+        self._events = np.full((len(self.venues), n), np.nan)  # 거래소 이벤트 시각 (초, 시각 차이 필터용)
+        self._columns = SpreadColumns.empty(self.venues, n)
+        self._columns.volumes = self._volumes
+        self._valid = np.zeros(n, dtype=bool)
+        self._carry = np.zeros((len(self.venues), n))
+        for venue, carry in self._carry_by_id.items():
+            self._align_carry(venue, carry)
+        self.ranking.clear()
+        self.primed = False
+        self._ranking_synced = False
+
+    def set_funding(self, exchange: str, batch: FundingBatch, now_ms: Optional[int] = None):
+        """거래소 펀딩비 반영 → 보유 기간 캐리 계산 (펀딩 조회 주기마다 호출)
+
+        캐리 = 펀딩비 × 보유 기간 안의 정산 횟수 (다음 정산 시각부터 주기 간격)
+        """
+        if exchange not in self._venue_index or self.funding_horizon_hours <= 0:
+            return
+        if not self.universe.has_exchange(exchange):
+            self.universe.register_exchange(exchange, batch.symbols)
+        if now_ms is None:
+            now_ms = int(time.time() * 1000)
+
+        horizon_end = now_ms + self.funding_horizon_hours * 3600 * 1000
+        next_times = np.asarray(batch.next_funding_times, dtype=np.float64)
+        intervals = np.asarray(batch.interval_hours, dtype=np.float64) * 3600 * 1000
+        with np.errstate(invalid='ignore', divide='ignore'):
+            events = np.where(next_times <= horizon_end,
+                              np.floor((horizon_end - next_times) / intervals) + 1, 0.0)
+        events = np.nan_to_num(events, nan=0.0, posinf=0.0)
+        carry = np.asarray(batch.rates_pct, dtype=np.float64) * events
+
+        self._carry_by_id[exchange] = self.universe.scatter(exchange, batch.symbols, carry, fill=0.0)
+        self._align_carry(exchange, self._carry_by_id[exchange])
+
+        if self.primed:
+            # 증분 상태 재평가 (다음 스냅샷/갱신부터 반영)
+            self._valid, self._columns = self._evaluate(self._quotes, self._stamps, self._events)
+            self._ranking_synced = False
+
+    def _align_carry(self, exchange: str, carry: np.ndarray):
+        ids = self.active_ids
+        known = ids < len(carry)
+        row = np.zeros(len(ids))
+        row[known] = carry[ids[known]]
+        self._carry[self._venue_index[exchange]] = row
+
+    def set_active(self, ids: np.ndarray, volumes: Optional[np.ndarray] = None):
+        """계산 대상 심볼 변경
+
+        Args:
+            ids: 심볼 ID 배열 (동률 정렬 시 이 순서 유지)
+            volumes: ids와 같은 순서의 24시간 거래대금
+        """
+        self.active_ids = np.asarray(ids, dtype=np.intp)
+        self._volumes = (np.asarray(volumes, dtype=np.float64) if volumes is not None
+                         else np.zeros(len(self.active_ids)))
+        self._reset_state()
+
+    def set_symbols(self, symbols: Sequence[str], volumes: Optional[Dict[str, float]] = None):
+        """표준 심볼 문자열로 계산 대상 지정 (미등록 심볼은 자동 등록)"""
+        ids = [self.universe.register(symbol) for symbol in symbols]
+        volumes = volumes or {}
+        self.set_active(np.array(ids, dtype=np.intp), np.array([volumes.get(s, 0.0) for s in symbols]))
+
+    def align(self, exchange: str, batch: TickerBatch) -> np.ndarray:
+        """배치 시세 → 활성 심볼 순서 (3, n) 배열 [체결가, bid, ask] (없는 값은 NaN)"""
+        if not self.universe.has_exchange(exchange):
+            # 상장 목록 등록 전 (단독 사용): 네이티브 심볼을 그대로 표준 심볼로 등록
+            self.universe.register_exchange(exchange, batch.symbols)
+
+        quotes = np.full((3, len(self.active_ids)), np.nan)
+        quotes[self.LAST] = self.universe.scatter(exchange, batch.symbols, batch.last_prices)[self.active_ids]
+        if self.needs_quotes and batch.bids is not None and batch.asks is not None:
+            quotes[self.BID] = self.universe.scatter(exchange, batch.symbols, batch.bids)[self.active_ids]
+            quotes[self.ASK] = self.universe.scatter(exchange, batch.symbols, batch.asks)[self.active_ids]
+        return quotes
+
+    def _reference(self, quotes: np.ndarray) -> np.ndarray:
+        """거래소별 같은 기준 가격 (비율/가격대 규칙용: last 모드는 체결가, executable은 호가 중간값)
+
+        한쪽 호가만 있으면 그 호가를 쓴다. quotes는 (거래소, 3, n) 또는 한 행 (거래소, 3).
+        """
+        if not self.needs_quotes:
+            return quotes[:, self.LAST]
+        with np.errstate(invalid='ignore'):
+            bid = np.where(quotes[:, self.BID] > 0, quotes[:, self.BID], np.nan)
+            ask = np.where(quotes[:, self.ASK] > 0, quotes[:, self.ASK], np.nan)
+            return np.where(np.isnan(bid), ask, np.where(np.isnan(ask), bid, (bid + ask) / 2))
+
+    def _evaluate(self, quotes: np.ndarray, stamps: np.ndarray,
+                  events: np.ndarray) -> Tuple[np.ndarray, SpreadColumns]:
+        """거래소 쌍 행렬 계산 → (유효 마스크, 결과 배열)
+
+        edge[매도, 매수, 행] = (매도가 - 매수가) / 매수가 × 100 (- 수수료) 에서
+        필터를 통과한 쌍 중 심볼별 최댓값 쌍을 고른다.
+        """
+        n = quotes.shape[2]
+        columns = np.arange(n)
+        if self.needs_quotes:
+            sell_px, buy_px = quotes[:, self.BID], quotes[:, self.ASK]
+        else:
+            sell_px = buy_px = quotes[:, self.LAST]
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            edge = (sell_px[:, None, :] - buy_px[None, :, :]) / buy_px[None, :, :] * 100
+            if self.needs_quotes:
+                edge -= self._fee_matrix[:, :, None]
+            # 숏(매도 거래소)은 펀딩을 받고 롱(매수 거래소)은 낸다
+            pair_carry = self._carry[:, None, :] - self._carry[None, :, :]
+            edge += pair_carry
+            sell_ok, buy_ok = self.filters.venue_mask(sell_px, buy_px, time.time() - stamps)
+            usable = sell_ok[:, None, :] & buy_ok[None, :, :] & self._pair_mask[:, :, None]
+            usable = self.filters.pair_mask(sell_px, buy_px, usable, events, self._reference(quotes))
+            edge = np.where(usable, edge, -np.inf)  # 필터 탈락/NaN 가격/같은 거래소 쌍 제외
+
+            venue_count = len(self.venues)
+            best = edge.reshape(venue_count * venue_count, n).argmax(axis=0)
+            sell_venue, buy_venue = np.divmod(best, venue_count)
+            abs_spread = edge[sell_venue, buy_venue, columns]
+
+            valid = np.isfinite(abs_spread)
+            if self.needs_quotes:
+                # 순 기대수익이 낮은 심볼은 여기서 제외 (이후 판단 대상 축소)
+                valid &= abs_spread >= self.min_net_edge_pct
+            # 현실적인 스프레드만 포함
+            valid = self.filters.spread_mask(abs_spread, valid)
+
+        spread = np.where(self._venue_rank[sell_venue] < self._venue_rank[buy_venue], abs_spread, -abs_spread)
+        venue_prices = quotes[:, self.LAST].copy()
+        if self.needs_quotes:
+            # 거래 대상 거래소는 실제 체결될 호가로 표시
+            venue_prices[sell_venue, columns] = sell_px[sell_venue, columns]
+            venue_prices[buy_venue, columns] = buy_px[buy_venue, columns]
+
+        return valid, SpreadColumns(self.venues, venue_prices, sell_venue, buy_venue,
+                                    spread, abs_spread, self._volumes,
+                                    pair_carry[sell_venue, buy_venue, columns])
+
+    def compute(self, batches: Dict[str, TickerBatch]) -> SpreadTable:
+        """거래소 간 최적 쌍 스프레드 계산 (abs_spread_pct 내림차순)"""
+        present = [venue for venue in self.venues if venue in batches]
+        if len(present) < 2 or not len(self.active_ids):
+            return SpreadTable.empty()
+
+        quotes = np.full((len(self.venues), 3, len(self.active_ids)), np.nan)
+        stamps = np.full((len(self.venues), len(self.active_ids)), np.nan)
+        events = np.full((len(self.venues), len(self.active_ids)), np.nan)
+        now = time.time()
+        for venue in present:
+            batch, index = batches[venue], self._venue_index[venue]
+            quotes[index] = self.align(venue, batch)
+            stamps[index] = batch.timestamp / 1000 if batch.timestamp else now
+            if batch.event_times is not None:
+                events[index] = self.universe.scatter(venue, batch.symbols, batch.event_times)[self.active_ids] / 1000
+            else:
+                events[index] = stamps[index]
+        valid, columns = self._evaluate(quotes, stamps, events)
+
+        # 증분 갱신 기준 상태 (반환 테이블과 배열을 공유하지 않음)
+        self._quotes = quotes
+        self._stamps = stamps
+        self._events = events
+        self._columns = columns.copy()
+        self._valid = valid
+        self.primed = True
+        self._ranking_synced = False  # 다음 스트리밍 갱신/스냅샷 때 재구성
+
+        # 전체 정렬 없이 필요한 순위만 계산 (동률이면 활성 심볼 순서 유지)
+        rows = np.flatnonzero(valid)
+        ranking = VectorRanking(self.active_ids[rows], columns.abs_spread_pct[rows])
+
+        return SpreadTable(
+            symbols=self.universe.symbols,
+            row_of=self._row_of,
+            ranking=ranking,
+            columns=columns,
+            created_at=now
+        )
+
+    def _sync_ranking(self):
+        rows = np.flatnonzero(self._valid)
+        self.ranking.rebuild(self.active_ids[rows], self._columns.abs_spread_pct[rows], rows)
+        self._ranking_synced = True
+
+    def update_quote(self, exchange: str, symbol_id: int, last_price: Optional[float] = None,
+                     bid: Optional[float] = None, ask: Optional[float] = None,
+                     timestamp: Optional[int] = None) -> bool:
+        """단일 심볼 시세 갱신 → 해당 심볼 스프레드/순위만 재계산
+
+        Args:
+            timestamp: 거래소 이벤트 시각 (ms, 미지정 시 수신 시각)
+
+        Returns:
+            활성 심볼의 (현재 모드에서 쓰는) 가격이 실제로 바뀌었는지
+        """
+        venue = self._venue_index.get(exchange)
+        if venue is None or symbol_id >= len(self._row_of):
+            return False
+        row = int(self._row_of[symbol_id])
+        if row < 0:
+            return False
+
+        quotes = self._quotes[venue]
+        stamp = time.time()
+        # 오래된 시세/시각 차이로 제외됐을 수 있는 행은 가격이 같아도 다시 계산
+        max_age = self.filters.max_quote_age
+        changed = ((max_age > 0 and stamp - self._stamps[venue, row] > max_age) or
+                   (self.filters.max_skew > 0 and not self._valid[row]))
+        self._stamps[venue, row] = stamp
+        self._events[venue, row] = timestamp / 1000 if timestamp else stamp
+        if self.needs_quotes:
+            for index, value in ((self.BID, bid), (self.ASK, ask)):
+                if value is not None and quotes[index, row] != value:
+                    quotes[index, row] = value
+                    changed = True
+            if last_price is not None:
+                quotes[self.LAST, row] = last_price
+        elif last_price is not None and quotes[self.LAST, row] != last_price:
+            quotes[self.LAST, row] = last_price
+            changed = True
+        if not changed:
+            return False
+
+        self._refresh_row(row)
+        return True
+
+    def update_price(self, exchange: str, symbol_id: int, price: Optional[float]) -> bool:
+        """단일 심볼 체결가 갱신 (update_quote 축약)"""
+        return self.update_quote(exchange, symbol_id, last_price=price)
+
+    def _refresh_row(self, row: int):
+        """한 행 재계산 (스칼라 연산, _evaluate와 같은 규칙)"""
+        quotes = self._quotes[:, :, row]
+        carry = self._carry[:, row].tolist()
+        now = time.time()
+        ages = [now - stamp for stamp in self._stamps[:, row].tolist()]
+        events = self._events[:, row].tolist()
+        if self.needs_quotes:
+            sell_px, buy_px = quotes[:, self.BID].tolist(), quotes[:, self.ASK].tolist()
+        else:
+            sell_px = buy_px = quotes[:, self.LAST].tolist()
+        ref_px = self._reference(quotes).tolist()
+
+        filters = self.filters
+        rejected = set()
+        venue_ok = [filters.venue_ok(sell_price, buy_price, age, rejected)
+                    for sell_price, buy_price, age in zip(sell_px, buy_px, ages)]
+
+        # 거래소 수가 적으므로 쌍별 비교 (행렬 계산과 같은 순서 → 동률 시 같은 쌍 선택)
+        best = None
+        for sell, sell_price in enumerate(sell_px):
+            if not venue_ok[sell][0]:
+                continue
+            for buy, buy_price in enumerate(buy_px):
+                if buy == sell or not venue_ok[buy][1]:
+                    continue
+                if not filters.pair_ok(sell_price, buy_price, rejected, abs(events[sell] - events[buy]),
+                                       ref_px[sell], ref_px[buy]):
+                    continue
+                edge = (sell_price - buy_price) / buy_price * 100
+                if self.needs_quotes:
+                    edge -= self._fee_matrix[sell, buy]
+                edge += carry[sell] - carry[buy]
+                if best is None or edge > best[0]:
+                    best = (edge, sell, buy)
+
+        valid = best is not None
+        if valid:
+            abs_spread, sell, buy = best
+            valid = not self.needs_quotes or abs_spread >= self.min_net_edge_pct
+            valid = valid and filters.spread_ok(abs_spread, rejected)
+        if rejected:
+            filters.record(rejected)
+
+        columns = self._columns
+        if valid:
+            columns.abs_spread_pct[row] = abs_spread
+            columns.spread_pct[row] = abs_spread if self._venue_rank[sell] < self._venue_rank[buy] else -abs_spread
+            columns.sell_venue[row] = sell
+            columns.buy_venue[row] = buy
+            columns.carry_pct[row] = carry[sell] - carry[buy]
+            columns.venue_prices[:, row] = quotes[:, self.LAST]
+            columns.venue_prices[sell, row] = sell_px[sell]
+            columns.venue_prices[buy, row] = buy_px[buy]
+        self._valid[row] = valid
+
+        if self._ranking_synced:
+            symbol_id = int(self.active_ids[row])
+            if valid:
+                self.ranking.update(symbol_id, abs_spread, tie=row)
+            else:
+                self.ranking.discard(symbol_id)
+
+    def _expire_stale_rows(self):
+        """선택된 쌍의 시세가 오래된 행만 다시 계산 (갱신이 끊긴 거래소 제외)"""
+        max_age = self.filters.max_quote_age
+        if max_age <= 0:
+            return
+        rows = np.flatnonzero(self._valid)
+        columns = self._columns
+        cutoff = time.time() - max_age
+        stale = ((self._stamps[columns.sell_venue[rows], rows] < cutoff) |
+                 (self._stamps[columns.buy_venue[rows], rows] < cutoff))
+        for row in rows[stale]:
+            self._refresh_row(int(row))
+
+    def samples(self) -> Tuple[np.ndarray, np.ndarray]:
+        """현재 유효한 심볼 (ID 배열, spread_pct 배열) - 롤링 통계 입력"""
+        rows = np.flatnonzero(self._valid)
+        return self.active_ids[rows], self._columns.spread_pct[rows]
+
+    def spread_of(self, symbol_id: int) -> Optional['SpreadData']:
+        """증분 상태의 단일 심볼 스프레드 (유효하지 않으면 None)"""
+        if symbol_id >= len(self._row_of):
+            return None
+        row = int(self._row_of[symbol_id])
+        if row < 0 or not self._valid[row]:
+            return None
+        return self._columns.spread_data(_utc_text(time.time()),
+                                         self.universe.symbols[symbol_id], symbol_id, row)
+
+    def snapshot(self) -> SpreadTable:
+        """증분 상태의 현재 순위 (이후 갱신과 분리된 사본)"""
+        if not self.primed or not len(self.active_ids):
+            return SpreadTable.empty()
+        if not self._ranking_synced:
+            self._sync_ranking()
+        self._expire_stale_rows()
+
+        return SpreadTable(
+            symbols=self.universe.symbols,
+            row_of=self._row_of,
+            ranking=self.ranking.copy(),
+            columns=self._columns.copy(),
+            created_at=time.time()
+        )
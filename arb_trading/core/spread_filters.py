@@ -0,0 +1,194 @@
+# arb_trading/core/spread_filters.py
+"""벡터 시세 정상성 필터
+
+스프레드 엔진의 거래소 쌍 행렬에 순위 계산 전 적용한다 (기존 _validate_price_pair 대체).
+거래소 가격 단위 규칙(0 이하 가격, 한쪽 호가 없음, 오래된 시세)은 해당 거래소를 후보에서 빼고,
+쌍 단위 규칙(두 시세의 거래소 이벤트 시각 차이, 가격 비율, 가격대별 최대 스프레드)은
+그 쌍만 뺀다. 마지막으로 최종 스프레드 상한을 적용한다.
+
+가격 비율/가격대 규칙은 두 거래소의 같은 기준 가격(ref_px: 체결가 또는 호가 중간값)을
+비교한다 (한쪽 bid와 다른 쪽 ask를 비교하면 호가 폭만큼 가격대 판단이 흔들림).
+
+시각 기준:
+    stale: 로컬 수신 시각 기준 경과 시간 (거래소 시계와 무관)
+    skew: 거래소 이벤트 시각끼리 비교 (한쪽 시세만 오래된 가짜 스프레드 제외)
+
+거부는 줄 단위 로그 대신 규칙별 카운터로 모아 PerformanceMonitor로 넘긴다.
+카운트 단위는 평가 한 번에서 규칙이 후보를 하나 이상 제외한 심볼 수
+(배치는 행 전체, 스트리밍 갱신은 해당 행 1개).
+"""
+
+from bisect import bisect_right
+from typing import Dict, Iterable, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+
+class SpreadFilters:
+    """시세 정상성 규칙 (배열 일괄 적용 + 스트리밍 단일 행 적용)"""
+
+    ZERO_PRICE = 'zero_price'
+    MISSING_QUOTE = 'missing_quote'
+    STALE = 'stale'
+    SKEW = 'skew'
+    RATIO = 'ratio'
+    PRICE_TIER = 'price_tier'
+    MAX_SPREAD = 'max_spread'
+    RULES = (ZERO_PRICE, MISSING_QUOTE, STALE, SKEW, RATIO, PRICE_TIER, MAX_SPREAD)
+
+    DEFAULT_PRICE_TIERS = ((1000.0, 1.0), (10.0, 2.0), (0.1, 5.0), (0.0, 10.0))
+
+    def __init__(self, max_price_ratio: float = 10.0,
+                 price_tiers: Sequence[Tuple[float, float]] = DEFAULT_PRICE_TIERS,
+                 max_spread_pct: float = 5.0, max_quote_age: float = 0.0,
+                 max_skew: float = 0.0):
+        """
+        Args:
+            max_price_ratio: 두 거래소 가격 비율 상한 (심볼 매핑 오류/액면 분할 등)
+            price_tiers: (평균 가격 하한, 최대 허용 스프레드 %) 목록
+            max_spread_pct: 최종 스프레드 상한 (%)
+            max_quote_age: 시세 최대 경과 시간 (초, 0이면 미사용)
+            max_skew: 두 거래소 시세의 이벤트 시각 차이 상한 (초, 0이면 미사용)
+        """
+        self.max_price_ratio = max_price_ratio
+        self.max_spread_pct = max_spread_pct
+        self.max_quote_age = max_quote_age
+        self.max_skew = max_skew
+
+        tiers = sorted((float(floor), float(limit)) for floor, limit in price_tiers)
+        if not tiers or tiers[0][0] > 0:
+            tiers.insert(0, (0.0, np.inf))  # 가장 낮은 구간 아래는 제한 없음
+        self._tier_floors = np.array([floor for floor, _ in tiers])
+        self._tier_limits = np.array([limit for _, limit in tiers])
+        self._tier_floor_list = self._tier_floors.tolist()
+        self._tier_limit_list = self._tier_limits.tolist()
+
+        self.counts: Dict[str, int] = dict.fromkeys(self.RULES, 0)
+
+    @classmethod
+    def from_config(cls, config) -> 'SpreadFilters':
+        """FilterConfig → SpreadFilters"""
+        return cls(max_price_ratio=config.max_price_ratio,
+                   price_tiers=[tuple(tier) for tier in config.price_tiers],
+                   max_spread_pct=config.max_spread_pct,
+                   max_quote_age=config.max_quote_age_seconds,
+                   max_skew=config.max_skew_seconds)
+
+    def drain(self) -> Dict[str, int]:
+        """지난 호출 이후 규칙별 거부 수 (0인 규칙 제외) 반환 후 초기화"""
+        counts = {rule: count for rule, count in self.counts.items() if count}
+        self.counts = dict.fromkeys(self.RULES, 0)
+        return counts
+
+    def _count(self, rule: str, rejected: np.ndarray):
+        self.counts[rule] += int(np.count_nonzero(rejected))
+
+    def record(self, rules: Iterable[str]):
+        """단일 행 평가에서 제외를 일으킨 규칙 기록"""
+        for rule in rules:
+            self.counts[rule] += 1
+
+    def tier_limit(self, avg_price: np.ndarray) -> np.ndarray:
+        """평균 가격 → 가격대별 최대 허용 스프레드 (%)"""
+        index = np.searchsorted(self._tier_floors, avg_price, side='right') - 1
+        return self._tier_limits[np.clip(index, 0, None)]
+
+    # ----- 배열 일괄 적용 -----
+
+    def venue_mask(self, sell_px: np.ndarray, buy_px: np.ndarray,
+                   ages: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """(거래소, 행) 매도/매수 가격 → (매도 가능, 매수 가능) 마스크
+
+        NaN(미상장/미수신)은 0 가격으로 세지 않는다. 한쪽 호가만 없으면 missing_quote로 따로 센다.
+        """
+        sell_ok, buy_ok = sell_px > 0, buy_px > 0
+        with np.errstate(invalid='ignore'):
+            self._count(self.ZERO_PRICE, ((sell_px <= 0) | (buy_px <= 0)).any(axis=0))
+        sell_missing, buy_missing = np.isnan(sell_px), np.isnan(buy_px)
+        self._count(self.MISSING_QUOTE, (sell_missing ^ buy_missing).any(axis=0))
+
+        if ages is not None and self.max_quote_age > 0:
+            stale = (sell_ok | buy_ok) & (ages > self.max_quote_age)
+            self._count(self.STALE, stale.any(axis=0))
+            sell_ok &= ~stale
+            buy_ok &= ~stale
+        return sell_ok, buy_ok
+
+    def pair_mask(self, sell_px: np.ndarray, buy_px: np.ndarray, usable: np.ndarray,
+                  event_times: Optional[np.ndarray] = None,
+                  ref_px: Optional[np.ndarray] = None) -> np.ndarray:
+        """(매도, 매수, 행) 후보 쌍 중 시각 차이/가격 비율/가격대 규칙을 통과한 쌍
+
+        Args:
+            event_times: (거래소, 행) 거래소 이벤트 시각 (초, 모르면 NaN → 비교 생략)
+            ref_px: (거래소, 행) 비율/가격대 비교용 기준 가격 (없으면 매도/매수 가격)
+        """
+        if ref_px is None:
+            sell, buy = sell_px[:, None, :], buy_px[None, :, :]
+        else:
+            sell, buy = ref_px[:, None, :], ref_px[None, :, :]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            if event_times is not None and self.max_skew > 0:
+                skewed = usable & (np.abs(event_times[:, None, :] - event_times[None, :, :]) > self.max_skew)
+                self._count(self.SKEW, skewed.any(axis=(0, 1)))
+                usable = usable & ~skewed
+
+            low, high = np.minimum(sell, buy), np.maximum(sell, buy)
+
+            extreme = usable & (high > low * self.max_price_ratio)
+            self._count(self.RATIO, extreme.any(axis=(0, 1)))
+            usable = usable & ~extreme
+
+            gross = (high - low) / low * 100
+            unrealistic = usable & (gross > self.tier_limit((sell + buy) / 2))
+            self._count(self.PRICE_TIER, unrealistic.any(axis=(0, 1)))
+        return usable & ~unrealistic
+
+    def spread_mask(self, abs_spread: np.ndarray, valid: np.ndarray) -> np.ndarray:
+        """최종 스프레드 상한"""
+        too_wide = valid & (abs_spread > self.max_spread_pct)
+        self._count(self.MAX_SPREAD, too_wide)
+        return valid & ~too_wide
+
+    # ----- 스트리밍 단일 행 (같은 규칙, 스칼라 - 제외 규칙은 rejected에 모은 뒤 record) -----
+
+    def venue_ok(self, sell_price: float, buy_price: float, age: float,
+                 rejected: Set[str]) -> Tuple[bool, bool]:
+        """한 거래소의 (매도 가능, 매수 가능)"""
+        sell_ok, buy_ok = sell_price > 0, buy_price > 0
+        if sell_price <= 0 or buy_price <= 0:
+            rejected.add(self.ZERO_PRICE)
+        if (sell_price != sell_price) != (buy_price != buy_price):  # 한쪽만 NaN
+            rejected.add(self.MISSING_QUOTE)
+        if (sell_ok or buy_ok) and self.max_quote_age > 0 and age > self.max_quote_age:
+            rejected.add(self.STALE)
+            return False, False
+        return sell_ok, buy_ok
+
+    def pair_ok(self, sell_price: float, buy_price: float, rejected: Set[str],
+                skew: float = 0.0, sell_ref: Optional[float] = None,
+                buy_ref: Optional[float] = None) -> bool:
+        """skew: 두 시세의 이벤트 시각 차이 (초, NaN이면 비교 생략)
+        sell_ref/buy_ref: 비율/가격대 비교용 기준 가격 (없으면 매도/매수 가격)
+        """
+        if self.max_skew > 0 and skew > self.max_skew:
+            rejected.add(self.SKEW)
+            return False
+        if sell_ref is not None and buy_ref is not None:
+            sell_price, buy_price = sell_ref, buy_ref
+        low, high = min(sell_price, buy_price), max(sell_price, buy_price)
+        if high > low * self.max_price_ratio:
+            rejected.add(self.RATIO)
+            return False
+        avg_price = (sell_price + buy_price) / 2
+        limit = self._tier_limit_list[max(bisect_right(self._tier_floor_list, avg_price) - 1, 0)]
+        if (high - low) / low * 100 > limit:
+            rejected.add(self.PRICE_TIER)
+            return False
+        return True
+
+    def spread_ok(self, abs_spread: float, rejected: Set[str]) -> bool:
+        if abs_spread > self.max_spread_pct:
+            rejected.add(self.MAX_SPREAD)
+            return False
+        return True
@@ -1,12 +1,18 @@
 # arb_trading/core/spread_monitor.py (디버깅 강화 버전)
 import asyncio
 import time
-from typing import Dict, List, Optional, Tuple
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Union
 from dataclasses import dataclass
-from datetime import datetime
-from collections import defaultdict, deque
-from ..exchanges.base import BaseExchange, Ticker, Direction
+import numpy as np
+from ..exchanges.base import BaseExchange, FundingBatch, Ticker, TickerBatch, Direction
+from ..exchanges.streams import MarketDataStream
+from ..exchanges.hedging import deadline_scope
+from ..exchanges.resilience import CircuitOpenError
 from ..utils.performance import PerformanceMonitor
+from .spread_engine import SpreadEngine, SpreadTable
+from .spread_filters import SpreadFilters
+from .spread_stats import SpreadStats
+from .symbol_universe import SymbolUniverse
 import logging
 
 
@@ -21,6 +27,23 @@ class SpreadData:
     abs_spread_pct: float
     direction: Direction
     volume_24h: float
+    symbol_id: int = -1  # SymbolUniverse ID
+    sell_exchange: str = ""  # 최적 쌍: 매도(숏) 거래소
+    buy_exchange: str = ""  # 최적 쌍: 매수(롱) 거래소
+    sell_price: float = 0.0
+    buy_price: float = 0.0
+    carry_pct: float = 0.0  # 보유 기간 펀딩 캐리 (abs_spread_pct에 포함)
+
+
+@dataclass
+class UniverseDiff:
+    """심볼 유니버스 교체 내역"""
+    symbols: List[str]  # 새 유니버스 (거래대금 순)
+    added: List[str]
+    removed: List[str]
+
+
+SpreadSubscriber = Callable[[List[SpreadData]], Union[None, Awaitable[None]]]
 
 
 class SpreadMonitor:
@@ -29,94 +52,306 @@ class SpreadMonitor:
     def __init__(self, exchanges: Dict[str, BaseExchange],
                  min_volume_usdt: float = 5000000,
                  top_symbol_limit: int = 300,
-                 performance_monitor: Optional[PerformanceMonitor] = None):
+                 performance_monitor: Optional[PerformanceMonitor] = None,
+                 market_stream: Optional[MarketDataStream] = None,
+                 fetch_deadline: Optional[float] = None,
+                 universe: Optional[SymbolUniverse] = None,
+                 event_window: float = 0.0,
+                 symbols_ttl: float = 3600.0,
+                 volume_refresh_interval: float = 300.0,
+                 spread_mode: str = "last",
+                 min_net_edge_pct: float = 0.0,
+                 stats_window: int = 120,
+                 stats_halflife: float = 30.0,
+                 funding_horizon_hours: float = 0.0,
+                 funding_refresh_interval: float = 60.0,
+                 filters: Optional[SpreadFilters] = None):
 
         self.exchanges = exchanges
         self.min_volume_usdt = min_volume_usdt
         self.top_symbol_limit = top_symbol_limit
         self.performance_monitor = performance_monitor
+        self.market_stream = market_stream  # 스트리밍 모드 (None이면 REST 폴링)
+        self.fetch_deadline = fetch_deadline  # 시세 조회 마감 (초, None이면 세션 타임아웃만 적용)
+        self.universe = universe if universe is not None else SymbolUniverse()  # 심볼 ↔ 정수 ID (하위 구성요소 공유)
         self.logger = logging.getLogger(__name__)
 
         # 캐시된 데이터
         self._symbols_cache: Optional[List[str]] = None
+        self.active_ids = np.empty(0, dtype=np.intp)  # _symbols_cache와 같은 순서의 심볼 ID
+        self._active_volumes = np.empty(0)  # 심볼 선정 시 조회한 거래대금 재사용
         self._last_symbols_update = 0
-        self._symbols_cache_ttl = 3600  # 1시간
+        self._symbols_cache_ttl = symbols_ttl  # 상장 목록 갱신 주기 (기본 1시간)
+        self.volume_refresh_interval = volume_refresh_interval  # 거래대금 순위 갱신 주기
+        self._last_volume_update = 0
+        self._common_mask: Optional[np.ndarray] = None  # 마지막 상장 목록 기준 공통 심볼
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._universe_listeners: List[Callable[[UniverseDiff], None]] = []
+
+        # 벡터 스프레드 엔진 (심볼 유니버스가 바뀔 때만 인덱스 재구성)
+        self.spread_engine = SpreadEngine(
+            self.universe, mode=spread_mode,
+            fees={name: exchange.fee_schedule for name, exchange in exchanges.items()},
+            min_net_edge_pct=min_net_edge_pct,
+            venues=tuple(exchanges.keys()),
+            funding_horizon_hours=funding_horizon_hours,
+            filters=filters
+        )
+        self._engine_symbols: Optional[List[str]] = None
+
+        # 펀딩비 (캐리 계산용, 시세보다 느린 주기로 갱신하고 사이클 간 엔진에 캐시)
+        self.funding_refresh_interval = funding_refresh_interval
+        self._last_funding_update = 0.0
+        self._funding_task: Optional[asyncio.Task] = None
+
+        # 심볼별 롤링 스프레드 통계 (폴링 사이클마다 한 샘플)
+        self.spread_stats = SpreadStats(window=stats_window, ewma_halflife=stats_halflife)
+
+        # 심볼별 스프레드 이벤트 (스트리밍 모드)
+        self.event_window = event_window  # 마이크로배치 창 (초, 0이면 같은 루프 턴 안에서만 병합)
+        self._subscribers: List[SpreadSubscriber] = []
+        self._pending_ids: Dict[int, None] = {}  # 다음 이벤트로 보낼 심볼 ID (삽입 순서 유지)
+        self._pending_since: Optional[float] = None
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._subscriber_tasks = set()
+
+        # 스트리밍 모드: 티커 갱신마다 해당 심볼 순위만 조정
+        if self.market_stream:
+            self.market_stream.board.add_listener(self._on_ticker_update)
+
+    def subscribe(self, callback: 'SpreadSubscriber'):
+        """심볼별 스프레드 변경 구독
+
+        가격이 바뀐 심볼의 SpreadData 목록으로 호출된다 (event_window 동안 병합).
+        코루틴 함수면 태스크로 실행한다.
+        """
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: 'SpreadSubscriber'):
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def _on_ticker_update(self, exchange: str, ticker: Ticker):
+        """티커 보드 갱신 → 스프레드 엔진 증분 갱신 → 이벤트 예약"""
+        symbol_id = self.universe.native_id(exchange, ticker.symbol)
+        if symbol_id is None:
+            return
+        if not self.spread_engine.update_quote(exchange, symbol_id, ticker.last_price,
+                                               ticker.bid, ticker.ask, ticker.timestamp):
+            return
+        if not self._subscribers or not self.spread_engine.primed:
+            return
+
+        self._pending_ids[symbol_id] = None
+        if self._flush_handle is not None:
+            return  # 이미 예약된 배치에 합류
+
+        self._pending_since = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._flush_events()  # 이벤트 루프 밖 (동기 호출)
+            return
+        if self.event_window > 0:
+            self._flush_handle = loop.call_later(self.event_window, self._flush_events)
+        else:
+            self._flush_handle = loop.call_soon(self._flush_events)
+
+    def _flush_events(self):
+        """병합된 심볼 변경을 구독자에게 전달"""
+        self._flush_handle = None
+        symbol_ids, self._pending_ids = self._pending_ids, {}
+        if not symbol_ids:
+            return
+
+        changed = [spread for spread in map(self.spread_engine.spread_of, symbol_ids)
+                   if spread is not None]
+        if self.performance_monitor and self._pending_since is not None:
+            self.performance_monitor.record_spread_event(
+                len(symbol_ids), time.perf_counter() - self._pending_since
+            )
+        if not changed:
+            return
+
+        for callback in list(self._subscribers):
+            try:
+                result = callback(changed)
+                if asyncio.iscoroutine(result):
+                    task = asyncio.ensure_future(result)
+                    self._subscriber_tasks.add(task)
+                    task.add_done_callback(self._on_subscriber_done)
+            except Exception as e:
+                self.logger.error(f"스프레드 이벤트 구독자 오류: {e}")
+
+    def _on_subscriber_done(self, task: asyncio.Task):
+        self._subscriber_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.error(f"스프레드 이벤트 구독자 오류: {task.exception()}")
+
+    def close(self):
+        """백그라운드 갱신/예약된 이벤트/구독자 태스크 정리"""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        if self._funding_task is not None:
+            self._funding_task.cancel()
+            self._funding_task = None
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending_ids.clear()
+        for task in list(self._subscriber_tasks):
+            task.cancel()
+        self._subscriber_tasks.clear()
+
+    def _stream_ready(self) -> bool:
+        """모든 거래소가 스트림으로 갱신 중이고 엔진 상태가 적재됐는지"""
+        return (self.market_stream is not None and self.spread_engine.primed and
+                all(self.market_stream.is_live(name) for name in self.exchanges))
 
     async def get_common_symbols(self) -> List[str]:
-        """공통 거래 가능 심볼 조회 (캐시 활용)"""
-        now = time.time()
+        """공통 거래 가능 심볼 조회 (캐시 활용)
+
+        최초 1회만 조회를 기다리고, 이후 만료 시에는 이전 유니버스를 그대로 반환하면서
+        백그라운드에서 갱신한다 (stale-while-revalidate).
+        """
+        if self._symbols_cache is None:
+            await self._refresh_universe(refresh_listings=True)
+            if self._symbols_cache is None:
+                self._symbols_cache = []
+        else:
+            self._schedule_universe_refresh()
 
-        if (self._symbols_cache is None or
-                now - self._last_symbols_update > self._symbols_cache_ttl):
+        return self._symbols_cache
 
-            start_time = time.time()
+    def add_universe_listener(self, listener: Callable[['UniverseDiff'], None]):
+        """유니버스 교체 리스너 등록 (추가/제외 심볼이 있을 때 호출)"""
+        self._universe_listeners.append(listener)
 
-            try:
-                # 모든 거래소에서 심볼 목록 동시 조회
+    def _schedule_universe_refresh(self):
+        """만료된 항목이 있으면 백그라운드 갱신 시작 (진행 중이면 무시)"""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+
+        now = time.time()
+        listings_due = now - self._last_symbols_update > self._symbols_cache_ttl
+        volumes_due = now - self._last_volume_update > self.volume_refresh_interval
+        if listings_due or volumes_due:
+            self._refresh_task = asyncio.create_task(
+                self._refresh_universe(refresh_listings=listings_due)
+            )
+
+    async def _refresh_universe(self, refresh_listings: bool):
+        """상장 목록(선택) + 거래대금 조회 → 상위 심볼 선정 → 원자적 교체"""
+        start_time = time.time()
+
+        try:
+            if refresh_listings or self._common_mask is None:
+                # 모든 거래소에서 심볼 목록과 거래량을 동시 조회 (서로 독립)
                 tasks = []
                 for name, exchange in self.exchanges.items():
                     tasks.append(self._fetch_symbols_with_name(name, exchange))
 
-                results = await asyncio.gather(*tasks, return_exceptions=True)
+                results, volumes = await asyncio.gather(
+                    asyncio.gather(*tasks, return_exceptions=True),
+                    self._get_volumes_data()
+                )
 
-                # 결과 처리
-                exchange_symbols = {}
+                # 결과 처리: 상장 심볼을 유니버스 ID로 등록
+                exchange_ids = {}
                 for result in results:
                     if isinstance(result, Exception):
                         self.logger.error(f"심볼 조회 실패: {result}")
                         continue
                     name, symbols = result
-                    exchange_symbols[name] = set(symbols)
+                    exchange_ids[name] = self.universe.register_exchange(
+                        name, symbols, self.exchanges[name].normalize_symbol
+                    )
                     self.logger.debug(f"{name} 심볼 수: {len(symbols)}")
 
-                if len(exchange_symbols) < 2:
+                if len(exchange_ids) < 2:
                     raise Exception("최소 2개 거래소의 심볼이 필요합니다")
 
-                # 공통 심볼 찾기
-                common_symbols = set.intersection(*exchange_symbols.values())
-                self.logger.info(f"거래소간 공통 심볼: {len(common_symbols)}개")
-
-                # 거래량 기준 필터링
+                # 공통 심볼 찾기 (ID 마스크 교집합)
+                self._common_mask = np.logical_and.reduce(
+                    [self.universe.membership(ids) for ids in exchange_ids.values()]
+                )
+                self.logger.info(f"거래소간 공통 심볼: {int(self._common_mask.sum())}개")
+            else:
+                # 거래대금 순위만 갱신 (상장 목록 재사용)
                 volumes = await self._get_volumes_data()
 
-                # 거래량 조건을 만족하는 심볼들
-                volume_filtered = []
-                for s in common_symbols:
-                    max_volume = max(
-                        volumes.get(exchange_name, {}).get(s, 0)
-                        for exchange_name in volumes.keys()
-                    )
-                    if max_volume >= self.min_volume_usdt:
-                        volume_filtered.append(s)
+            if not volumes:
+                raise Exception("거래대금 데이터를 조회할 수 없습니다")
 
-                self.logger.info(f"거래량 조건 통과: {len(volume_filtered)}개 (최소: {self.min_volume_usdt:,} USDT)")
+            # 거래소별 거래대금 중 최댓값 (ID 인덱스)
+            max_volume = np.zeros(len(self.universe))
+            for exchange_name, volume_data in volumes.items():
+                max_volume = np.maximum(
+                    max_volume, self.universe.scatter_dict(exchange_name, volume_data)
+                )
 
-                # 거래량 기준 정렬 후 상위 N개 선택
-                def get_max_volume(symbol):
-                    return max(volumes.get(exchange_name, {}).get(symbol, 0)
-                               for exchange_name in volumes.keys())
+            common_mask = np.zeros(len(self.universe), dtype=bool)
+            common_mask[:len(self._common_mask)] = self._common_mask
 
-                volume_ranked = sorted(volume_filtered, key=get_max_volume, reverse=True)
-                self._symbols_cache = volume_ranked[:self.top_symbol_limit]
-                self._last_symbols_update = now
+            # 거래량 조건을 만족하는 심볼들
+            volume_filtered = np.flatnonzero(common_mask & (max_volume >= self.min_volume_usdt))
+            self.logger.info(f"거래량 조건 통과: {len(volume_filtered)}개 (최소: {self.min_volume_usdt:,} USDT)")
 
-                if self.performance_monitor:
-                    self.performance_monitor.record_fetch_time(time.time() - start_time)
+            # 거래량 기준 정렬 후 상위 N개 선택
+            ranked = volume_filtered[np.argsort(-max_volume[volume_filtered], kind='stable')]
+            active_ids = ranked[:self.top_symbol_limit]
+            self._swap_universe(active_ids, max_volume[active_ids])
 
-                self.logger.info(f"최종 사용 심볼: {len(self._symbols_cache)}개")
+            now = time.time()
+            if refresh_listings:
+                self._last_symbols_update = now
+            self._last_volume_update = now
 
-                # 상위 10개 심볼과 거래량 출력 (디버깅용)
-                self.logger.debug("상위 10개 심볼:")
-                for i, symbol in enumerate(self._symbols_cache[:10]):
-                    volume = get_max_volume(symbol)
-                    self.logger.debug(f"  {i + 1}. {symbol}: {volume:,.0f} USDT")
+            if self.performance_monitor:
+                self.performance_monitor.record_fetch_time(time.time() - start_time)
 
-            except Exception as e:
-                self.logger.error(f"심볼 조회 중 오류: {e}")
-                if self._symbols_cache is None:
-                    self._symbols_cache = []
+            # 상위 10개 심볼과 거래량 출력 (디버깅용)
+            self.logger.debug("상위 10개 심볼:")
+            for i, symbol in enumerate(self._symbols_cache[:10]):
+                self.logger.debug(f"  {i + 1}. {symbol}: {self._active_volumes[i]:,.0f} USDT")
 
-        return self._symbols_cache
+        except Exception as e:
+            # 실패 시 이전 유니버스 유지
+            self.logger.error(f"심볼 조회 중 오류: {e}")
+
+    def _swap_universe(self, active_ids: np.ndarray, volumes: np.ndarray):
+        """새 유니버스로 교체 (await 없이 한 번에) + 변경분 알림"""
+        previous = self._symbols_cache
+        symbols = [self.universe.symbols[i] for i in active_ids]
+
+        self.active_ids = active_ids
+        self._active_volumes = volumes
+        self._symbols_cache = symbols
+
+        if previous is None:
+            self.logger.info(f"최종 사용 심볼: {len(symbols)}개")
+            return
+
+        previous_set = set(previous)
+        current_set = set(symbols)
+        diff = UniverseDiff(
+            symbols=symbols,
+            added=[symbol for symbol in symbols if symbol not in previous_set],
+            removed=[symbol for symbol in previous if symbol not in current_set]
+        )
+        if not diff.added and not diff.removed:
+            return
+
+        self.logger.info(
+            f"🔄 심볼 유니버스 갱신: {len(symbols)}개 "
+            f"(+{len(diff.added)} {diff.added[:5]}, -{len(diff.removed)} {diff.removed[:5]})"
+        )
+        for listener in self._universe_listeners:
+            try:
+                listener(diff)
+            except Exception as e:
+                self.logger.error(f"유니버스 리스너 오류: {e}")
 
     async def _fetch_symbols_with_name(self, name: str, exchange: BaseExchange) -> Tuple[str, List[str]]:
         """거래소별 심볼 조회 (이름 포함)"""
@@ -153,44 +388,58 @@ class SpreadMonitor:
         volumes = await exchange.fetch_24h_volumes()
         return name, volumes
 
-    def _validate_price_pair(self, symbol: str, binance_price: float, bybit_price: float) -> bool:
-        """가격 쌍 유효성 검사"""
-        # 기본 검사
-        if binance_price <= 0 or bybit_price <= 0:
-            self.logger.warning(f"{symbol}: 유효하지 않은 가격 - B:{binance_price}, Y:{bybit_price}")
-            return False
-
-        # 극단적 차이 검사 (10배 이상 차이)
-        ratio = max(binance_price, bybit_price) / min(binance_price, bybit_price)
-        if ratio > 10.0:
-            self.logger.warning(f"{symbol}: 극단적 가격 차이 - B:{binance_price}, Y:{bybit_price} (비율: {ratio:.2f})")
-            return False
-
-        # 가격대별 현실성 검사
-        avg_price = (binance_price + bybit_price) / 2
-        spread_pct = abs(binance_price - bybit_price) / min(binance_price, bybit_price) * 100
-
-        # 가격대별 최대 허용 스프레드
-        if avg_price >= 1000:  # 고가 코인 (BTC 등)
-            max_spread = 1.0  # 1%
-        elif avg_price >= 10:  # 중가 코인 (ETH 등)
-            max_spread = 2.0  # 2%
-        elif avg_price >= 0.1:  # 저가 코인
-            max_spread = 5.0  # 5%
-        else:  # 극저가 코인
-            max_spread = 10.0  # 10%
-
-        if spread_pct > max_spread:
-            self.logger.warning(
-                f"{symbol}: 비현실적 스프레드 - B:{binance_price}, Y:{bybit_price} "
-                f"({spread_pct:.2f}% > 최대 {max_spread}%)"
-            )
-            return False
+    async def _ensure_funding(self):
+        """펀딩비 갱신 (최초 1회만 대기, 이후 만료 시 백그라운드 갱신)"""
+        if self.spread_engine.funding_horizon_hours <= 0:
+            return
+        if time.time() - self._last_funding_update < self.funding_refresh_interval:
+            return
 
-        return True
+        if not self._last_funding_update:
+            await self._refresh_funding()
+        elif self._funding_task is None or self._funding_task.done():
+            self._funding_task = asyncio.create_task(self._refresh_funding())
 
-    async def fetch_spread_data(self) -> List[SpreadData]:
-        """스프레드 데이터 조회 (상세 성능 로깅)"""
+    async def _refresh_funding(self):
+        """모든 거래소 펀딩비 조회 → 엔진 캐리 갱신 (실패한 거래소는 이전 값 유지)"""
+        tasks = []
+        for name, exchange in self.exchanges.items():
+            tasks.append(self._fetch_funding_with_name(name, exchange))
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        now_ms = int(time.time() * 1000)
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.warning(f"펀딩비 조회 실패: {result}")
+                continue
+            name, batch = result
+            self.spread_engine.set_funding(name, batch, now_ms)
+            self.logger.debug(f"{name} 펀딩비: {len(batch)}개")
+
+        # 실패해도 다음 주기까지는 재시도하지 않음 (매 사이클 요청 방지)
+        self._last_funding_update = time.time()
+
+    async def _fetch_funding_with_name(self, name: str, exchange: BaseExchange) -> Tuple[str, FundingBatch]:
+        """거래소별 펀딩비 조회 (이름 포함)"""
+        if self.performance_monitor:
+            self.performance_monitor.record_api_call(name)
+
+        batch = await exchange.fetch_funding_rates()
+        return name, batch
+
+    def _record_filter_rejections(self):
+        """사이클 동안 쌓인 시세 필터 제외 수 → 성능 모니터"""
+        rejections = self.spread_engine.filters.drain()
+        if rejections and self.performance_monitor:
+            self.performance_monitor.record_filter_rejections(rejections)
+
+    async def fetch_spread_data(self) -> Sequence[SpreadData]:
+        """스프레드 데이터 조회 (상세 성능 로깅)
+
+        Returns:
+            abs_spread_pct 내림차순 SpreadTable (읽는 행만 SpreadData로 생성)
+        """
         cycle_start_time = time.time()
 
         try:
@@ -201,81 +450,59 @@ class SpreadMonitor:
             # 공통 심볼 조회
             symbols = await self.get_common_symbols()
             if not symbols:
-                return []
+                return SpreadTable.empty()
+
+            if symbols is not self._engine_symbols:
+                self.spread_engine.set_active(self.active_ids, self._active_volumes)
+                self._engine_symbols = symbols
+
+            await self._ensure_funding()
+
+            # 스트리밍 모드: 리스너가 이미 반영한 순위를 그대로 사용 (조회/전체 재계산 없음)
+            if self._stream_ready():
+                calc_start_time = time.time()
+                spread_list = self.spread_engine.snapshot()
+                self.spread_stats.update_many(*self.spread_engine.samples())
+                self._record_filter_rejections()
+                if self.performance_monitor:
+                    self.performance_monitor.record_spread_calc_time(
+                        time.time() - calc_start_time, len(spread_list)
+                    )
+                return spread_list
 
             # 데이터 페치 시작
             fetch_start_time = time.time()
 
             # 모든 거래소에서 가격 데이터 동시 조회 (개별 타이밍 측정)
-            tasks = []
-            for name, exchange in self.exchanges.items():
-                tasks.append(self._fetch_tickers_with_timing(name, exchange))
+            # 마감을 넘긴 거래소는 실패 처리되어 느린 한 곳이 사이클 전체를 붙잡지 않음
+            with deadline_scope(self.fetch_deadline):
+                tasks = []
+                for name, exchange in self.exchanges.items():
+                    tasks.append(self._fetch_tickers_with_timing(name, exchange))
 
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+                results = await asyncio.gather(*tasks, return_exceptions=True)
 
             fetch_end_time = time.time()
             fetch_duration = fetch_end_time - fetch_start_time
 
             # 가격 데이터 정리
-            exchange_prices = {}
+            exchange_batches = {}
             for result in results:
                 if isinstance(result, Exception):
                     self.logger.error(f"가격 조회 실패: {result}")
                     continue
-                name, tickers = result
-                exchange_prices[name] = {symbol: ticker.last_price for symbol, ticker in tickers.items()}
+                name, batch = result
+                exchange_batches[name] = batch
 
-            if len(exchange_prices) < 2:
+            if len(exchange_batches) < 2:
                 self.logger.warning("충분한 가격 데이터를 조회할 수 없습니다")
-                return []
+                return SpreadTable.empty()
 
             # 스프레드 계산 시작
             calc_start_time = time.time()
-            spread_list = []
-
-            for symbol in symbols:
-                # 가격 데이터 수집
-                prices = {}
-                for exchange_name in exchange_prices:
-                    if symbol in exchange_prices[exchange_name]:
-                        prices[exchange_name] = exchange_prices[exchange_name][symbol]
-
-                if len(prices) < 2:
-                    continue
-
-                # 바이낸스와 바이빗 가격
-                binance_price = prices.get('binance')
-                bybit_price = prices.get('bybit')
-
-                if binance_price and bybit_price and binance_price > 0 and bybit_price > 0:
-                    # 스프레드 계산
-                    higher_price = max(binance_price, bybit_price)
-                    lower_price = min(binance_price, bybit_price)
-                    abs_spread_pct = (higher_price - lower_price) / lower_price * 100
-
-                    # 방향성 고려
-                    if binance_price > bybit_price:
-                        spread_pct = abs_spread_pct
-                        direction = Direction.BINANCE_GT_BYBIT
-                    else:
-                        spread_pct = -abs_spread_pct
-                        direction = Direction.BYBIT_GT_BINANCE
-
-                    # 현실적인 스프레드만 포함 (5% 이하)
-                    if abs_spread_pct <= 5.0:
-                        spread_list.append(SpreadData(
-                            timestamp=datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S"),
-                            symbol=symbol,
-                            binance_price=binance_price,
-                            bybit_price=bybit_price,
-                            spread_pct=spread_pct,
-                            abs_spread_pct=abs_spread_pct,
-                            direction=direction,
-                            volume_24h=0.0
-                        ))
-
-            # 절대값 스프레드 기준으로 정렬
-            spread_list.sort(key=lambda x: x.abs_spread_pct, reverse=True)
+            spread_list = self.spread_engine.compute(exchange_batches)
+            self.spread_stats.update_many(*self.spread_engine.samples())
+            self._record_filter_rejections()
 
             calc_end_time = time.time()
             calc_duration = calc_end_time - calc_start_time
@@ -295,17 +522,33 @@ class SpreadMonitor:
             self.logger.error(f"스프레드 데이터 조회 실패: {e}")
             if self.performance_monitor:
                 self.performance_monitor.record_error("spread_fetch_error")
-            return []
+            return SpreadTable.empty()
 
-    async def _fetch_tickers_with_timing(self, name: str, exchange: BaseExchange) -> Tuple[str, Dict[str, Ticker]]:
-        """거래소별 티커 조회 (타이밍 측정)"""
+    async def _fetch_tickers_with_timing(self, name: str, exchange: BaseExchange) -> Tuple[str, TickerBatch]:
+        """거래소별 티커 컬럼 조회 (타이밍 측정)"""
         start_time = time.time()
 
+        # 스트리밍 모드: 살아있는 스트림이면 보드에서 바로 읽음
+        if self.market_stream:
+            tickers = self.market_stream.get_tickers(name)
+            if tickers is not None:
+                if self.performance_monitor:
+                    self.performance_monitor.record_exchange_fetch(
+                        name, "stream", time.time() - start_time, success=True
+                    )
+                return name, TickerBatch.from_tickers(tickers)
+
+        # 회로 차단 중인 거래소는 이번 사이클에서 제외 (요청 없이 즉시 실패)
+        if exchange.circuit_breaker.is_open:
+            if self.performance_monitor:
+                self.performance_monitor.record_error("circuit_open")
+            raise CircuitOpenError(f"{name} 회로 차단 중 → 이번 사이클 제외")
+
         try:
             if self.performance_monitor:
                 self.performance_monitor.record_api_call(name)
 
-            tickers = await exchange.fetch_tickers()
+            batch = await exchange.fetch_ticker_batch(quotes=self.spread_engine.needs_quotes)
 
             duration = time.time() - start_time
             if self.performance_monitor:
@@ -313,7 +556,7 @@ class SpreadMonitor:
                     name, "tickers", duration, success=True
                 )
 
-            return name, tickers
+            return name, batch
 
         except Exception as e:
             duration = time.time() - start_time
@@ -322,11 +565,3 @@ class SpreadMonitor:
                     name, "tickers", duration, success=False, error_msg=str(e)
                 )
             raise
-
-    async def _fetch_tickers_with_name(self, name: str, exchange: BaseExchange) -> Tuple[str, Dict[str, Ticker]]:
-        """거래소별 티커 조회 (이름 포함)"""
-        if self.performance_monitor:
-            self.performance_monitor.record_api_call(name)
-
-        tickers = await exchange.fetch_tickers()
-        return name, tickers
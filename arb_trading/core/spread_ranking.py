@@ -0,0 +1,221 @@
+# arb_trading/core/spread_ranking.py
+"""스프레드 순위 구조
+
+소비자는 상위 몇 개(표시/Top1)와 임계값 이상 구간만 읽으므로 매 사이클 전체 정렬 대신
+질의에 필요한 만큼만 순서를 만든다. 두 구현은 같은 질의 인터페이스를 가진다.
+
+- VectorRanking: REST 배치 결과용 (NumPy, 전체 정렬 없이 부분 선택)
+- SpreadRanking: 스트리밍용 인덱스 힙 (심볼 ID 단위 O(log n) 갱신)
+
+키는 SymbolUniverse 심볼 ID, 점수는 abs_spread_pct이며 동률은 tie 값이 작은 쪽
+(활성 심볼 순서 = 거래대금 순)이 앞선다.
+"""
+
+import heapq
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+class VectorRanking:
+    """배치 계산 결과의 지연 순위 (NumPy)"""
+
+    def __init__(self, keys: np.ndarray, scores: np.ndarray):
+        """
+        Args:
+            keys: 심볼 ID (배열 순서가 동률 우선순위)
+            scores: keys와 같은 순서의 점수
+        """
+        self._keys = keys
+        self._scores = scores
+        self._order: Optional[np.ndarray] = None  # 전체 정렬 (필요할 때만)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _stable_desc(self, positions: np.ndarray) -> np.ndarray:
+        return positions[np.argsort(-self._scores[positions], kind='stable')]
+
+    def top(self, k: int) -> np.ndarray:
+        """점수 상위 k개 키 (내림차순)"""
+        n = len(self._keys)
+        if k <= 0 or n == 0:
+            return self._keys[:0]
+        if k >= n or self._order is not None:
+            if self._order is None:
+                self._order = self._stable_desc(np.arange(n))
+            return self._keys[self._order[:k]]
+
+        # k번째 점수 이상인 후보만 정렬 (동률 후보 포함 → 안정 정렬 결과와 동일)
+        kth = -np.partition(-self._scores, k - 1)[k - 1]
+        candidates = np.flatnonzero(self._scores >= kth)
+        return self._keys[self._stable_desc(candidates)[:k]]
+
+    def count_above(self, threshold: float) -> int:
+        """점수 >= threshold 인 키 수"""
+        return int(np.count_nonzero(self._scores >= threshold))
+
+    def above(self, threshold: float) -> np.ndarray:
+        """점수 >= threshold 인 키 (내림차순)"""
+        return self._keys[self._stable_desc(np.flatnonzero(self._scores >= threshold))]
+
+
+class SpreadRanking:
+    """심볼 ID로 인덱싱되는 최대 힙
+
+    가격이 바뀐 심볼만 update()로 위치를 조정하고,
+    top(k)는 O(k log k), above(threshold)는 결과 m개에 대해 O(m log m)로 답한다.
+    """
+
+    def __init__(self):
+        self._heap: List[int] = []  # 힙 배열 (심볼 ID)
+        self._pos: Dict[int, int] = {}  # 심볼 ID → 힙 위치
+        self._score: Dict[int, float] = {}
+        self._tie: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._pos
+
+    def score(self, key: int) -> Optional[float]:
+        return self._score.get(key)
+
+    def _higher(self, a: int, b: int) -> bool:
+        score_a, score_b = self._score[a], self._score[b]
+        return score_a > score_b or (score_a == score_b and self._tie[a] < self._tie[b])
+
+    def _place(self, key: int, index: int):
+        self._heap[index] = key
+        self._pos[key] = index
+
+    def _sift_up(self, index: int):
+        heap = self._heap
+        key = heap[index]
+        while index > 0:
+            parent = (index - 1) >> 1
+            if not self._higher(key, heap[parent]):
+                break
+            self._place(heap[parent], index)
+            index = parent
+        self._place(key, index)
+
+    def _sift_down(self, index: int):
+        heap = self._heap
+        size = len(heap)
+        key = heap[index]
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            right = child + 1
+            if right < size and self._higher(heap[right], heap[child]):
+                child = right
+            if not self._higher(heap[child], key):
+                break
+            self._place(heap[child], index)
+            index = child
+        self._place(key, index)
+
+    def update(self, key: int, score: float, tie: Optional[int] = None):
+        """점수 추가/변경 (O(log n))"""
+        index = self._pos.get(key)
+        if index is None:
+            self._score[key] = score
+            self._tie[key] = key if tie is None else tie
+            self._heap.append(key)
+            self._pos[key] = len(self._heap) - 1
+            self._sift_up(len(self._heap) - 1)
+            return
+
+        previous = (self._score[key], self._tie[key])
+        self._score[key] = score
+        if tie is not None:
+            self._tie[key] = tie
+        if (score, self._tie[key]) != previous:
+            # 점수가 같아도 tie가 바뀌면 순서가 달라질 수 있음 (한쪽으로만 이동하므로 둘 다 시도)
+            self._sift_up(index)
+            self._sift_down(self._pos[key])
+
+    def discard(self, key: int):
+        """키 제거 (없으면 무시)"""
+        index = self._pos.pop(key, None)
+        if index is None:
+            return
+        del self._score[key]
+        del self._tie[key]
+
+        last = self._heap.pop()
+        if index < len(self._heap):
+            self._place(last, index)
+            self._sift_up(index)
+            self._sift_down(self._pos[last])
+
+    def rebuild(self, keys: Sequence[int], scores: Sequence[float], ties: Optional[Sequence[int]] = None):
+        """전체 재구성 (O(n) heapify)"""
+        self._heap = [int(key) for key in keys]
+        self._score = dict(zip(self._heap, map(float, scores)))
+        self._tie = dict(zip(self._heap, map(int, ties))) if ties is not None else {k: k for k in self._heap}
+        self._pos = {key: i for i, key in enumerate(self._heap)}
+        for index in range(len(self._heap) // 2 - 1, -1, -1):
+            self._sift_down(index)
+
+    def clear(self):
+        self._heap.clear()
+        self._pos.clear()
+        self._score.clear()
+        self._tie.clear()
+
+    def copy(self) -> 'SpreadRanking':
+        """현재 순위 스냅샷 (이후 갱신과 분리)"""
+        ranking = SpreadRanking()
+        ranking._heap = list(self._heap)
+        ranking._pos = dict(self._pos)
+        ranking._score = dict(self._score)
+        ranking._tie = dict(self._tie)
+        return ranking
+
+    def _walk(self, limit: Optional[int] = None, threshold: Optional[float] = None) -> List[int]:
+        """힙을 위에서부터 점수 순으로 탐색 (방문한 노드의 자식만 후보로 추가)"""
+        heap = self._heap
+        result: List[int] = []
+        if not heap:
+            return result
+
+        frontier = [(-self._score[heap[0]], self._tie[heap[0]], 0)]
+        while frontier and (limit is None or len(result) < limit):
+            neg_score, _, index = heapq.heappop(frontier)
+            if threshold is not None and -neg_score < threshold:
+                break  # 이후 후보는 모두 더 작음
+            result.append(heap[index])
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(heap):
+                    key = heap[child]
+                    heapq.heappush(frontier, (-self._score[key], self._tie[key], child))
+        return result
+
+    def top(self, k: int) -> List[int]:
+        """점수 상위 k개 키 (내림차순, O(k log k))"""
+        if k <= 0:
+            return []
+        return self._walk(limit=k)
+
+    def above(self, threshold: float) -> List[int]:
+        """점수 >= threshold 인 키 (내림차순)"""
+        return self._walk(threshold=threshold)
+
+    def count_above(self, threshold: float) -> int:
+        """점수 >= threshold 인 키 수 (임계값 미만 하위 트리는 방문하지 않음)"""
+        heap, score = self._heap, self._score
+        count = 0
+        stack = [0] if heap else []
+        while stack:
+            index = stack.pop()
+            if score[heap[index]] < threshold:
+                continue
+            count += 1
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(heap):
+                    stack.append(child)
+        return count
@@ -0,0 +1,245 @@
+# arb_trading/core/spread_stats.py
+"""심볼별 롤링 스프레드 통계
+
+SymbolUniverse ID로 인덱싱되는 고정 길이 링 버퍼에 스프레드 샘플을 쌓고,
+창 합계/EWMA/lag-1 회귀 합계를 증분 갱신해 창 길이와 무관하게 샘플당 O(1)로 유지한다.
+조회는 전체 심볼 배열(ID 인덱스)로 돌려준다.
+
+- 창 평균/표준편차: 링 버퍼에서 빠지는 값을 빼는 누적 합
+- EWMA 평균/분산: 지수 가중 (반감기 = 샘플 수)
+- z-score: (최근 값 - EWMA 평균) / EWMA 표준편차
+- 반감기: 창 안 AR(1) 회귀 x[t] = a + φ·x[t-1] 에서 -ln2 / ln φ (평균회귀 속도, 샘플 수)
+"""
+
+from typing import Optional
+
+import numpy as np
+
+
+class SpreadStats:
+    """심볼 ID별 스프레드 통계 (링 버퍼 + 증분 합계)"""
+
+    def __init__(self, window: int = 120, ewma_halflife: float = 30.0,
+                 min_periods: int = 10, initial_size: int = 256):
+        """
+        Args:
+            window: 심볼별 링 버퍼 길이 (창 평균/표준편차/반감기 계산 구간)
+            ewma_halflife: EWMA 가중치가 절반이 되는 샘플 수
+            min_periods: z-score/반감기를 내기 위한 최소 샘플 수
+        """
+        if window < 2:
+            raise Exception(f"통계 창은 2 이상이어야 합니다: {window}")
+
+        self.window = window
+        self.ewma_halflife = ewma_halflife
+        self.alpha = 1.0 - 0.5 ** (1.0 / ewma_halflife)
+        self.min_periods = min_periods
+
+        self._buffer = np.zeros((initial_size, window))
+        self._heads = np.zeros(initial_size, dtype=np.intp)  # 다음 기록 위치
+        self._counts = np.zeros(initial_size, dtype=np.intp)
+        self._last = np.full(initial_size, np.nan)
+        # 창 합계: Σx, Σx²
+        self._sum = np.zeros(initial_size)
+        self._sumsq = np.zeros(initial_size)
+        # 창 안 연속 쌍 (x[t-1], x[t]) 합계: Σx[t-1], Σx[t], Σx[t-1]², Σx[t-1]·x[t]
+        self._lag_x = np.zeros(initial_size)
+        self._lag_y = np.zeros(initial_size)
+        self._lag_xx = np.zeros(initial_size)
+        self._lag_xy = np.zeros(initial_size)
+        # EWMA
+        self._ewma_mean = np.zeros(initial_size)
+        self._ewma_var = np.zeros(initial_size)
+
+    def __len__(self) -> int:
+        """ID 인덱스 배열 길이 (유니버스보다 클 수 있음)"""
+        return len(self._heads)
+
+    def _ensure(self, symbol_id: int):
+        size = len(self._heads)
+        if symbol_id < size:
+            return
+        new_size = max(symbol_id + 1, size * 2)
+        extra = new_size - size
+
+        buffer = np.zeros((new_size, self.window))
+        buffer[:size] = self._buffer
+        self._buffer = buffer
+        self._heads = np.concatenate([self._heads, np.zeros(extra, dtype=np.intp)])
+        self._counts = np.concatenate([self._counts, np.zeros(extra, dtype=np.intp)])
+        self._last = np.concatenate([self._last, np.full(extra, np.nan)])
+        for name in ('_sum', '_sumsq', '_lag_x', '_lag_y', '_lag_xx', '_lag_xy',
+                     '_ewma_mean', '_ewma_var'):
+            setattr(self, name, np.concatenate([getattr(self, name), np.zeros(extra)]))
+
+    def update(self, symbol_id: int, value: float):
+        """단일 심볼 샘플 추가 (O(1), 스칼라 연산 - update_many와 같은 규칙)"""
+        self._ensure(symbol_id)
+        window = self.window
+        head = int(self._heads[symbol_id])
+        count = int(self._counts[symbol_id])
+        row = self._buffer[symbol_id]
+        value = float(value)
+
+        if count >= window:
+            evicted, evicted_next = float(row[head]), float(row[(head + 1) % window])
+            self._sum[symbol_id] -= evicted
+            self._sumsq[symbol_id] -= evicted * evicted
+            self._lag_x[symbol_id] -= evicted
+            self._lag_y[symbol_id] -= evicted_next
+            self._lag_xx[symbol_id] -= evicted * evicted
+            self._lag_xy[symbol_id] -= evicted * evicted_next
+
+        self._sum[symbol_id] += value
+        self._sumsq[symbol_id] += value * value
+        if count > 0:
+            previous = float(row[(head - 1) % window])
+            self._lag_x[symbol_id] += previous
+            self._lag_y[symbol_id] += value
+            self._lag_xx[symbol_id] += previous * previous
+            self._lag_xy[symbol_id] += previous * value
+
+            mean = float(self._ewma_mean[symbol_id])
+            delta = value - mean
+            self._ewma_mean[symbol_id] = mean + self.alpha * delta
+            self._ewma_var[symbol_id] = (1.0 - self.alpha) * (
+                float(self._ewma_var[symbol_id]) + self.alpha * delta * delta)
+        else:
+            self._ewma_mean[symbol_id] = value
+            self._ewma_var[symbol_id] = 0.0
+
+        row[head] = value
+        head = (head + 1) % window
+        self._heads[symbol_id] = head
+        self._counts[symbol_id] = min(count + 1, window)
+        self._last[symbol_id] = value
+
+        if head == 0 and count + 1 >= window:
+            self._resum(np.array([symbol_id], dtype=np.intp))
+
+    def update_many(self, ids: np.ndarray, values: np.ndarray):
+        """여러 심볼 샘플 추가 (심볼당 O(1), ids는 중복 없음)"""
+        ids = np.asarray(ids, dtype=np.intp)
+        if not len(ids):
+            return
+        values = np.asarray(values, dtype=np.float64)
+        self._ensure(int(ids.max()))
+
+        window = self.window
+        heads = self._heads[ids]
+        counts = self._counts[ids]
+        full = counts >= window
+        has_prev = counts > 0
+
+        # 빠지는 값(가장 오래된 값)과 그 다음 값 → 창에서 빠지는 연속 쌍
+        evicted = np.where(full, self._buffer[ids, heads], 0.0)
+        evicted_next = np.where(full, self._buffer[ids, (heads + 1) % window], 0.0)
+        previous = np.where(has_prev, self._buffer[ids, (heads - 1) % window], 0.0)
+        added = has_prev.astype(np.float64)
+
+        self._sum[ids] += values - evicted
+        self._sumsq[ids] += values * values - evicted * evicted
+        self._lag_x[ids] += previous * added - evicted
+        self._lag_y[ids] += values * added - evicted_next
+        self._lag_xx[ids] += previous * previous * added - evicted * evicted
+        self._lag_xy[ids] += previous * values * added - evicted * evicted_next
+
+        # EWMA (첫 샘플은 그대로 시작)
+        mean = self._ewma_mean[ids]
+        delta = values - mean
+        self._ewma_mean[ids] = np.where(has_prev, mean + self.alpha * delta, values)
+        self._ewma_var[ids] = np.where(
+            has_prev, (1.0 - self.alpha) * (self._ewma_var[ids] + self.alpha * delta * delta), 0.0
+        )
+
+        self._buffer[ids, heads] = values
+        heads = (heads + 1) % window
+        self._heads[ids] = heads
+        self._counts[ids] = np.minimum(counts + 1, window)
+        self._last[ids] = values
+
+        # 버퍼를 한 바퀴 돌 때마다 누적 합 오차 제거 (창 길이마다 한 번 → 샘플당 상각 O(1))
+        wrapped = ids[(heads == 0) & (self._counts[ids] >= window)]
+        if len(wrapped):
+            self._resum(wrapped)
+
+    def _resum(self, ids: np.ndarray):
+        """꽉 찬 행의 합계 재계산 (head == 0 → 버퍼 순서가 시간 순서)"""
+        rows = self._buffer[ids]
+        x, y = rows[:, :-1], rows[:, 1:]
+        self._sum[ids] = rows.sum(axis=1)
+        self._sumsq[ids] = (rows * rows).sum(axis=1)
+        self._lag_x[ids] = x.sum(axis=1)
+        self._lag_y[ids] = y.sum(axis=1)
+        self._lag_xx[ids] = (x * x).sum(axis=1)
+        self._lag_xy[ids] = (x * y).sum(axis=1)
+
+    def clear(self, symbol_id: Optional[int] = None):
+        """통계 초기화 (symbol_id 미지정 시 전체)"""
+        if symbol_id is None:
+            rows = slice(None)
+        elif symbol_id < len(self._heads):
+            rows = symbol_id
+        else:
+            return
+        self._heads[rows] = 0
+        self._counts[rows] = 0
+        self._last[rows] = np.nan
+        for name in ('_sum', '_sumsq', '_lag_x', '_lag_y', '_lag_xx', '_lag_xy',
+                     '_ewma_mean', '_ewma_var'):
+            getattr(self, name)[rows] = 0.0
+
+    # ----- 조회 (ID 인덱스 배열, 샘플이 부족하면 NaN) -----
+
+    @property
+    def counts(self) -> np.ndarray:
+        return self._counts
+
+    @property
+    def last(self) -> np.ndarray:
+        return self._last
+
+    def mean(self) -> np.ndarray:
+        """창 평균"""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self._counts > 0, self._sum / self._counts, np.nan)
+
+    def std(self) -> np.ndarray:
+        """창 표준편차 (모표준편차)"""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = self._sum / self._counts
+            var = np.maximum(self._sumsq / self._counts - mean * mean, 0.0)
+        return np.where(self._counts > 0, np.sqrt(var), np.nan)
+
+    def ewma_mean(self) -> np.ndarray:
+        return np.where(self._counts > 0, self._ewma_mean, np.nan)
+
+    def ewma_std(self) -> np.ndarray:
+        return np.where(self._counts > 0, np.sqrt(self._ewma_var), np.nan)
+
+    def zscore(self) -> np.ndarray:
+        """(최근 값 - EWMA 평균) / EWMA 표준편차"""
+        std = np.sqrt(self._ewma_var)
+        ready = (self._counts >= self.min_periods) & (std > 0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(ready, (self._last - self._ewma_mean) / std, np.nan)
+
+    def half_life(self) -> np.ndarray:
+        """AR(1) 평균회귀 반감기 (샘플 수, 평균회귀가 없으면 inf)"""
+        pairs = self._counts - 1
+        with np.errstate(invalid='ignore', divide='ignore'):
+            denom = pairs * self._lag_xx - self._lag_x * self._lag_x
+            phi = (pairs * self._lag_xy - self._lag_x * self._lag_y) / denom
+            half_life = np.where(phi >= 1.0, np.inf,
+                                 np.where(phi > 0.0, -np.log(2.0) / np.log(phi), 0.0))
+        ready = (self._counts >= self.min_periods) & (denom > 0)
+        return np.where(ready, half_life, np.nan)
+
+    def zscore_of(self, symbol_id: int) -> float:
+        """단일 심볼 z-score (샘플 부족 시 NaN)"""
+        if symbol_id >= len(self._counts) or self._counts[symbol_id] < self.min_periods:
+            return float('nan')
+        std = float(np.sqrt(self._ewma_var[symbol_id]))
+        if std <= 0:
+            return float('nan')
+        return (float(self._last[symbol_id]) - float(self._ewma_mean[symbol_id])) / std
@@ -0,0 +1,178 @@
+# arb_trading/core/symbol_universe.py
+"""정수 심볼 ID 레지스트리
+
+표준 심볼(예: BTCUSDT)마다 고정된 정수 ID를 부여하고, 거래소별 네이티브 심볼 ↔ ID
+매핑을 유지한다. ID는 프로세스 수명 동안 바뀌지 않고 0부터 빈틈없이 증가하므로
+스프레드 엔진/랭킹/히스토리 등 벡터 구성요소가 같은 배열 레이아웃을 공유할 수 있다.
+"""
+
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class SymbolUniverse:
+    """표준 심볼 ↔ 정수 ID, 거래소별 네이티브 심볼 ↔ ID"""
+
+    def __init__(self):
+        self.symbols: List[str] = []  # ID → 표준 심볼
+        self._ids: Dict[str, int] = {}  # 표준 심볼 → ID
+        self._native_to_id: Dict[str, Dict[str, int]] = {}
+        self._id_to_native: Dict[str, Dict[int, str]] = {}
+        # 거래소별 (마지막 네이티브 심볼 목록, 목록 위치 → ID 배열) - 응답 순서는 보통 매번 같음
+        self._position_cache: Dict[str, Tuple[List[str], np.ndarray]] = {}
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._ids
+
+    def register(self, symbol: str) -> int:
+        """표준 심볼 등록 (이미 있으면 기존 ID)"""
+        symbol_id = self._ids.get(symbol)
+        if symbol_id is None:
+            symbol_id = len(self.symbols)
+            self._ids[symbol] = symbol_id
+            self.symbols.append(symbol)
+        return symbol_id
+
+    def register_exchange(self, exchange: str, native_symbols: Iterable[str],
+                          normalize: Optional[Callable[[str], Optional[str]]] = None) -> np.ndarray:
+        """거래소 상장 심볼 등록
+
+        Args:
+            exchange: 거래소 이름
+            native_symbols: 거래소 네이티브 심볼 (fetch_symbols 결과)
+            normalize: 네이티브 → 표준 심볼 (None 반환 시 제외, 미지정 시 그대로 사용)
+
+        Returns:
+            상장 심볼의 ID 배열
+        """
+        native_to_id = self._native_to_id.setdefault(exchange, {})
+        id_to_native = self._id_to_native.setdefault(exchange, {})
+
+        ids = []
+        for native in native_symbols:
+            symbol_id = native_to_id.get(native)
+            if symbol_id is None:
+                canonical = normalize(native) if normalize else native
+                if not canonical:
+                    continue
+                symbol_id = self.register(canonical)
+                native_to_id[native] = symbol_id
+                id_to_native[symbol_id] = native
+            ids.append(symbol_id)
+
+        self._position_cache.pop(exchange, None)
+        return np.array(ids, dtype=np.intp)
+
+    def has_exchange(self, exchange: str) -> bool:
+        """거래소 상장 심볼 등록 여부"""
+        return exchange in self._native_to_id
+
+    def id_of(self, symbol: str) -> Optional[int]:
+        """표준 심볼 → ID"""
+        return self._ids.get(symbol)
+
+    def symbol_of(self, symbol_id: int) -> str:
+        """ID → 표준 심볼"""
+        return self.symbols[symbol_id]
+
+    def native(self, exchange: str, symbol_id: int) -> Optional[str]:
+        """ID → 거래소 네이티브 심볼"""
+        return self._id_to_native.get(exchange, {}).get(symbol_id)
+
+    def native_id(self, exchange: str, native_symbol: str) -> Optional[int]:
+        """거래소 네이티브 심볼 → ID"""
+        return self._native_to_id.get(exchange, {}).get(native_symbol)
+
+    def membership(self, ids: np.ndarray) -> np.ndarray:
+        """ID 배열 → 전체 유니버스 크기의 bool 마스크"""
+        mask = np.zeros(len(self.symbols), dtype=bool)
+        mask[ids] = True
+        return mask
+
+    def positions(self, exchange: str, native_symbols: Sequence[str]) -> np.ndarray:
+        """네이티브 심볼 목록의 위치별 ID (미등록 심볼은 -1, 목록이 같으면 캐시 재사용)"""
+        cached = self._position_cache.get(exchange)
+        if cached is not None and cached[0] == native_symbols:
+            return cached[1]
+
+        native_to_id = self._native_to_id.get(exchange, {})
+        ids = np.fromiter((native_to_id.get(s, -1) for s in native_symbols),
+                          dtype=np.intp, count=len(native_symbols))
+        self._position_cache[exchange] = (list(native_symbols), ids)
+        return ids
+
+    def scatter(self, exchange: str, native_symbols: Sequence[str], values: Sequence[float],
+                fill: float = np.nan) -> np.ndarray:
+        """네이티브 순서 값 목록 → ID로 인덱싱되는 벡터 (없는 심볼은 fill)"""
+        ids = self.positions(exchange, native_symbols)
+        vector = np.full(len(self.symbols), fill)
+        known = ids >= 0
+        if known.any():
+            vector[ids[known]] = np.asarray(values, dtype=np.float64)[known]
+        return vector
+
+    def scatter_dict(self, exchange: str, values: Dict[str, float], fill: float = 0.0) -> np.ndarray:
+        """{네이티브 심볼: 값} → ID로 인덱싱되는 벡터"""
+        return self.scatter(exchange, list(values.keys()), list(values.values()), fill=fill)
+
+
+class IdHistory:
+    """심볼 ID별 고정 길이 히스토리 (2차원 링 버퍼)
+
+    defaultdict(deque(maxlen=N))를 대체한다. 유니버스가 커지면 행을 늘린다.
+    """
+
+    def __init__(self, capacity: int, dtype=np.float64, initial_size: int = 256):
+        self.capacity = capacity
+        self._values = np.zeros((initial_size, capacity), dtype=dtype)
+        self._heads = np.zeros(initial_size, dtype=np.intp)  # 다음 기록 위치
+        self._counts = np.zeros(initial_size, dtype=np.intp)
+
+    def _ensure(self, symbol_id: int):
+        size = len(self._heads)
+        if symbol_id < size:
+            return
+        new_size = max(symbol_id + 1, size * 2)
+        values = np.zeros((new_size, self.capacity), dtype=self._values.dtype)
+        values[:size] = self._values
+        self._values = values
+        self._heads = np.concatenate([self._heads, np.zeros(new_size - size, dtype=np.intp)])
+        self._counts = np.concatenate([self._counts, np.zeros(new_size - size, dtype=np.intp)])
+
+    def append(self, symbol_id: int, value):
+        self._ensure(symbol_id)
+        head = self._heads[symbol_id]
+        self._values[symbol_id, head] = value
+        self._heads[symbol_id] = (head + 1) % self.capacity
+        if self._counts[symbol_id] < self.capacity:
+            self._counts[symbol_id] += 1
+
+    def count(self, symbol_id: int) -> int:
+        if symbol_id >= len(self._counts):
+            return 0
+        return int(self._counts[symbol_id])
+
+    def is_full(self, symbol_id: int) -> bool:
+        return self.count(symbol_id) >= self.capacity
+
+    def values(self, symbol_id: int) -> np.ndarray:
+        """오래된 것부터 기록된 값"""
+        count = self.count(symbol_id)
+        if count == 0:
+            return self._values[0, :0]
+        head = self._heads[symbol_id]
+        start = (head - count) % self.capacity
+        order = (start + np.arange(count)) % self.capacity
+        return self._values[symbol_id, order]
+
+    def clear(self, symbol_id: Optional[int] = None):
+        if symbol_id is None:
+            self._heads[:] = 0
+            self._counts[:] = 0
+        elif symbol_id < len(self._counts):
+            self._heads[symbol_id] = 0
+            self._counts[symbol_id] = 0
@@ -1,9 +1,11 @@
 # arb_trading/exchanges/__init__.py
 """거래소 모듈"""
 
-from .base import BaseExchange, OrderType, OrderSide, Direction, Ticker, Order, Position
+from .base import BaseExchange, OrderType, OrderSide, Direction, Ticker, TickerBatch, FundingBatch, Order, Position, \
+    MarketRules
 from .binance import BinanceExchange
 from .bybit import BybitExchange
+from .streams import MarketDataStream, TickerBoard
 
 __all__ = [
     'BaseExchange',
@@ -11,8 +13,13 @@ __all__ = [
     'OrderSide',
     'Direction',
     'Ticker',
+    'TickerBatch',
+    'FundingBatch',
     'Order',
     'Position',
+    'MarketRules',
     'BinanceExchange',
-    'BybitExchange'
+    'BybitExchange',
+    'MarketDataStream',
+    'TickerBoard'
 ]
@@ -1,13 +1,24 @@
 # arb_trading/exchanges/base.py (수정된 버전)
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Awaitable, Callable, Iterable, FrozenSet
 from dataclasses import dataclass
 from enum import Enum
 import asyncio
 import aiohttp
+import logging
+import math
 import time
 import platform
-from ..utils.platform_utils import get_optimal_connector
+import urllib.parse
+from .rate_limiter import RateLimiter, TokenBucket
+from .hedging import DeadlineExceededError, HedgeBudget, LatencyTracker, remaining_time
+from .endpoints import EndpointPool
+from .resilience import CircuitBreaker, CircuitOpenError, RetryPolicy
+from ..utils import json_codec
+from ..utils.performance import PerformanceMonitor
+from ..utils.http_session import session_registry
+
+logger = logging.getLogger(__name__)
 
 
 class OrderType(Enum):
@@ -21,11 +32,23 @@ class OrderSide(Enum):
     SELL = "sell"
 
 
+# 티커 필드 (fetch_tickers 호출 시 필요한 필드만 선언)
+TICKER_FIELDS: FrozenSet[str] = frozenset({'last_price', 'bid', 'ask', 'volume_24h'})
+DEFAULT_TICKER_FIELDS: FrozenSet[str] = frozenset({'last_price', 'volume_24h'})
+
+
 class Direction(Enum):
     BINANCE_GT_BYBIT = "binance_gt_bybit"
     BYBIT_GT_BINANCE = "bybit_gt_binance"
 
 
+@dataclass(frozen=True)
+class FeeSchedule:
+    """거래 수수료 (%, 명목가 대비)"""
+    maker_pct: float
+    taker_pct: float
+
+
 @dataclass
 class Ticker:
     symbol: str
@@ -33,8 +56,53 @@ class Ticker:
     bid: Optional[float] = None
     ask: Optional[float] = None
     volume_24h: float = 0.0
+    timestamp: int = 0  # 거래소 이벤트 시각 (ms, 응답에 없으면 수신 시각)
+
+
+@dataclass
+class TickerBatch:
+    """전체 시장 티커 (컬럼 형태, 스프레드 계산용)"""
+    symbols: List[str]
+    last_prices: List[float]
+    bids: Optional[List[float]] = None
+    asks: Optional[List[float]] = None
+    timestamp: int = 0  # 수신 시각 (ms, 로컬)
+    event_times: Optional[List[int]] = None  # 심볼별 거래소 이벤트 시각 (ms, 없으면 timestamp 기준)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def price_map(self) -> Dict[str, float]:
+        """심볼 → 최근 체결가"""
+        return dict(zip(self.symbols, self.last_prices))
+
+    @classmethod
+    def from_tickers(cls, tickers: Dict[str, Ticker]) -> 'TickerBatch':
+        """Ticker 딕셔너리 → 컬럼 변환"""
+        values = list(tickers.values())
+        received = int(time.time() * 1000)
+        return cls(
+            symbols=list(tickers.keys()),
+            last_prices=[t.last_price for t in values],
+            bids=[t.bid or math.nan for t in values],  # 호가 없음 → NaN (0 가격과 구분)
+            asks=[t.ask or math.nan for t in values],
+            timestamp=received,
+            event_times=[t.timestamp or received for t in values]
+        )
+
+
+@dataclass
+class FundingBatch:
+    """전체 시장 펀딩비 (컬럼 형태)"""
+    symbols: List[str]
+    rates_pct: List[float]  # 다음 정산 펀딩비 (%, 양수면 롱이 숏에게 지급)
+    next_funding_times: List[int]  # 다음 정산 시각 (ms)
+    interval_hours: List[float]  # 정산 주기 (시간)
     timestamp: int = 0
 
+    def __len__(self) -> int:
+        return len(self.symbols)
+
 
 @dataclass
 class Order:
@@ -61,21 +129,107 @@ class Position:
     percentage: float = 0.0
 
 
+@dataclass(frozen=True)
+class MarketRules:
+    """심볼 주문 규칙 (0이면 제한 없음)"""
+    min_qty: float = 0.0
+    qty_step: float = 0.0
+    tick_size: float = 0.0
+
+
+class SnapshotCache:
+    """단일 비행(single-flight) 스냅샷 캐시
+
+    같은 키에 대한 동시 요청은 하나의 진행 중 요청을 공유하고,
+    완료된 결과는 TTL 동안 같은 사이클의 모든 호출자에게 재사용된다.
+    """
+
+    def __init__(self, default_ttl: float = 1.0):
+        self.default_ttl = default_ttl
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str, fetcher: Callable[[], Awaitable[Any]],
+                  ttl: Optional[float] = None) -> Any:
+        """캐시 조회 (없으면 fetcher 실행, 진행 중이면 합류)"""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self.hits += 1
+            return entry[1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.ensure_future(self._load(key, fetcher, ttl))
+            # 호출자가 모두 취소되어도 예외 미회수 경고가 나지 않도록 처리
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._inflight[key] = task
+        else:
+            self.hits += 1
+
+        # 한 호출자의 취소가 공유 요청을 취소하지 않도록 shield
+        return await asyncio.shield(task)
+
+    async def _load(self, key: str, fetcher: Callable[[], Awaitable[Any]],
+                    ttl: Optional[float]) -> Any:
+        try:
+            value = await fetcher()
+            expires_at = time.monotonic() + (self.default_ttl if ttl is None else ttl)
+            self._entries[key] = (expires_at, value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    def invalidate(self, key: Optional[str] = None):
+        """캐시 무효화 (key 없으면 전체)"""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+
 class BaseExchange(ABC):
     """거래소 공통 인터페이스"""
 
-    def __init__(self, api_key: str = "", secret: str = ""):
+    default_base_urls: List[str] = []  # 동등한 API 호스트 목록 (앞쪽이 기본 우선순위)
+    ping_path = ""  # 연결 예열/유지용 경량 엔드포인트
+    fee_schedule = FeeSchedule(maker_pct=0.02, taker_pct=0.05)  # 기본 등급 수수료 (설정으로 덮어씀)
+    supports_orders = False  # 주문/레버리지 메소드가 실제 API로 구현됐는지 (아니면 시뮬레이션 스텁)
+    client_order_id_param: Optional[str] = None  # 주문 요청의 클라이언트 주문 ID 파라미터 이름
+    reduce_only_params: Dict[str, Any] = {}  # 포지션 축소 전용 주문 파라미터 (청산/되돌리기용)
+
+    def __init__(self, api_key: str = "", secret: str = "",
+                 base_urls: Optional[List[str]] = None):
         """
         거래소 초기화 (testnet 제거)
 
         Args:
             api_key: API 키 (시뮬레이션에서는 빈 문자열 가능)
             secret: API 시크릿 (시뮬레이션에서는 빈 문자열 가능)
+            base_urls: API 호스트 목록 (없으면 default_base_urls)
         """
         self.api_key = api_key
         self.secret = secret
+        urls = base_urls or self.default_base_urls
+        self.endpoints: Optional[EndpointPool] = EndpointPool(urls) if urls else None
         self.session: Optional[aiohttp.ClientSession] = None
-        self._rate_limit_delay = 0.1  # 기본 레이트 리미트
+        self.rate_limiter = self._create_rate_limiter()
+        self.snapshot_cache = SnapshotCache(default_ttl=1.0)
+        self.performance_monitor: Optional[PerformanceMonitor] = None
+        self._keepalive_task: Optional[asyncio.Task] = None
+        self.latency_tracker = LatencyTracker()
+        self.hedge_budget: Optional[HedgeBudget] = None  # None이면 헤지 비활성
+        self.hedge_headroom = 0.2
+        self.retry_policy = RetryPolicy()
+        self.circuit_breaker = CircuitBreaker(on_state_change=self._on_circuit_state_change)
+        self._market_info: Dict[str, Dict[str, float]] = {}  # 심볼별 주문 규칙 (fetch_symbols에서 채움)
+
+    @property
+    def base_url(self) -> str:
+        """현재 가장 빠른 정상 호스트"""
+        return self.endpoints.best() if self.endpoints else ""
 
     async def __aenter__(self):
         await self.connect()
@@ -85,16 +239,13 @@ class BaseExchange(ABC):
         await self.disconnect()
 
     async def connect(self):
-        """연결 설정"""
+        """연결 설정 (프로세스 전역 세션 레지스트리의 거래소별 커넥션 풀 사용)"""
         if not self.session:
             timeout = aiohttp.ClientTimeout(total=30, connect=10)
 
-            # Windows 호환 커넥터 사용
-            connector = get_optimal_connector()
-
-            self.session = aiohttp.ClientSession(
+            self.session = session_registry.acquire(
+                self.name,
                 timeout=timeout,
-                connector=connector,
                 headers={
                     'User-Agent': 'ArbitrageBot/1.0',
                     'Accept': 'application/json',
@@ -104,16 +255,119 @@ class BaseExchange(ABC):
 
     async def disconnect(self):
         """연결 해제"""
+        if self._keepalive_task:
+            self._keepalive_task.cancel()
+            self._keepalive_task = None
+
         if self.session:
-            await self.session.close()
+            await session_registry.release(self.name)
             self.session = None
 
+    async def warm_up(self, connections: int = 2) -> int:
+        """keep-alive 연결 미리 생성 (호스트마다 동시 ping으로 풀에 connections개 확보)
+
+        ping 응답 시간은 엔드포인트 지연 점수에도 반영된다.
+
+        Returns:
+            성공한 ping 수
+        """
+        if not self.session:
+            await self.connect()
+
+        base_urls = self.endpoints.urls if self.endpoints else [""]
+        results = await asyncio.gather(
+            *(self._request("GET", f"{base}{self.ping_path}")
+              for base in base_urls for _ in range(connections)),
+            return_exceptions=True
+        )
+        return sum(1 for r in results if not isinstance(r, Exception))
+
+    async def _ping(self, base: str, timeout: float = 5.0) -> bool:
+        """연결 유지용 ping (세션 직접 사용: 레이트 리밋/회로 차단기/엔드포인트 점수에 반영하지 않음)"""
+        try:
+            async with self.session.get(f"{base}{self.ping_path}",
+                                        timeout=aiohttp.ClientTimeout(total=timeout), ssl=False) as response:
+                await response.read()
+                return response.status < 400
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug(f"{self.name} 연결 유지 ping 실패 ({base}): {e}")
+            return False
+
+    def start_keepalive(self, interval: float = 30.0, connections: int = 2):
+        """유휴 중에도 풀의 연결이 끊기지 않도록 주기적 ping (주문 시 콜드 TLS 방지)
+
+        ping 실패는 디버그 로그만 남긴다 (유휴 ping 실패로 회로가 열려 시세 조회가 막히지 않도록).
+        """
+        if self._keepalive_task and not self._keepalive_task.done():
+            return
+
+        async def keepalive():
+            while True:
+                await asyncio.sleep(interval)
+                if not self.session or not self.endpoints:
+                    continue
+                await asyncio.gather(*(self._ping(base)
+                                       for base in self.endpoints.urls for _ in range(connections)))
+
+        self._keepalive_task = asyncio.create_task(keepalive())
+
+    def configure_hedging(self, max_ratio: float = 0.1, headroom: float = 0.2):
+        """시세 조회 헤지 활성화
+
+        Args:
+            max_ratio: 요청 대비 최대 헤지 비율
+            headroom: 헤지 발사 후에도 남아 있어야 하는 레이트 리밋 용량 비율
+        """
+        self.hedge_budget = HedgeBudget(ratio=max_ratio)
+        self.hedge_headroom = headroom
+
+    def configure_resilience(self, failure_threshold: int = 5, recovery_timeout: float = 10.0,
+                             max_attempts: int = 3, retry_base_delay: float = 0.1,
+                             retry_max_delay: float = 2.0):
+        """회로 차단기 / 재시도 정책 설정"""
+        self.circuit_breaker = CircuitBreaker(
+            failure_threshold=failure_threshold,
+            recovery_timeout=recovery_timeout,
+            on_state_change=self._on_circuit_state_change
+        )
+        self.retry_policy = RetryPolicy(
+            max_attempts=max_attempts, base=retry_base_delay, cap=retry_max_delay
+        )
+
+    def _on_circuit_state_change(self, state: str):
+        """회로 상태 전환 → 성능 모니터 기록"""
+        if self.performance_monitor:
+            self.performance_monitor.record_circuit_state(self.name, state)
+
+    def _create_rate_limiter(self) -> RateLimiter:
+        """거래소 레이트 리미터 생성 (기본: 초당 10회)"""
+        return RateLimiter({'requests': TokenBucket(capacity=10, window=1.0)})
+
+    def _sync_rate_limit(self, endpoint: str, headers) -> None:
+        """응답 헤더의 사용량으로 레이트 리미터 보정 (거래소별 구현)"""
+        pass
+
     # 추상 메소드들 (기존과 동일)
     @abstractmethod
-    async def fetch_tickers(self) -> Dict[str, Ticker]:
-        """모든 티커 정보 조회"""
+    async def fetch_tickers(self, fields: Optional[Iterable[str]] = None) -> Dict[str, Ticker]:
+        """모든 티커 정보 조회 (fields: 필요한 TICKER_FIELDS, 기본 DEFAULT_TICKER_FIELDS)"""
         pass
 
+    async def fetch_ticker_batch(self, quotes: bool = False) -> TickerBatch:
+        """전체 티커 컬럼 조회 (스프레드 계산용 경량 경로, 거래소별 최적화 가능)
+
+        Args:
+            quotes: 최우선 호가(bid/ask) 포함 여부
+        """
+        fields = TICKER_FIELDS if quotes else DEFAULT_TICKER_FIELDS
+        return TickerBatch.from_tickers(await self.fetch_tickers(fields=fields))
+
+    async def fetch_funding_rates(self) -> FundingBatch:
+        """전체 펀딩비 컬럼 조회 (미지원 거래소는 빈 배치 → 캐리 0)"""
+        return FundingBatch(symbols=[], rates_pct=[], next_funding_times=[], interval_hours=[])
+
     @abstractmethod
     async def fetch_ticker(self, symbol: str) -> Ticker:
         """단일 티커 정보 조회"""
@@ -139,6 +393,17 @@ class BaseExchange(ABC):
         """목표 USDT 기준 수량 계산"""
         pass
 
+    def market_rules(self, symbol: str) -> MarketRules:
+        """심볼 주문 규칙 (최소 수량/수량 단위/호가 단위)"""
+        info = self._market_info.get(symbol, {})
+        return MarketRules(min_qty=info.get('min_qty', 0.0),
+                           qty_step=info.get('qty_step', 0.0),
+                           tick_size=info.get('tick_size', 0.0))
+
+    def order_params(self, symbol: str) -> Dict[str, Any]:
+        """주문마다 고정으로 붙는 거래소별 파라미터 (예: 바이빗 category)"""
+        return {}
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -182,6 +447,10 @@ class BaseExchange(ABC):
             timestamp=self._get_timestamp()
         )
 
+    async def fetch_order_by_client_id(self, client_order_id: str, symbol: str) -> Optional[Order]:
+        """클라이언트 주문 ID로 주문 조회 (접수되지 않은 주문이면 None, 시뮬레이션용)"""
+        return await self.fetch_order(client_order_id, symbol)
+
     async def cancel_order(self, order_id: str, symbol: str) -> bool:
         """주문 취소 (시뮬레이션용)"""
         return True
@@ -199,69 +468,270 @@ class BaseExchange(ABC):
         return True
 
     async def _request(self, method: str, url: str, params: Optional[Dict] = None,
-                       data: Optional[Dict] = None, headers: Optional[Dict] = None) -> Dict:
-        """공통 HTTP 요청 처리"""
+                       data: Optional[Dict] = None, headers: Optional[Dict] = None,
+                       raw: bool = False, retry: bool = True) -> Any:
+        """공통 HTTP 요청 처리 (raw=True면 디코딩 없이 bytes 반환)
+
+        url이 '/'로 시작하면 엔드포인트 풀에서 현재 가장 빠른 정상 호스트를 골라 붙인다.
+        회로 차단 중이면 요청을 보내지 않고 CircuitOpenError를 즉시 발생시킨다.
+        retry=False면 한 번만 보낸다 (주문 생성처럼 멱등이 아닌 요청: 타임아웃/5xx 후 재전송하면
+        중복 주문이 될 수 있으므로 호출자가 주문 조회로 접수 여부를 확인).
+        """
+        if not self.circuit_breaker.allow_request():
+            raise CircuitOpenError(
+                f"{self.name} 회로 차단 중 ({self.circuit_breaker.retry_after():.1f}초 후 재시도)"
+            )
+
         if not self.session:
             await self.connect()
 
-        # 레이트 리미트 적용
-        await asyncio.sleep(self._rate_limit_delay)
+        relative = url.startswith('/')
+        parts = urllib.parse.urlsplit(url)
+        endpoint = parts.path
+        weight = self.rate_limiter.weight_for(endpoint, params)
+
+        # 거래소가 응답했는지 (4xx/429는 거래소 장애가 아니므로 회로 차단 대상 아님)
+        responded = False
+        delay = None
+
+        # 재시도 로직 (호스트가 여러 개면 한 번씩은 시도할 수 있도록)
+        max_retries = max(self.retry_policy.max_attempts, len(self.endpoints) if self.endpoints else 0) \
+            if retry else 1
+        try:
+            for attempt in range(max_retries):
+                last_attempt = attempt == max_retries - 1
+                base = self.base_url if relative else f"{parts.scheme}://{parts.netloc}"
+                request_url = f"{base}{url}" if relative else url
+                try:
+                    # 마감 시간이 있으면 남은 시간만큼만 대기/요청
+                    remaining = remaining_time()
+                    if remaining is not None and remaining <= 0:
+                        raise DeadlineExceededError(f"{self.name} 요청 마감 초과: {endpoint}")
+
+                    # 레이트 리미트 적용 (예산 부족 시에만 대기)
+                    if remaining is None:
+                        await self.rate_limiter.acquire(endpoint, weight, method)
+                    else:
+                        try:
+                            await asyncio.wait_for(self.rate_limiter.acquire(endpoint, weight, method), remaining)
+                        except asyncio.TimeoutError:
+                            raise DeadlineExceededError(f"{self.name} 레이트 리밋 대기 중 마감 초과: {endpoint}")
+                        remaining = remaining_time()
+
+                    request_timeout = None
+                    if remaining is not None:
+                        request_timeout = aiohttp.ClientTimeout(total=remaining, connect=min(remaining, 10))
+                    request_start = time.monotonic()
+
+                    # 요청 헤더 병합
+                    request_headers = {}
+                    if headers:
+                        request_headers.update(headers)
+
+                    async with self.session.request(
+                            method=method,
+                            url=request_url,
+                            params=params,
+                            json=data,
+                            headers=request_headers,
+                            timeout=request_timeout,
+                            ssl=False  # SSL 검증 비활성화 (필요시)
+                    ) as response:
+
+                        self._sync_rate_limit(endpoint, response.headers)
+
+                        if response.status < 500:
+                            responded = True
+
+                        if response.status == 429:  # Too Many Requests
+                            self.rate_limiter.penalize(endpoint, method)
+                            if last_attempt:
+                                raise Exception(f"{self.name} 레이트 리밋 초과: {endpoint}")
+                            retry_after = response.headers.get('Retry-After')
+                            delay = self.retry_policy.next_delay(delay)
+                            if retry_after and retry_after.isdigit():
+                                delay = max(delay, float(retry_after))
+                            await self._backoff(delay, endpoint)
+                            continue
+
+                        if response.status >= 500 and self.endpoints:
+                            self.endpoints.record_failure(base)
+
+                        if response.status >= 400:
+                            error_text = await response.text()
+                            error = aiohttp.ClientResponseError(
+                                request_info=response.request_info,
+                                history=response.history,
+                                status=response.status,
+                                message=f"HTTP {response.status}: {error_text}"
+                            )
+                            if response.status < 500:
+                                # 요청 자체 오류: 재시도해도 결과가 같음
+                                raise Exception(f"{self.name} API 요청 실패: {error}")
+                            raise error
+
+                        body = await response.read()
+                        duration = time.monotonic() - request_start
+                        self.latency_tracker.record(endpoint, duration)
+                        if self.endpoints:
+                            self.endpoints.record_success(base, duration)
+                        result = body if raw else json_codec.loads(body)
+
+                    self.circuit_breaker.record_success()
+                    return result
+
+                except DeadlineExceededError:
+                    raise
+
+                except asyncio.TimeoutError:
+                    if self.endpoints:
+                        self.endpoints.record_failure(base)
+                    remaining = remaining_time()
+                    if remaining is not None and remaining <= 0:
+                        raise DeadlineExceededError(f"{self.name} 요청 마감 초과: {endpoint}")
+                    if last_attempt:
+                        raise Exception(f"{self.name} API 타임아웃")
+
+                except aiohttp.ClientConnectorError as e:
+                    # 연결 오류: 해당 호스트를 잠시 제외하고 다른 정상 호스트로 즉시 전환
+                    if self.endpoints:
+                        self.endpoints.record_failure(base, exclude=True)
+                        if relative and self.endpoints.has_healthy_alternative(base) and not last_attempt:
+                            continue
+                    if last_attempt:
+                        raise Exception(f"{self.name} 연결 실패: {e}")
+
+                except aiohttp.ClientError as e:
+                    if last_attempt:
+                        raise Exception(f"{self.name} API 요청 실패: {e}")
+
+                except Exception as e:
+                    if responded:
+                        raise  # 거래소가 응답한 요청 오류 (4xx, 디코딩 실패 등): 재시도 무의미
+                    if last_attempt:
+                        raise Exception(f"{self.name} 예상치 못한 오류: {e}")
+
+                delay = self.retry_policy.next_delay(delay)
+                await self._backoff(delay, endpoint)
+
+            raise Exception(f"{self.name} API 요청 최대 재시도 초과")
+
+        except asyncio.CancelledError:
+            self.circuit_breaker.release_probe()
+            raise
+
+        except DeadlineExceededError:
+            # 호출자 마감 (레이트 리밋/재시도 대기 중 포함): 거래소 장애가 아니므로 실패로 집계하지 않음
+            if responded:
+                self.circuit_breaker.record_success()
+            else:
+                self.circuit_breaker.release_probe()
+            raise
+
+        except Exception:
+            if responded:
+                self.circuit_breaker.record_success()
+            else:
+                self.circuit_breaker.record_failure()
+            raise
+
+    async def _backoff(self, seconds: float, endpoint: str):
+        """재시도 대기 (대기 후 남은 시간에 요청 한 번을 마칠 수 없으면 즉시 포기)"""
+        remaining = remaining_time()
+        if remaining is not None:
+            expected = self.latency_tracker.percentile(endpoint, 50) or 0.0
+            if remaining <= seconds + expected:
+                raise DeadlineExceededError(f"{self.name} 요청 마감 초과: {endpoint}")
+        await asyncio.sleep(seconds)
+
+    async def _cached_request(self, method: str, url: str, params: Optional[Dict] = None,
+                              ttl: Optional[float] = None, raw: bool = False) -> Any:
+        """공개 시세 엔드포인트 조회 (단일 비행 + 짧은 TTL 스냅샷 공유)"""
+        key = f"{method} {url} {sorted(params.items()) if params else ''} {raw}"
+        return await self.snapshot_cache.get(
+            key,
+            lambda: self._hedged_request(method, url, params=params, raw=raw),
+            ttl=ttl
+        )
 
-        # 재시도 로직
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                # 요청 헤더 병합
-                request_headers = {}
-                if headers:
-                    request_headers.update(headers)
-
-                async with self.session.request(
-                        method=method,
-                        url=url,
-                        params=params,
-                        json=data,
-                        headers=request_headers,
-                        ssl=False  # SSL 검증 비활성화 (필요시)
-                ) as response:
-
-                    if response.status == 429:  # Too Many Requests
-                        wait_time = 2 ** attempt  # 지수 백오프
-                        await asyncio.sleep(wait_time)
-                        continue
-
-                    if response.status >= 400:
-                        error_text = await response.text()
-                        raise aiohttp.ClientResponseError(
-                            request_info=response.request_info,
-                            history=response.history,
-                            status=response.status,
-                            message=f"HTTP {response.status}: {error_text}"
-                        )
-
-                    return await response.json()
-
-            except asyncio.TimeoutError:
-                if attempt == max_retries - 1:
-                    raise Exception(f"{self.name} API 타임아웃")
-                await asyncio.sleep(1)
-
-            except aiohttp.ClientConnectorError as e:
-                if attempt == max_retries - 1:
-                    raise Exception(f"{self.name} 연결 실패: {e}")
-                await asyncio.sleep(2)
-
-            except aiohttp.ClientError as e:
-                if attempt == max_retries - 1:
-                    raise Exception(f"{self.name} API 요청 실패: {e}")
-                await asyncio.sleep(1)
+    async def _hedged_request(self, method: str, url: str, params: Optional[Dict] = None,
+                              raw: bool = False) -> Any:
+        """헤지 요청 (멱등 조회 전용)
 
+        엔드포인트의 p95 응답 시간이 지나도 응답이 없으면 동일 요청을 한 번 더 보내고
+        먼저 성공한 응답을 사용한다. 헤지 예산과 레이트 리밋 여유가 있을 때만 발사한다.
+        """
+        if self.hedge_budget is None:
+            return await self._request(method, url, params=params, raw=raw)
+
+        endpoint = urllib.parse.urlsplit(url).path
+        self.hedge_budget.deposit()
+
+        hedge_delay = self.latency_tracker.percentile(endpoint, 95)
+        remaining = remaining_time()
+        if hedge_delay is None or (remaining is not None and remaining <= hedge_delay):
+            return await self._request(method, url, params=params, raw=raw)
+
+        primary = asyncio.ensure_future(self._request(method, url, params=params, raw=raw))
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=hedge_delay)
+            if done:
+                return primary.result()
+
+            weight = self.rate_limiter.weight_for(endpoint, params)
+            if (not self.rate_limiter.has_capacity(endpoint, weight, self.hedge_headroom, method) or
+                    not self.hedge_budget.try_spend()):
+                return await primary
+
+            hedge = asyncio.ensure_future(self._request(method, url, params=params, raw=raw))
+            pending.add(hedge)
+
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.hedge_budget.won += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _fetch_composite(self, operation: str,
+                               requests: Dict[str, Callable[[], Awaitable[Any]]]) -> Dict[str, Any]:
+        """복합 조회: 서로 독립인 하위 요청들을 동시에 실행하고 결과를 키별로 병합
+
+        하위 요청별 소요 시간은 PerformanceMonitor에 '{operation}:{key}'로 기록된다.
+        하나라도 실패하면 나머지 하위 요청을 취소하고 예외를 전파한다.
+        """
+        async def timed(key: str, fetch: Callable[[], Awaitable[Any]]) -> Tuple[str, Any]:
+            start_time = time.time()
+            try:
+                result = await fetch()
             except Exception as e:
-                if attempt == max_retries - 1:
-                    raise Exception(f"{self.name} 예상치 못한 오류: {e}")
-                await asyncio.sleep(1)
-
-        raise Exception(f"{self.name} API 요청 최대 재시도 초과")
+                self._record_fetch(f"{operation}:{key}", time.time() - start_time, False, str(e))
+                raise
+            self._record_fetch(f"{operation}:{key}", time.time() - start_time, True)
+            return key, result
+
+        tasks = [asyncio.ensure_future(timed(key, fetch)) for key, fetch in requests.items()]
+        try:
+            return dict(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    def _record_fetch(self, operation: str, duration: float, success: bool, error_msg: str = ""):
+        """하위 요청 타이밍 기록 (성능 모니터 연결 시)"""
+        if self.performance_monitor:
+            self.performance_monitor.record_exchange_fetch(
+                self.name, operation, duration, success=success, error_msg=error_msg
+            )
 
     def _get_timestamp(self) -> int:
         """현재 타임스탬프 반환 (밀리초)"""
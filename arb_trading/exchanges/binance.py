@@ -2,21 +2,39 @@
 import hashlib
 import hmac
 import urllib.parse
-from typing import Dict, List, Optional
-from .base import BaseExchange, Ticker, Order, Position, OrderType, OrderSide
+from typing import Dict, Iterable, List, Optional
+from .base import (
+    BaseExchange, FundingBatch, Ticker, TickerBatch, Order, Position, OrderType, OrderSide,
+    DEFAULT_TICKER_FIELDS
+)
+from .decoders import decode_binance_book, decode_binance_funding, decode_binance_prices
+from .rate_limiter import RateLimiter, TokenBucket
 import asyncio
 
 
 class BinanceExchange(BaseExchange):
     """바이낸스 선물 거래소 구현"""
 
-    def __init__(self, api_key: str, secret: str):
-        super().__init__(api_key, secret)
+    default_base_urls = ["https://fapi.binance.com"]
+    ping_path = "/fapi/v1/ping"
+    supports_orders = True
+    client_order_id_param = "newClientOrderId"
+    reduce_only_params = {'reduceOnly': 'true'}
+
+    # 엔드포인트별 요청 가중치: (전체 조회, 단일 심볼 조회)
+    REQUEST_WEIGHTS = {
+        '/fapi/v1/exchangeInfo': 1,
+        '/fapi/v1/ticker/price': (2, 1),
+        '/fapi/v1/ticker/24hr': (40, 1),
+        '/fapi/v1/ticker/bookTicker': (5, 2),
+        '/fapi/v1/premiumIndex': (10, 1),
+        '/fapi/v2/balance': 5,
+        '/fapi/v2/positionRisk': 5,
+    }
+
+    def __init__(self, api_key: str, secret: str, base_urls: Optional[List[str]] = None):
+        super().__init__(api_key, secret, base_urls)
 
-        self.base_url = "https://fapi.binance.com"
-
-
-        self._rate_limit_delay = 0.05  # 바이낸스는 빠른 요청 허용
         self._symbols_cache = {}
         self._market_info = {}
 
@@ -24,6 +42,30 @@ class BinanceExchange(BaseExchange):
     def name(self) -> str:
         return "binance"
 
+    def _create_rate_limiter(self) -> RateLimiter:
+        """IP 가중치 2400/분, 주문 300/10초 한도"""
+        return RateLimiter(
+            buckets={
+                'weight': TokenBucket(capacity=2400, window=60.0),
+                'orders': TokenBucket(capacity=300, window=10.0),
+            },
+            weights=self.REQUEST_WEIGHTS,
+            # 주문 수 한도는 주문 생성/취소에만 적용 (GET 주문 조회는 가중치만)
+            routes={'POST /fapi/v1/order': ['weight', 'orders'],
+                    'DELETE /fapi/v1/order': ['weight', 'orders']},
+            default_route=['weight']
+        )
+
+    def _sync_rate_limit(self, endpoint: str, headers) -> None:
+        """X-MBX-USED-WEIGHT-1M / X-MBX-ORDER-COUNT-10S 헤더 반영"""
+        used_weight = headers.get('X-MBX-USED-WEIGHT-1M')
+        if used_weight is not None:
+            self.rate_limiter.sync_used('weight', float(used_weight))
+
+        order_count = headers.get('X-MBX-ORDER-COUNT-10S')
+        if order_count is not None:
+            self.rate_limiter.sync_used('orders', float(order_count))
+
     def _sign_request(self, params: Dict) -> str:
         """요청 서명 생성"""
         query_string = urllib.parse.urlencode(params)
@@ -34,8 +76,9 @@ class BinanceExchange(BaseExchange):
         ).hexdigest()
         return signature
 
-    async def _signed_request(self, method: str, endpoint: str, params: Optional[Dict] = None) -> Dict:
-        """서명된 요청"""
+    async def _signed_request(self, method: str, endpoint: str, params: Optional[Dict] = None,
+                              retry: bool = True) -> Dict:
+        """서명된 요청 (retry=False: 주문 생성 등 멱등이 아닌 요청)"""
         if params is None:
             params = {}
 
@@ -47,8 +90,7 @@ class BinanceExchange(BaseExchange):
             'X-MBX-APIKEY': self.api_key
         }
 
-        url = f"{self.base_url}{endpoint}"
-        return await self._request(method, url, params=params, headers=headers)
+        return await self._request(method, endpoint, params=params, headers=headers, retry=retry)
 
     async def fetch_symbols(self) -> List[str]:
         """거래 가능한 심볼 목록 조회"""
@@ -56,8 +98,7 @@ class BinanceExchange(BaseExchange):
             return list(self._symbols_cache.keys())
 
         try:
-            url = f"{self.base_url}/fapi/v1/exchangeInfo"
-            data = await self._request("GET", url)
+            data = await self._request("GET", "/fapi/v1/exchangeInfo")
 
             symbols = []
             for item in data.get('symbols', []):
@@ -80,6 +121,7 @@ class BinanceExchange(BaseExchange):
                     for filter_item in item.get('filters', []):
                         if filter_item['filterType'] == 'LOT_SIZE':
                             self._market_info[symbol]['min_qty'] = float(filter_item['minQty'])
+                            self._market_info[symbol]['qty_step'] = float(filter_item.get('stepSize', 0))
                         elif filter_item['filterType'] == 'PRICE_FILTER':
                             self._market_info[symbol]['tick_size'] = float(filter_item['tickSize'])
 
@@ -89,45 +131,98 @@ class BinanceExchange(BaseExchange):
         except Exception as e:
             raise Exception(f"바이낸스 심볼 조회 실패: {e}")
 
-    async def fetch_tickers(self) -> Dict[str, Ticker]:
-        """모든 티커 정보 조회"""
-        try:
-            url = f"{self.base_url}/fapi/v1/ticker/price"
-            price_data = await self._request("GET", url)
+    async def _fetch_price_list(self, raw: bool = False):
+        """ticker/price 전체 목록 (사이클 내 공유)"""
+        return await self._cached_request("GET", "/fapi/v1/ticker/price", raw=raw)
 
-            url = f"{self.base_url}/fapi/v1/ticker/24hr"
-            volume_data = await self._request("GET", url)
+    async def _fetch_24hr_list(self) -> List[Dict]:
+        """ticker/24hr 전체 목록 (가중치 40, 사이클 내 공유)"""
+        return await self._cached_request("GET", "/fapi/v1/ticker/24hr")
 
-            # 가격과 볼륨 데이터 결합
-            volume_dict = {item['symbol']: item for item in volume_data}
+    async def _fetch_book_list(self, raw: bool = False):
+        """ticker/bookTicker 전체 목록 (사이클 내 공유)"""
+        return await self._cached_request("GET", "/fapi/v1/ticker/bookTicker", raw=raw)
 
-            tickers = {}
-            for item in price_data:
-                symbol = item['symbol']
-                price = float(item['price'])
+    async def fetch_tickers(self, fields: Optional[Iterable[str]] = None) -> Dict[str, Ticker]:
+        """모든 티커 정보 조회 (필요한 필드의 엔드포인트만 호출)"""
+        fields = frozenset(fields) if fields is not None else DEFAULT_TICKER_FIELDS
 
-                volume_info = volume_dict.get(symbol, {})
+        try:
+            # 서로 독립인 엔드포인트는 동시에 조회
+            requests = {}
+            if 'volume_24h' in fields:
+                # 24hr 응답에 최근 체결가가 포함되므로 ticker/price 생략
+                requests['24hr'] = self._fetch_24hr_list
+            else:
+                requests['price'] = self._fetch_price_list
+            if 'bid' in fields or 'ask' in fields:
+                requests['book'] = self._fetch_book_list
+
+            results = await self._fetch_composite("tickers", requests)
+
+            timestamp = self._get_timestamp()
+            tickers = {}
 
-                tickers[symbol] = Ticker(
-                    symbol=symbol,
-                    last_price=price,
-                    bid=None,  # 별도 API 필요
-                    ask=None,  # 별도 API 필요
-                    volume_24h=float(volume_info.get('quoteVolume', 0)),
-                    timestamp=self._get_timestamp()
-                )
+            if '24hr' in results:
+                for item in results['24hr']:
+                    symbol = item['symbol']
+                    tickers[symbol] = Ticker(
+                        symbol=symbol,
+                        last_price=float(item['lastPrice']),
+                        volume_24h=float(item.get('quoteVolume', 0)),
+                        timestamp=int(item.get('closeTime') or timestamp)
+                    )
+            else:
+                for item in results['price']:
+                    symbol = item['symbol']
+                    tickers[symbol] = Ticker(
+                        symbol=symbol,
+                        last_price=float(item['price']),
+                        timestamp=int(item.get('time') or timestamp)
+                    )
+
+            for item in results.get('book', []):
+                ticker = tickers.get(item['symbol'])
+                if ticker:
+                    ticker.bid = float(item['bidPrice'])
+                    ticker.ask = float(item['askPrice'])
+                    ticker.timestamp = max(ticker.timestamp, int(item.get('time') or 0))
 
             return tickers
 
         except Exception as e:
             raise Exception(f"바이낸스 티커 조회 실패: {e}")
 
+    async def fetch_ticker_batch(self, quotes: bool = False) -> TickerBatch:
+        """전체 가격 컬럼 조회 (거래량 생략)
+
+        quotes=False: ticker/price (가중치 2)
+        quotes=True: ticker/bookTicker (가중치 5, 체결가 대신 호가 중간값)
+        """
+        try:
+            if quotes:
+                raw = await self._fetch_book_list(raw=True)
+                return decode_binance_book(raw, timestamp=self._get_timestamp())
+            raw = await self._fetch_price_list(raw=True)
+            return decode_binance_prices(raw, timestamp=self._get_timestamp())
+
+        except Exception as e:
+            raise Exception(f"바이낸스 티커 조회 실패: {e}")
+
+    async def fetch_funding_rates(self) -> FundingBatch:
+        """전체 펀딩비 조회 (premiumIndex, 가중치 10)"""
+        try:
+            raw = await self._cached_request("GET", "/fapi/v1/premiumIndex", raw=True)
+            return decode_binance_funding(raw, timestamp=self._get_timestamp())
+
+        except Exception as e:
+            raise Exception(f"바이낸스 펀딩비 조회 실패: {e}")
+
     async def fetch_ticker(self, symbol: str) -> Ticker:
         """단일 티커 정보 조회"""
         try:
             # Book ticker로 bid/ask 포함해서 조회
-            url = f"{self.base_url}/fapi/v1/ticker/bookTicker"
-            data = await self._request("GET", url, params={'symbol': symbol})
+            data = await self._request("GET", "/fapi/v1/ticker/bookTicker", params={'symbol': symbol})
 
             return Ticker(
                 symbol=symbol,
@@ -135,7 +230,7 @@ class BinanceExchange(BaseExchange):
                 bid=float(data['bidPrice']),
                 ask=float(data['askPrice']),
                 volume_24h=0.0,  # 별도 조회 필요
-                timestamp=self._get_timestamp()
+                timestamp=int(data.get('time') or self._get_timestamp())
             )
 
         except Exception as e:
@@ -144,12 +239,9 @@ class BinanceExchange(BaseExchange):
     async def fetch_24h_volumes(self) -> Dict[str, float]:
         """24시간 거래량 조회"""
         try:
-            url = f"{self.base_url}/fapi/v1/ticker/24hr"
-            data = await self._request("GET", url)
-
             return {
                 item['symbol']: float(item.get('quoteVolume', 0))
-                for item in data
+                for item in await self._fetch_24hr_list()
             }
 
         except Exception as e:
@@ -187,7 +279,8 @@ class BinanceExchange(BaseExchange):
             if params:
                 order_params.update(params)
 
-            data = await self._signed_request("POST", "/fapi/v1/order", order_params)
+            # 재전송하지 않음 (응답 없이 실패해도 접수됐을 수 있음 → newClientOrderId로 조회)
+            data = await self._signed_request("POST", "/fapi/v1/order", order_params, retry=False)
 
             return Order(
                 id=str(data['orderId']),
@@ -205,6 +298,22 @@ class BinanceExchange(BaseExchange):
         except Exception as e:
             raise Exception(f"바이낸스 주문 생성 실패 ({symbol}): {e}")
 
+    @staticmethod
+    def _parse_order(data: Dict, symbol: str) -> Order:
+        """/fapi/v1/order 조회 응답 → Order"""
+        return Order(
+            id=str(data['orderId']),
+            symbol=symbol,
+            side=OrderSide.BUY if data['side'] == 'BUY' else OrderSide.SELL,
+            type=OrderType.MARKET if data['type'] == 'MARKET' else OrderType.LIMIT,
+            amount=float(data['origQty']),
+            price=float(data['price']) if data['price'] != '0' else None,
+            filled=float(data['executedQty']),
+            average=float(data['avgPrice']) if data.get('avgPrice') and data['avgPrice'] != '0' else None,
+            status=data['status'].lower(),
+            timestamp=int(data['updateTime'])
+        )
+
     async def fetch_order(self, order_id: str, symbol: str) -> Order:
         """주문 조회"""
         try:
@@ -213,23 +322,26 @@ class BinanceExchange(BaseExchange):
                 'orderId': order_id
             }
             data = await self._signed_request("GET", "/fapi/v1/order", params)
-
-            return Order(
-                id=str(data['orderId']),
-                symbol=symbol,
-                side=OrderSide.BUY if data['side'] == 'BUY' else OrderSide.SELL,
-                type=OrderType.MARKET if data['type'] == 'MARKET' else OrderType.LIMIT,
-                amount=float(data['origQty']),
-                price=float(data['price']) if data['price'] != '0' else None,
-                filled=float(data['executedQty']),
-                average=float(data['avgPrice']) if data.get('avgPrice') and data['avgPrice'] != '0' else None,
-                status=data['status'].lower(),
-                timestamp=int(data['updateTime'])
-            )
+            return self._parse_order(data, symbol)
 
         except Exception as e:
             raise Exception(f"바이낸스 주문 조회 실패 ({order_id}): {e}")
 
+    async def fetch_order_by_client_id(self, client_order_id: str, symbol: str) -> Optional[Order]:
+        """클라이언트 주문 ID로 주문 조회 (접수되지 않은 주문이면 None)"""
+        try:
+            params = {
+                'symbol': symbol,
+                'origClientOrderId': client_order_id
+            }
+            data = await self._signed_request("GET", "/fapi/v1/order", params)
+            return self._parse_order(data, symbol)
+
+        except Exception as e:
+            if "-2013" in str(e) or "order does not exist" in str(e).lower():
+                return None
+            raise Exception(f"바이낸스 주문 조회 실패 ({client_order_id}): {e}")
+
     async def cancel_order(self, order_id: str, symbol: str) -> bool:
         """주문 취소"""
         try:
@@ -3,8 +3,12 @@ import hashlib
 import hmac
 import urllib.parse
 import json
-from typing import Dict, List, Optional
-from .base import BaseExchange, Ticker, Order, Position, OrderType, OrderSide
+from typing import Any, Dict, Iterable, List, Optional
+from .base import (
+    BaseExchange, FeeSchedule, FundingBatch, Ticker, TickerBatch, Order, Position, OrderType, OrderSide
+)
+from .decoders import decode_bybit_funding, decode_bybit_tickers
+from .rate_limiter import RateLimiter, TokenBucket
 import asyncio
 import logging
 
@@ -12,13 +16,16 @@ import logging
 class BybitExchange(BaseExchange):
     """바이빗 선물 거래소 구현"""
 
-    def __init__(self, api_key: str = "", secret: str = ""):
-        super().__init__(api_key, secret)
+    # 항상 실제 메인넷 사용 (api.bytick.com은 동일 API의 공식 대체 도메인)
+    default_base_urls = ["https://api.bybit.com", "https://api.bytick.com"]
+    ping_path = "/v5/market/time"
+    fee_schedule = FeeSchedule(maker_pct=0.02, taker_pct=0.055)
+    client_order_id_param = "orderLinkId"
+    reduce_only_params = {'reduceOnly': True}
 
-        # 항상 실제 메인넷 사용
-        self.base_url = "https://api.bybit.com"
+    def __init__(self, api_key: str = "", secret: str = "", base_urls: Optional[List[str]] = None):
+        super().__init__(api_key, secret, base_urls)
 
-        self._rate_limit_delay = 0.1
         self._symbols_cache = {}
         self._market_info = {}
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
@@ -27,6 +34,31 @@ class BybitExchange(BaseExchange):
     def name(self) -> str:
         return "bybit"
 
+    def _create_rate_limiter(self) -> RateLimiter:
+        """IP당 600회/5초, 주문 생성 10회/초 한도"""
+        return RateLimiter(
+            buckets={
+                'ip': TokenBucket(capacity=600, window=5.0),
+                'order_create': TokenBucket(capacity=10, window=1.0),
+            },
+            routes={'/v5/order/create': ['ip', 'order_create']},
+            default_route=['ip']
+        )
+
+    def _sync_rate_limit(self, endpoint: str, headers) -> None:
+        """X-Bapi-Limit / X-Bapi-Limit-Status 헤더 반영 (엔드포인트별 잔여 한도)"""
+        limit = self._safe_float(headers.get('X-Bapi-Limit'))
+        remaining = self._safe_float(headers.get('X-Bapi-Limit-Status'))
+        if limit <= 0:
+            return
+
+        used_ratio = (limit - remaining) / limit
+        for name in self.rate_limiter.routes.get(endpoint, []):
+            if name != 'ip':
+                # 헤더 한도 기준 사용 비율을 버킷 용량으로 환산
+                bucket = self.rate_limiter.buckets[name]
+                bucket.sync_used(used_ratio * bucket.capacity)
+
     def _safe_float(self, value, default: float = 0.0) -> float:
         """안전한 float 변환"""
         if value is None or value == '' or value == '0':
@@ -50,17 +82,24 @@ class BybitExchange(BaseExchange):
 
         return False
 
-    async def fetch_tickers(self) -> Dict[str, Ticker]:
-        """모든 티커 정보 조회 (영구계약만)"""
-        try:
-            url = f"{self.base_url}/v5/market/tickers"
-            params = {'category': 'linear'}
-            data = await self._request("GET", url, params=params)
+    async def _fetch_linear_tickers(self, raw: bool = False):
+        """linear 전체 티커 응답 (사이클 내 공유, raw=True면 디코더용 bytes - retCode 검사는 디코더에서)"""
+        data = await self._cached_request("GET", "/v5/market/tickers", params={'category': 'linear'}, raw=raw)
+        if raw:
+            return data
 
-            if data.get('retCode') != 0:
-                raise Exception(f"바이빗 API 오류: {data.get('retMsg')}")
+        if data.get('retCode') != 0:
+            raise Exception(f"바이빗 API 오류: {data.get('retMsg')}")
+
+        return data
 
+    async def fetch_tickers(self, fields: Optional[Iterable[str]] = None) -> Dict[str, Ticker]:
+        """모든 티커 정보 조회 (영구계약만, 단일 엔드포인트가 모든 필드 제공)"""
+        try:
+            data = await self._fetch_linear_tickers()
             result_list = data.get('result', {}).get('list', [])
+            # 심볼별 시각 대신 응답 생성 시각 (ms)
+            event_time = int(data.get('time') or self._get_timestamp())
 
             tickers = {}
             perpetual_count = 0
@@ -100,7 +139,7 @@ class BybitExchange(BaseExchange):
                         bid=bid_price if bid_price > 0 else None,
                         ask=ask_price if ask_price > 0 else None,
                         volume_24h=volume_24h,
-                        timestamp=self._get_timestamp()
+                        timestamp=event_time
                     )
 
                 except (KeyError, ValueError, TypeError) as e:
@@ -118,6 +157,26 @@ class BybitExchange(BaseExchange):
             self.logger.error(f"바이빗 티커 조회 실패: {e}")
             raise Exception(f"바이빗 티커 조회 실패: {e}")
 
+    async def fetch_ticker_batch(self, quotes: bool = False) -> TickerBatch:
+        """전체 티커 컬럼 조회 (영구계약만, Ticker 객체 생성 생략, 호가 항상 포함)"""
+        try:
+            raw = await self._fetch_linear_tickers(raw=True)
+            return decode_bybit_tickers(raw, timestamp=self._get_timestamp())
+
+        except Exception as e:
+            self.logger.error(f"바이빗 티커 조회 실패: {e}")
+            raise Exception(f"바이빗 티커 조회 실패: {e}")
+
+    async def fetch_funding_rates(self) -> FundingBatch:
+        """전체 펀딩비 조회 (티커 응답에 포함, 추가 요청 없음)"""
+        try:
+            raw = await self._fetch_linear_tickers(raw=True)
+            return decode_bybit_funding(raw, timestamp=self._get_timestamp())
+
+        except Exception as e:
+            self.logger.error(f"바이빗 펀딩비 조회 실패: {e}")
+            raise Exception(f"바이빗 펀딩비 조회 실패: {e}")
+
     async def fetch_ticker(self, symbol: str) -> Ticker:
         """단일 티커 정보 조회"""
         try:
@@ -125,9 +184,8 @@ class BybitExchange(BaseExchange):
             if not self._is_perpetual_contract(symbol):
                 raise Exception(f"영구계약이 아님: {symbol}")
 
-            url = f"{self.base_url}/v5/market/tickers"
             params = {'category': 'linear', 'symbol': symbol}
-            data = await self._request("GET", url, params=params)
+            data = await self._request("GET", "/v5/market/tickers", params=params)
 
             if data.get('retCode') != 0:
                 raise Exception(f"바이빗 API 오류: {data.get('retMsg')}")
@@ -157,7 +215,7 @@ class BybitExchange(BaseExchange):
                 bid=self._safe_float(item.get('bid1Price')),
                 ask=self._safe_float(item.get('ask1Price')),
                 volume_24h=self._safe_float(item.get('turnover24h')),
-                timestamp=self._get_timestamp()
+                timestamp=int(data.get('time') or self._get_timestamp())
             )
 
         except Exception as e:
@@ -167,12 +225,17 @@ class BybitExchange(BaseExchange):
     async def fetch_24h_volumes(self) -> Dict[str, float]:
         """24시간 거래량 조회 (영구계약만)"""
         try:
-            tickers = await self.fetch_tickers()  # 이미 영구계약만 필터링됨
+            # 티커 조회와 같은 스냅샷 공유 (중복 다운로드 없음)
+            data = await self._fetch_linear_tickers()
             volumes = {}
 
-            for symbol, ticker in tickers.items():
-                if ticker.volume_24h > 0:
-                    volumes[symbol] = ticker.volume_24h
+            for item in data.get('result', {}).get('list', []):
+                symbol = item.get('symbol', '')
+                if not self._is_perpetual_contract(symbol):
+                    continue
+                volume = self._safe_float(item.get('turnover24h'))
+                if volume > 0:
+                    volumes[symbol] = volume
 
             self.logger.info(f"바이빗 거래량 조회 완료: {len(volumes)}개")
             return volumes
@@ -187,9 +250,8 @@ class BybitExchange(BaseExchange):
             return list(self._symbols_cache.keys())
 
         try:
-            url = f"{self.base_url}/v5/market/instruments-info"
             params = {'category': 'linear'}
-            data = await self._request("GET", url, params=params)
+            data = await self._request("GET", "/v5/market/instruments-info", params=params)
 
             if data.get('retCode') != 0:
                 raise Exception(f"바이빗 API 오류: {data.get('retMsg')}")
@@ -250,6 +312,9 @@ class BybitExchange(BaseExchange):
 
         return self._symbols_cache.get(formatted)
 
+    def order_params(self, symbol: str) -> Dict[str, Any]:
+        return {'category': 'linear'}
+
     def calculate_quantity(self, symbol: str, price: float, target_usdt: float) -> float:
         """목표 USDT 기준 수량 계산"""
         qty = target_usdt / price
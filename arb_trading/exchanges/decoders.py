@@ -0,0 +1,132 @@
+# arb_trading/exchanges/decoders.py
+"""엔드포인트별 티커 디코더
+
+전체 시장 티커 응답(bytes)을 Ticker 객체 없이 바로 TickerBatch(컬럼)로 변환한다.
+스프레드 계산은 심볼/가격 컬럼만 필요하므로 심볼당 dataclass 생성을 생략한다.
+응답에 시세 기준 시각(bookTicker 호가 갱신 시각, 바이빗 응답 생성 시각)이 있으면 event_times 컬럼으로
+옮겨 거래소 간 시각 차이 판단에 쓴다. ticker/price의 time은 심볼별 마지막 체결 시각이라 시세 기준 시각이
+아니므로 넘기지 않는다 (엔진은 수신 시각을 사용 → 거래가 뜸한 심볼이 시각 차이 규칙에 걸리지 않음).
+"""
+
+import math
+from typing import Any, Optional, Union
+
+from .base import FundingBatch, TickerBatch
+from ..utils import json_codec
+
+
+def _load(payload: Union[bytes, str, Any]) -> Any:
+    """bytes/str는 디코딩, 이미 디코딩된 객체(캐시 공유분)는 그대로 사용"""
+    if isinstance(payload, (bytes, bytearray, str)):
+        return json_codec.loads(payload)
+    return payload
+
+
+def decode_binance_prices(raw: Union[bytes, Any], timestamp: int = 0) -> TickerBatch:
+    """바이낸스 /fapi/v1/ticker/price 전체 목록 디코딩"""
+    data = _load(raw)
+
+    symbols = [item['symbol'] for item in data]
+    last_prices = [float(item['price']) for item in data]
+
+    # time은 심볼별 마지막 체결 시각 (가격 기준 시각 아님) → event_times 없음 (수신 시각 기준)
+    return TickerBatch(symbols=symbols, last_prices=last_prices, timestamp=timestamp)
+
+
+def decode_binance_book(raw: Union[bytes, Any], timestamp: int = 0) -> TickerBatch:
+    """바이낸스 /fapi/v1/ticker/bookTicker 전체 목록 디코딩 (체결가 자리에 호가 중간값)"""
+    data = _load(raw)
+
+    symbols = [item['symbol'] for item in data]
+    bids = [float(item['bidPrice']) for item in data]
+    asks = [float(item['askPrice']) for item in data]
+    last_prices = [(bid + ask) / 2 for bid, ask in zip(bids, asks)]
+    event_times = [int(item.get('time') or timestamp) for item in data]  # 호가 갱신 시각
+
+    return TickerBatch(symbols=symbols, last_prices=last_prices,
+                       bids=bids, asks=asks, timestamp=timestamp, event_times=event_times)
+
+
+def _optional_price(value: Optional[str]) -> float:
+    """빈 문자열/None → NaN (호가 없음, 0 가격과 구분)"""
+    return float(value) if value else math.nan
+
+
+def decode_bybit_tickers(raw: Union[bytes, Any], timestamp: int = 0) -> TickerBatch:
+    """바이빗 /v5/market/tickers (linear) 디코딩 - USDT 영구계약만"""
+    data = _load(raw)
+
+    if data.get('retCode') != 0:
+        raise Exception(f"바이빗 API 오류: {data.get('retMsg')}")
+
+    symbols = []
+    last_prices = []
+    bids = []
+    asks = []
+
+    for item in data['result']['list']:
+        symbol = item['symbol']
+        # 만료일 있는 선물(BTCUSDT-26DEC25) 및 비USDT 계약 제외
+        if '-' in symbol or not symbol.endswith('USDT'):
+            continue
+
+        last_price = _optional_price(item.get('lastPrice'))
+        if not last_price > 0:  # 없음(NaN)/0 이하
+            continue
+
+        symbols.append(symbol)
+        last_prices.append(last_price)
+        bids.append(_optional_price(item.get('bid1Price')))
+        asks.append(_optional_price(item.get('ask1Price')))
+
+    # 심볼별 시각은 없고 응답 생성 시각만 있음
+    event_time = int(data.get('time') or timestamp)
+
+    return TickerBatch(symbols=symbols, last_prices=last_prices,
+                       bids=bids, asks=asks, timestamp=timestamp,
+                       event_times=[event_time] * len(symbols))
+
+
+def decode_binance_funding(raw: Union[bytes, Any], timestamp: int = 0,
+                           interval_hours: float = 8.0) -> FundingBatch:
+    """바이낸스 /fapi/v1/premiumIndex 전체 목록 디코딩 (정산 주기는 응답에 없어 기본값)"""
+    data = _load(raw)
+
+    symbols = []
+    rates_pct = []
+    next_times = []
+    for item in data:
+        rate = item.get('lastFundingRate')
+        if rate in (None, ''):
+            continue
+        symbols.append(item['symbol'])
+        rates_pct.append(float(rate) * 100)
+        next_times.append(int(item.get('nextFundingTime') or 0))
+
+    return FundingBatch(symbols=symbols, rates_pct=rates_pct, next_funding_times=next_times,
+                        interval_hours=[interval_hours] * len(symbols), timestamp=timestamp)
+
+
+def decode_bybit_funding(raw: Union[bytes, Any], timestamp: int = 0) -> FundingBatch:
+    """바이빗 /v5/market/tickers (linear) 펀딩비 디코딩 - USDT 영구계약만"""
+    data = _load(raw)
+
+    if data.get('retCode') != 0:
+        raise Exception(f"바이빗 API 오류: {data.get('retMsg')}")
+
+    symbols = []
+    rates_pct = []
+    next_times = []
+    intervals = []
+    for item in data['result']['list']:
+        symbol = item['symbol']
+        rate = item.get('fundingRate')
+        if '-' in symbol or not symbol.endswith('USDT') or rate in (None, ''):
+            continue
+        symbols.append(symbol)
+        rates_pct.append(float(rate) * 100)
+        next_times.append(int(item.get('nextFundingTime') or 0))
+        intervals.append(float(item.get('fundingIntervalHour') or 8))
+
+    return FundingBatch(symbols=symbols, rates_pct=rates_pct, next_funding_times=next_times,
+                        interval_hours=intervals, timestamp=timestamp)
@@ -0,0 +1,114 @@
+# arb_trading/exchanges/endpoints.py
+"""거래소 동등 엔드포인트 풀 (지연 시간 순위 + 장애 전환)
+
+같은 API를 제공하는 여러 호스트를 두고, _request 타이밍으로 갱신되는
+EWMA 지연 시간과 오류 점수에 따라 가장 빠른 정상 호스트로 요청을 보낸다.
+연결 오류가 난 호스트는 잠시 제외(cooldown)하고 다음 후보로 즉시 전환한다.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+@dataclass
+class EndpointStats:
+    """엔드포인트별 누적 상태"""
+    url: str
+    index: int
+    latency: Optional[float] = None  # EWMA 응답 시간 (초), 측정 전이면 None
+    error_score: float = 0.0  # EWMA 실패율 (0~1)
+    consecutive_failures: int = 0
+    unhealthy_until: float = 0.0
+
+    def is_healthy(self, now: float) -> bool:
+        return now >= self.unhealthy_until
+
+
+class EndpointPool:
+    """지연 시간/오류 점수 기반 엔드포인트 선택"""
+
+    def __init__(self, urls: List[str], alpha: float = 0.2,
+                 error_weight: float = 4.0, cooldown: float = 10.0,
+                 max_cooldown: float = 120.0):
+        """
+        Args:
+            urls: 동등한 base URL 목록 (앞쪽이 기본 우선순위)
+            alpha: EWMA 가중치
+            error_weight: 점수 계산 시 실패율 가중치 (지연 × (1 + 실패율 × error_weight))
+            cooldown: 연결 오류 후 제외 시간 (연속 실패마다 2배, max_cooldown까지)
+        """
+        if not urls:
+            raise Exception("엔드포인트가 최소 1개 필요합니다")
+
+        self.alpha = alpha
+        self.error_weight = error_weight
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.endpoints = [EndpointStats(url=url.rstrip('/'), index=i) for i, url in enumerate(urls)]
+        self._by_url = {endpoint.url: endpoint for endpoint in self.endpoints}
+
+    def __len__(self) -> int:
+        return len(self.endpoints)
+
+    @property
+    def urls(self) -> List[str]:
+        return [endpoint.url for endpoint in self.endpoints]
+
+    def _score(self, endpoint: EndpointStats) -> float:
+        # 측정 전 엔드포인트는 0으로 두어 한 번은 시도되도록 함
+        latency = endpoint.latency if endpoint.latency is not None else 0.0
+        return latency * (1 + endpoint.error_score * self.error_weight)
+
+    def ranked(self) -> List[str]:
+        """우선순위 순 URL (정상 → 점수 → 설정 순서)"""
+        now = time.monotonic()
+        ordered = sorted(
+            self.endpoints,
+            key=lambda e: (not e.is_healthy(now), self._score(e), e.index)
+        )
+        return [endpoint.url for endpoint in ordered]
+
+    def best(self) -> str:
+        """현재 가장 빠른 정상 엔드포인트 (모두 장애면 최우선 후보)"""
+        return self.ranked()[0]
+
+    def has_healthy_alternative(self, url: str) -> bool:
+        """url 외에 정상 엔드포인트가 있는지"""
+        now = time.monotonic()
+        return any(e.url != url and e.is_healthy(now) for e in self.endpoints)
+
+    def record_success(self, url: str, duration: float):
+        endpoint = self._by_url.get(url)
+        if endpoint is None:
+            return
+        if endpoint.latency is None:
+            endpoint.latency = duration
+        else:
+            endpoint.latency = self.alpha * duration + (1 - self.alpha) * endpoint.latency
+        endpoint.error_score *= (1 - self.alpha)
+        endpoint.consecutive_failures = 0
+        endpoint.unhealthy_until = 0.0
+
+    def record_failure(self, url: str, exclude: bool = False):
+        """실패 기록 (exclude=True면 cooldown 동안 후보에서 제외)"""
+        endpoint = self._by_url.get(url)
+        if endpoint is None:
+            return
+        endpoint.error_score = self.alpha + (1 - self.alpha) * endpoint.error_score
+        endpoint.consecutive_failures += 1
+        if exclude:
+            cooldown = min(self.cooldown * 2 ** (endpoint.consecutive_failures - 1), self.max_cooldown)
+            endpoint.unhealthy_until = time.monotonic() + cooldown
+
+    def stats(self) -> List[dict]:
+        now = time.monotonic()
+        return [
+            {
+                "url": e.url,
+                "지연(ms)": None if e.latency is None else round(e.latency * 1000, 1),
+                "실패율": round(e.error_score, 3),
+                "정상": e.is_healthy(now),
+            }
+            for e in self.endpoints
+        ]
@@ -0,0 +1,97 @@
+# arb_trading/exchanges/hedging.py
+"""요청 마감 시간(deadline)과 헤지 요청 보조 도구
+
+- deadline_scope: 사이클 예산에서 파생한 마감 시각을 contextvar로 전달
+  (scope 안에서 생성된 태스크에도 그대로 상속됨)
+- LatencyTracker: 엔드포인트별 최근 응답 시간 분포 (p95 → 헤지 발사 시점)
+- HedgeBudget: 요청 수 대비 헤지 비율 상한 (레이트 리밋 보호)
+"""
+
+import contextvars
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Optional
+
+
+class DeadlineExceededError(Exception):
+    """요청 마감 시간 초과 (재시도하지 않음)"""
+    pass
+
+
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "request_deadline", default=None
+)
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]):
+    """지금부터 seconds 이내에 끝나야 하는 구간 (바깥 마감이 더 이르면 유지)"""
+    if seconds is None:
+        yield
+        return
+
+    deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        deadline = min(deadline, current)
+
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """현재 마감까지 남은 시간 (마감 없으면 None)"""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+class LatencyTracker:
+    """엔드포인트별 최근 응답 시간 (고정 크기 윈도우)"""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=self.window))
+
+    def record(self, endpoint: str, duration: float):
+        self._samples[endpoint].append(duration)
+
+    def percentile(self, endpoint: str, pct: float = 95.0) -> Optional[float]:
+        """pct 백분위 응답 시간 (표본 부족 시 None)"""
+        samples = self._samples.get(endpoint)
+        if not samples or len(samples) < self.min_samples:
+            return None
+
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(len(ordered) * pct / 100))
+        return ordered[index]
+
+
+class HedgeBudget:
+    """헤지 예산: 요청 1건마다 ratio만큼 적립, 헤지 1건에 1만큼 소비
+
+    ratio=0.1이면 장기적으로 요청의 10% 이상 헤지하지 않는다.
+    """
+
+    def __init__(self, ratio: float = 0.1, max_credit: float = 10.0):
+        self.ratio = ratio
+        self.max_credit = max_credit
+        self.credit = 1.0
+        self.fired = 0
+        self.won = 0
+
+    def deposit(self):
+        self.credit = min(self.max_credit, self.credit + self.ratio)
+
+    def try_spend(self) -> bool:
+        if self.credit < 1.0:
+            return False
+        self.credit -= 1.0
+        self.fired += 1
+        return True
@@ -0,0 +1,135 @@
+# arb_trading/exchanges/rate_limiter.py
+"""가중치 기반 토큰 버킷 레이트 리미터
+
+고정 sleep 대신 거래소 한도(가중치/윈도우)를 토큰 버킷으로 관리한다.
+예산이 실제로 바닥날 때만 대기하고, 응답 헤더의 사용량으로 버킷을 보정한다.
+"""
+
+import asyncio
+import time
+from typing import Dict, List, Optional, Tuple, Union
+
+
+class TokenBucket:
+    """윈도우당 용량을 균등 재충전하는 토큰 버킷"""
+
+    def __init__(self, capacity: float, window: float, reserve_ratio: float = 0.05):
+        """
+        Args:
+            capacity: 윈도우당 허용 가중치
+            window: 윈도우 길이 (초)
+            reserve_ratio: 헤더 보정 오차 대비 여유분 비율
+        """
+        self.capacity = float(capacity)
+        self.window = float(window)
+        self.refill_rate = self.capacity / self.window
+        self.reserve = self.capacity * reserve_ratio
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+            self._updated = now
+
+    def available(self) -> float:
+        """현재 사용 가능 토큰"""
+        self._refill()
+        return self.tokens
+
+    def wait_time(self, weight: float) -> float:
+        """weight 소비까지 필요한 대기 시간 (0이면 즉시 가능)"""
+        self._refill()
+        deficit = weight + self.reserve - self.tokens
+        if deficit <= 0:
+            return 0.0
+        return deficit / self.refill_rate
+
+    def consume(self, weight: float):
+        self._refill()
+        self.tokens -= weight
+
+    def sync_used(self, used: float):
+        """서버가 보고한 윈도우 사용량으로 보정 (더 보수적인 쪽 채택)"""
+        self._refill()
+        self.tokens = min(self.tokens, self.capacity - used)
+
+    def drain(self):
+        """429 수신 시 버킷 비움"""
+        self._refill()
+        self.tokens = min(self.tokens, 0.0)
+
+
+class RateLimiter:
+    """거래소별 레이트 리미터 (엔드포인트별 버킷 라우팅)"""
+
+    def __init__(self, buckets: Dict[str, TokenBucket],
+                 weights: Optional[Dict[str, Union[int, Tuple[int, int]]]] = None,
+                 routes: Optional[Dict[str, List[str]]] = None,
+                 default_route: Optional[List[str]] = None):
+        """
+        Args:
+            buckets: 버킷 이름 → TokenBucket
+            weights: 엔드포인트 경로 → 가중치 또는 (전체 조회, 단일 심볼) 가중치
+            routes: 엔드포인트 경로 (또는 "메소드 경로") → 적용할 버킷 이름 목록
+                (메소드를 붙인 키가 있으면 우선, 예: 주문 조회 GET은 주문 수 버킷 제외)
+            default_route: 라우트가 없는 엔드포인트에 적용할 버킷 목록
+        """
+        self.buckets = buckets
+        self.weights = weights or {}
+        self.routes = routes or {}
+        self.default_route = default_route if default_route is not None else list(buckets.keys())[:1]
+        self.total_wait = 0.0
+        self._lock = asyncio.Lock()
+
+    def weight_for(self, endpoint: str, params: Optional[Dict] = None) -> int:
+        """엔드포인트 요청 가중치"""
+        weight = self.weights.get(endpoint, 1)
+        if isinstance(weight, tuple):
+            full_weight, single_weight = weight
+            return single_weight if params and 'symbol' in params else full_weight
+        return weight
+
+    def _buckets_for(self, endpoint: str, method: Optional[str] = None) -> List[TokenBucket]:
+        names = self.routes.get(f"{method.upper()} {endpoint}") if method else None
+        if names is None:
+            names = self.routes.get(endpoint, self.default_route)
+        return [self.buckets[name] for name in names if name in self.buckets]
+
+    def has_capacity(self, endpoint: str, weight: int, headroom: float = 0.0,
+                     method: Optional[str] = None) -> bool:
+        """대기 없이 weight를 추가 소비할 수 있는지 (headroom: 남겨둘 용량 비율)"""
+        for bucket in self._buckets_for(endpoint, method):
+            if bucket.available() - weight < bucket.reserve + bucket.capacity * headroom:
+                return False
+        return True
+
+    async def acquire(self, endpoint: str, weight: int = 1, method: Optional[str] = None):
+        """토큰 확보 (예산이 부족할 때만 대기)"""
+        buckets = self._buckets_for(endpoint, method)
+        if not buckets:
+            return
+
+        while True:
+            async with self._lock:
+                wait = max(bucket.wait_time(weight) for bucket in buckets)
+                if wait <= 0:
+                    for bucket in buckets:
+                        bucket.consume(weight)
+                    return
+
+            self.total_wait += wait
+            await asyncio.sleep(wait)
+
+    def sync_used(self, bucket_name: str, used: float):
+        """응답 헤더 사용량 반영"""
+        bucket = self.buckets.get(bucket_name)
+        if bucket:
+            bucket.sync_used(used)
+
+    def penalize(self, endpoint: str, method: Optional[str] = None):
+        """429 응답 시 해당 엔드포인트 버킷 비움"""
+        for bucket in self._buckets_for(endpoint, method):
+            bucket.drain()
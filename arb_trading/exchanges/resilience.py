@@ -0,0 +1,125 @@
+# arb_trading/exchanges/resilience.py
+"""거래소 장애 대응: 회로 차단기 + 지터 재시도 정책
+
+- CircuitBreaker: 연속 실패가 임계치를 넘으면 열림(open) → 즉시 실패,
+  recovery_timeout 후 한 건만 시험(half_open)해 성공하면 닫힘
+- RetryPolicy: decorrelated jitter 백오프 (고정 1~2초 대기 대체)
+"""
+
+import random
+import time
+from typing import Callable, Optional
+
+
+class CircuitOpenError(Exception):
+    """회로 차단 중 (요청을 보내지 않고 즉시 실패)"""
+    pass
+
+
+class CircuitBreaker:
+    """거래소별 회로 차단기"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 10.0,
+                 max_recovery_timeout: float = 120.0,
+                 on_state_change: Optional[Callable[[str], None]] = None):
+        """
+        Args:
+            failure_threshold: 회로를 여는 연속 실패 수
+            recovery_timeout: 열린 뒤 시험 요청까지 대기 (재차 실패 시 2배, max_recovery_timeout까지)
+            on_state_change: 상태 전환 콜백 (새 상태 문자열)
+        """
+        self.failure_threshold = failure_threshold
+        self.base_recovery_timeout = recovery_timeout
+        self.max_recovery_timeout = max_recovery_timeout
+        self.on_state_change = on_state_change
+
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.recovery_timeout = recovery_timeout
+        self.opened_at = 0.0
+        self.open_count = 0
+        self._probe_in_flight = False
+
+    def _set_state(self, state: str):
+        if state == self.state:
+            return
+        self.state = state
+        if self.on_state_change:
+            self.on_state_change(state)
+
+    @property
+    def is_open(self) -> bool:
+        """요청이 즉시 거절되는 상태인지 (상태 변경 없음)"""
+        if self.state == self.OPEN:
+            return time.monotonic() < self.opened_at + self.recovery_timeout
+        if self.state == self.HALF_OPEN:
+            return self._probe_in_flight
+        return False
+
+    def retry_after(self) -> float:
+        """다음 시험 요청까지 남은 시간 (초)"""
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self.opened_at + self.recovery_timeout - time.monotonic())
+
+    def allow_request(self) -> bool:
+        """요청 허용 여부 (열린 뒤 recovery_timeout이 지나면 한 건만 시험 허용)"""
+        if self.state == self.CLOSED:
+            return True
+
+        if self.state == self.OPEN:
+            if time.monotonic() < self.opened_at + self.recovery_timeout:
+                return False
+            self._set_state(self.HALF_OPEN)
+
+        if self._probe_in_flight:
+            return False
+        self._probe_in_flight = True
+        return True
+
+    def record_success(self):
+        self.consecutive_failures = 0
+        self._probe_in_flight = False
+        if self.state != self.CLOSED:
+            self.recovery_timeout = self.base_recovery_timeout
+            self._set_state(self.CLOSED)
+
+    def record_failure(self):
+        self.consecutive_failures += 1
+        if self.state == self.HALF_OPEN:
+            # 시험 요청 실패: 더 길게 다시 열기
+            self._probe_in_flight = False
+            self.recovery_timeout = min(self.recovery_timeout * 2, self.max_recovery_timeout)
+            self._open()
+        elif self.state == self.CLOSED and self.consecutive_failures >= self.failure_threshold:
+            self._open()
+
+    def release_probe(self):
+        """시험 요청이 성공/실패 판정 없이 끝난 경우 (예: 취소)"""
+        self._probe_in_flight = False
+
+    def _open(self):
+        self.opened_at = time.monotonic()
+        self.open_count += 1
+        self._set_state(self.OPEN)
+
+
+class RetryPolicy:
+    """decorrelated jitter 재시도 정책
+
+    다음 대기 = min(cap, uniform(base, 이전 대기 × 3))
+    여러 클라이언트의 재시도가 같은 시점에 몰리지 않도록 분산한다.
+    """
+
+    def __init__(self, max_attempts: int = 3, base: float = 0.1, cap: float = 2.0):
+        self.max_attempts = max_attempts
+        self.base = base
+        self.cap = cap
+
+    def next_delay(self, previous: Optional[float] = None) -> float:
+        previous = previous or self.base
+        return min(self.cap, random.uniform(self.base, previous * 3))
@@ -0,0 +1,398 @@
+# arb_trading/exchanges/streams.py
+"""WebSocket 기반 실시간 시세 스트림
+
+REST 스냅샷 대신 거래소 WebSocket 구독으로 최신 티커 보드를 유지한다.
+- 바이낸스: !ticker@arr (체결가/거래대금) + !bookTicker (호가)
+- 바이빗: tickers.{symbol} (snapshot + delta)
+재연결 시에는 REST 스냅샷으로 보드를 다시 채워 끊긴 구간을 메운다.
+"""
+
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional
+
+import aiohttp
+
+from .base import BaseExchange, Ticker, TICKER_FIELDS
+from ..utils import json_codec
+
+
+class TickerBoard:
+    """거래소별 최신 티커 보드 (메모리)"""
+
+    def __init__(self):
+        self._tickers: Dict[str, Dict[str, Ticker]] = {}
+        self._last_update: Dict[str, float] = {}
+        self._listeners: List[Callable[[str, Ticker], None]] = []
+
+    def add_listener(self, listener: Callable[[str, Ticker], None]):
+        """티커 갱신 리스너 등록"""
+        self._listeners.append(listener)
+
+    def update(self, exchange: str, symbol: str,
+               last_price: Optional[float] = None,
+               bid: Optional[float] = None,
+               ask: Optional[float] = None,
+               volume_24h: Optional[float] = None,
+               timestamp: Optional[int] = None):
+        """부분 갱신 (전달된 필드만 덮어씀)
+
+        Args:
+            timestamp: 거래소 이벤트 시각 (ms, 미지정 시 수신 시각)
+        """
+        tickers = self._tickers.setdefault(exchange, {})
+        ticker = tickers.get(symbol)
+
+        if ticker is None:
+            if last_price is None:
+                # 체결가가 없는 첫 호가 갱신은 bid/ask 중간값으로 대체
+                if bid is None or ask is None:
+                    return
+                last_price = (bid + ask) / 2
+            ticker = Ticker(symbol=symbol, last_price=last_price)
+            tickers[symbol] = ticker
+        elif last_price is not None:
+            ticker.last_price = last_price
+
+        if bid is not None:
+            ticker.bid = bid
+        if ask is not None:
+            ticker.ask = ask
+        if volume_24h is not None:
+            ticker.volume_24h = volume_24h
+        ticker.timestamp = timestamp if timestamp is not None else int(time.time() * 1000)
+
+        self._last_update[exchange] = time.time()
+
+        for listener in self._listeners:
+            listener(exchange, ticker)
+
+    def replace(self, exchange: str, tickers: Dict[str, Ticker]):
+        """REST 스냅샷으로 보드 전체 교체 (재동기화)"""
+        self._tickers[exchange] = dict(tickers)
+        self._last_update[exchange] = time.time()
+
+        # 끊긴 구간의 변경도 리스너에 반영
+        for ticker in tickers.values():
+            for listener in self._listeners:
+                listener(exchange, ticker)
+
+    def snapshot(self, exchange: str) -> Dict[str, Ticker]:
+        """거래소 티커 스냅샷 (얕은 복사)"""
+        return dict(self._tickers.get(exchange, {}))
+
+    def age(self, exchange: str) -> float:
+        """마지막 갱신 이후 경과 시간 (초)"""
+        last = self._last_update.get(exchange)
+        if last is None:
+            return float('inf')
+        return time.time() - last
+
+    def clear(self, exchange: Optional[str] = None):
+        """보드 초기화"""
+        if exchange is None:
+            self._tickers.clear()
+            self._last_update.clear()
+        else:
+            self._tickers.pop(exchange, None)
+            self._last_update.pop(exchange, None)
+
+
+class ExchangeStream(ABC):
+    """거래소 WebSocket 스트림 공통 구현"""
+
+    heartbeat_interval = 20.0  # 애플리케이션 레벨 ping 간격 (초)
+    symbol_scoped = False  # 심볼별 구독 여부 (심볼 변경 시 재연결 필요)
+
+    def __init__(self, exchange: BaseExchange, board: TickerBoard,
+                 stale_timeout: float = 30.0,
+                 reconnect_delay: float = 1.0,
+                 max_reconnect_delay: float = 30.0):
+        self.exchange = exchange
+        self.board = board
+        self.stale_timeout = stale_timeout
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+
+        self.symbols: List[str] = []
+        self.connected = False
+        self.reconnect_count = 0
+        self._task: Optional[asyncio.Task] = None
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._running = False
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+
+    @property
+    def name(self) -> str:
+        return self.exchange.name
+
+    @abstractmethod
+    def _build_url(self) -> str:
+        """WebSocket 접속 URL"""
+        pass
+
+    def _build_subscribe_messages(self) -> List[Dict]:
+        """구독 메시지 목록 (URL 구독 방식이면 빈 목록)"""
+        return []
+
+    def _build_heartbeat_message(self) -> Optional[Dict]:
+        """애플리케이션 레벨 ping 메시지 (없으면 None)"""
+        return None
+
+    @abstractmethod
+    def _handle_message(self, message: Dict):
+        """수신 메시지 처리 → 보드 갱신"""
+        pass
+
+    def set_symbols(self, symbols: List[str]):
+        """구독 심볼 설정 (다음 연결부터 적용)"""
+        self.symbols = list(symbols)
+
+    async def start(self, symbols: Optional[List[str]] = None):
+        """스트림 시작"""
+        if symbols is not None:
+            self.set_symbols(symbols)
+
+        if self._task and not self._task.done():
+            return
+
+        self._running = True
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """스트림 중지"""
+        self._running = False
+
+        if self._ws is not None and not self._ws.closed:
+            await self._ws.close()
+
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
+
+        self.connected = False
+
+    async def restart(self):
+        """현재 연결을 끊고 재연결 (구독 변경 반영용)"""
+        if self._ws is not None and not self._ws.closed:
+            await self._ws.close()
+
+    async def _run(self):
+        """연결 유지 루프 (자동 재연결)"""
+        delay = self.reconnect_delay
+
+        while self._running:
+            try:
+                await self._connect_and_listen()
+                delay = self.reconnect_delay
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.warning(f"{self.name} 스트림 오류: {e}")
+
+            self.connected = False
+            self._ws = None
+
+            if not self._running:
+                break
+
+            self.reconnect_count += 1
+            self.logger.info(f"{self.name} 스트림 재연결 대기: {delay:.1f}초")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def _connect_and_listen(self):
+        """단일 연결 세션: 구독 → REST 재동기화 → 수신"""
+        if not self.exchange.session:
+            await self.exchange.connect()
+
+        async with self.exchange.session.ws_connect(self._build_url(), heartbeat=None) as ws:
+            self._ws = ws
+
+            for message in self._build_subscribe_messages():
+                await ws.send_json(message)
+
+            # 구독 이후 REST 스냅샷으로 공백 구간 보정 (이후 메시지가 더 최신)
+            await self._resync()
+            self.connected = True
+            self.logger.info(f"{self.name} 스트림 연결 완료")
+
+            heartbeat_task = None
+            if self._build_heartbeat_message() is not None:
+                heartbeat_task = asyncio.create_task(self._heartbeat(ws))
+
+            try:
+                while True:
+                    try:
+                        msg = await ws.receive(timeout=self.stale_timeout)
+                    except asyncio.TimeoutError:
+                        self.logger.warning(
+                            f"{self.name} 스트림 {self.stale_timeout:.0f}초간 수신 없음 → 재연결"
+                        )
+                        return
+
+                    if msg.type == aiohttp.WSMsgType.TEXT:
+                        try:
+                            self._handle_message(json_codec.loads(msg.data))
+                        except (KeyError, ValueError, TypeError) as e:
+                            self.logger.debug(f"{self.name} 스트림 메시지 파싱 실패: {e}")
+                    elif msg.type in (aiohttp.WSMsgType.CLOSED,
+                                      aiohttp.WSMsgType.CLOSING,
+                                      aiohttp.WSMsgType.ERROR):
+                        return
+            finally:
+                if heartbeat_task:
+                    heartbeat_task.cancel()
+
+    async def _heartbeat(self, ws: aiohttp.ClientWebSocketResponse):
+        """주기적 ping 전송"""
+        message = self._build_heartbeat_message()
+        try:
+            while not ws.closed:
+                await asyncio.sleep(self.heartbeat_interval)
+                await ws.send_json(message)
+        except (ConnectionError, RuntimeError) as e:
+            self.logger.debug(f"{self.name} ping 전송 실패: {e}")
+
+    async def _resync(self):
+        """REST 스냅샷으로 보드 재동기화"""
+        try:
+            tickers = await self.exchange.fetch_tickers(fields=TICKER_FIELDS)
+            self.board.replace(self.name, tickers)
+            self.logger.debug(f"{self.name} REST 재동기화: {len(tickers)}개")
+        except Exception as e:
+            self.logger.warning(f"{self.name} REST 재동기화 실패: {e}")
+
+
+class BinanceTickerStream(ExchangeStream):
+    """바이낸스 선물 전체 티커 + 호가 스트림"""
+
+    def _build_url(self) -> str:
+        return "wss://fstream.binance.com/stream?streams=!ticker@arr/!bookTicker"
+
+    def _handle_message(self, message: Dict):
+        stream = message.get('stream', '')
+        data = message.get('data')
+
+        if stream == '!ticker@arr':
+            for item in data:
+                self.board.update(
+                    self.name, item['s'],
+                    last_price=float(item['c']),
+                    volume_24h=float(item['q']),
+                    timestamp=item.get('E')
+                )
+        elif stream == '!bookTicker':
+            self.board.update(
+                self.name, data['s'],
+                bid=float(data['b']),
+                ask=float(data['a']),
+                timestamp=data.get('E')
+            )
+
+
+class BybitTickerStream(ExchangeStream):
+    """바이빗 영구계약 티커 스트림"""
+
+    # 구독 요청 1건당 최대 토픽 수
+    subscribe_batch_size = 10
+    symbol_scoped = True
+
+    def _build_url(self) -> str:
+        return "wss://stream.bybit.com/v5/public/linear"
+
+    def _build_subscribe_messages(self) -> List[Dict]:
+        topics = [f"tickers.{symbol}" for symbol in self.symbols]
+        return [
+            {"op": "subscribe", "args": topics[i:i + self.subscribe_batch_size]}
+            for i in range(0, len(topics), self.subscribe_batch_size)
+        ]
+
+    def _build_heartbeat_message(self) -> Optional[Dict]:
+        return {"op": "ping"}
+
+    def _handle_message(self, message: Dict):
+        topic = message.get('topic', '')
+        if not topic.startswith('tickers.'):
+            return  # 구독 응답, pong 등
+
+        data = message['data']
+        symbol = data.get('symbol') or topic.split('.', 1)[1]
+
+        # delta 메시지는 변경된 필드만 포함
+        self.board.update(
+            self.name, symbol,
+            last_price=self._optional_float(data.get('lastPrice')),
+            bid=self._optional_float(data.get('bid1Price')),
+            ask=self._optional_float(data.get('ask1Price')),
+            volume_24h=self._optional_float(data.get('turnover24h')),
+            timestamp=message.get('ts')
+        )
+
+    @staticmethod
+    def _optional_float(value) -> Optional[float]:
+        if value is None or value == '':
+            return None
+        price = float(value)
+        return price if price > 0 else None
+
+
+STREAM_CLASSES = {
+    'binance': BinanceTickerStream,
+    'bybit': BybitTickerStream,
+}
+
+
+class MarketDataStream:
+    """거래소 스트림 묶음 + 공유 티커 보드"""
+
+    def __init__(self, exchanges: Dict[str, BaseExchange], stale_after: float = 10.0):
+        self.board = TickerBoard()
+        self.stale_after = stale_after
+        self.streams: Dict[str, ExchangeStream] = {}
+        self.logger = logging.getLogger(__name__)
+
+        for name, exchange in exchanges.items():
+            stream_class = STREAM_CLASSES.get(name)
+            if stream_class is None:
+                self.logger.warning(f"{name}: 스트림 미지원 거래소, REST 조회 사용")
+                continue
+            self.streams[name] = stream_class(exchange, self.board)
+
+    async def start(self, symbols: List[str]):
+        """모든 스트림 시작"""
+        for stream in self.streams.values():
+            await stream.start(symbols)
+        self.logger.info(f"실시간 시세 스트림 시작: {list(self.streams.keys())}")
+
+    async def update_symbols(self, symbols: List[str]):
+        """구독 심볼 변경 (심볼별 구독 스트림만 재연결)"""
+        for stream in self.streams.values():
+            stream.set_symbols(symbols)
+            if stream.symbol_scoped:
+                await stream.restart()
+
+    async def stop(self):
+        """모든 스트림 중지"""
+        await asyncio.gather(
+            *(stream.stop() for stream in self.streams.values()),
+            return_exceptions=True
+        )
+
+    def is_live(self, exchange: str) -> bool:
+        """스트림 연결 및 최신성 확인"""
+        stream = self.streams.get(exchange)
+        return (stream is not None and stream.connected and
+                self.board.age(exchange) <= self.stale_after)
+
+    def get_tickers(self, exchange: str) -> Optional[Dict[str, Ticker]]:
+        """최신 티커 (스트림이 살아있지 않으면 None → REST 사용)"""
+        if not self.is_live(exchange):
+            return None
+        return self.board.snapshot(exchange)
@@ -1,12 +1,30 @@
 # arb_trading/tests/test_arbitrage.py
 import pytest
 import asyncio
+import json
+import time
+import numpy as np
 from unittest.mock import AsyncMock, MagicMock, patch
 from arb_trading.core.arbitrage_engine import ArbitrageEngine
+from arb_trading.core.execution_engine import ExecutionEngine, LegResult
+from arb_trading.core.execution_prep import ExecutionPrep
+from arb_trading.core.pipeline import BLOCK, StageQueue
 from arb_trading.core.spread_monitor import SpreadMonitor, SpreadData
+from arb_trading.core.spread_engine import SpreadEngine
+from arb_trading.core.spread_filters import SpreadFilters
+from arb_trading.core.spread_ranking import SpreadRanking, VectorRanking
+from arb_trading.core.spread_stats import SpreadStats
+from arb_trading.core.symbol_universe import SymbolUniverse, IdHistory
 from arb_trading.core.position_manager import PositionManager, ArbitragePosition, PositionStatus
-from arb_trading.config.settings import ConfigManager
-from arb_trading.exchanges.base import Direction
+from arb_trading.config.settings import ConfigManager, FilterConfig, MonitoringConfig
+from arb_trading.exchanges.base import Direction, FeeSchedule, FundingBatch, MarketRules, Order, OrderSide, \
+    OrderType, Ticker, TickerBatch
+from arb_trading.exchanges.binance import BinanceExchange
+from arb_trading.exchanges.decoders import decode_binance_prices, decode_bybit_tickers
+from arb_trading.exchanges.bybit import BybitExchange
+from arb_trading.exchanges.resilience import CircuitBreaker
+from arb_trading.exchanges.streams import MarketDataStream
+from arb_trading.utils.loop_monitor import LoopLagMonitor
 
 
 class TestArbitrageEngine:
@@ -81,6 +99,189 @@ class TestArbitrageEngine:
         assert arbitrage_engine.spread_monitor is None
         assert arbitrage_engine.position_manager is None
 
+    def test_live_execution_requires_opt_in(self, mock_config):
+        """simulation_mode가 꺼져도 live_execution을 켜지 않으면 주문 엔진을 만들지 않음"""
+        mock_config.trading.simulation_mode = False
+        mock_config.trading.live_execution = False
+        engine = ArbitrageEngine(mock_config)
+        engine.exchanges = {"binance": BinanceExchange("", ""), "bybit": BybitExchange()}
+
+        engine._initialize_execution()
+
+        assert engine.execution_engine is None
+        assert engine.execution_prep is None
+
+    def test_live_execution_rejects_stub_order_venue(self, mock_config):
+        """주문 API가 스텁인 거래소(바이빗)가 주문 대상이면 시작 거부, fetch_only면 허용"""
+        mock_config.trading.simulation_mode = False
+        mock_config.trading.live_execution = True
+        mock_config.trading.leverage = 1
+        mock_config.trading.margin_mode = "isolated"
+        mock_config.orders.leg_timeout_seconds = 2.0
+        mock_config.orders.entry_cooldown_seconds = 60.0
+        mock_config.exchanges['bybit'].fetch_only = False
+        engine = ArbitrageEngine(mock_config)
+        engine.exchanges = {"binance": BinanceExchange("", ""), "bybit": BybitExchange()}
+
+        with pytest.raises(Exception, match="bybit"):
+            engine._initialize_execution()
+        assert engine.execution_engine is None
+
+        mock_config.exchanges['bybit'].fetch_only = True
+        engine._initialize_execution()
+        assert set(engine.execution_engine.exchanges) == {"binance"}
+
+    @pytest.mark.asyncio
+    async def test_exit_closes_position_reduce_only(self, mock_config):
+        """스프레드 축소/방향 반전/보유 시간 초과 포지션만 축소 전용 시장가로 청산 후 제거"""
+        def make_exchange(name):
+            async def create_order(symbol, side, order_type, amount, price=None, params=None):
+                return Order(id=f"{name}-{side.value}", symbol=symbol, side=side, type=order_type,
+                             amount=amount, price=price, filled=amount, status='filled')
+
+            exchange = MagicMock()
+            exchange.name = name
+            exchange.reduce_only_params = {"reduceOnly": "true"}
+            exchange.create_order = AsyncMock(side_effect=create_order)
+            return exchange
+
+        binance, bybit = make_exchange("binance"), make_exchange("bybit")
+        engine = ArbitrageEngine(mock_config)
+        engine.position_manager = PositionManager(max_positions=5, position_timeout=300)
+
+        def open_position(symbol, age=0.0):
+            engine.position_manager.add_position(ArbitragePosition(
+                symbol=symbol, long_exchange=bybit, short_exchange=binance, long_symbol=symbol,
+                short_symbol=symbol, quantity=0.01, entry_spread=1.5, entry_spread_signed=1.5,
+                entry_timestamp=time.time() - age, status=PositionStatus.OPEN,
+                long_filled=0.01, short_filled=0.01))
+
+        def spread(symbol, abs_spread_pct, sell, buy):
+            return SpreadData(timestamp="", symbol=symbol, binance_price=100.0, bybit_price=100.0,
+                              spread_pct=abs_spread_pct, abs_spread_pct=abs_spread_pct,
+                              direction=Direction.BINANCE_GT_BYBIT, volume_24h=1e9,
+                              sell_exchange=sell, buy_exchange=buy)
+
+        open_position("HOLD")      # 1.3% 유지 → 청산 안 함
+        open_position("REVERT")    # 0.8% < 1.5 - 0.5 → 익절
+        open_position("REVERSE")   # 반대 방향 0.2% → 1.5 + 0.2 > 0.5 → 손절
+        open_position("EXPIRED", age=301)
+
+        await engine._check_exit_conditions([
+            spread("HOLD", 1.3, "binance", "bybit"),
+            spread("REVERT", 0.8, "binance", "bybit"),
+            spread("REVERSE", 0.2, "bybit", "binance"),
+            spread("EXPIRED", 1.4, "binance", "bybit"),
+        ])
+
+        assert set(engine.position_manager.positions) == {"HOLD"}
+        assert binance.create_order.await_count == bybit.create_order.await_count == 3
+        close_long = bybit.create_order.await_args_list[0].kwargs
+        assert (close_long['side'], close_long['order_type'], close_long['amount']) == \
+               (OrderSide.SELL, OrderType.MARKET, 0.01)
+        assert close_long['params'] == {"category": "linear", "reduceOnly": "true"}
+        assert binance.create_order.await_args_list[0].kwargs['params'] == {"reduceOnly": "true"}
+
+    @pytest.mark.asyncio
+    async def test_exchanges_connect_concurrently(self, mock_config):
+        """거래소 연결은 동시에 진행되고 단계별 소요 시간이 기록됨"""
+        mock_config.monitoring = MonitoringConfig(
+            performance_logging=False, fetch_interval=5, log_buffer_size=100
+        )
+        engine = ArbitrageEngine(mock_config)
+
+        async def slow_connect():
+            await asyncio.sleep(0.1)
+
+        def make_exchange(*args, **kwargs):
+            exchange = MagicMock()
+            exchange.connect = AsyncMock(side_effect=slow_connect)
+            return exchange
+
+        with patch("arb_trading.exchanges.binance.BinanceExchange", side_effect=make_exchange), \
+                patch("arb_trading.exchanges.bybit.BybitExchange", side_effect=make_exchange):
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            await engine._initialize_exchanges()
+            elapsed = loop.time() - start
+
+        assert set(engine.exchanges) == {"binance", "bybit"}
+        assert 0.1 <= elapsed < 0.18
+        assert engine.boot_timings["  └ binance 연결"] >= 0.1
+
+    @pytest.mark.asyncio
+    async def test_pipeline_fetch_keeps_cadence_when_execution_is_slow(self, mock_config):
+        """실행 단계가 느려도 시세 조회 주기는 유지되고 밀린 스냅샷은 오래된 것부터 버림"""
+        mock_config.monitoring = MonitoringConfig(
+            performance_logging=False, fetch_interval=0.02, log_buffer_size=100
+        )
+        engine = ArbitrageEngine(mock_config)
+
+        snapshot = [SpreadData(timestamp="", symbol="BTCUSDT", binance_price=50000.0, bybit_price=49900.0,
+                               spread_pct=0.2, abs_spread_pct=0.2, direction=Direction.BINANCE_GT_BYBIT,
+                               volume_24h=1e9)]
+        engine.spread_monitor = MagicMock()
+        engine.spread_monitor.fetch_spread_data = AsyncMock(return_value=snapshot)
+
+        async def slow_status(symbol):
+            await asyncio.sleep(0.1)  # 느린 주문 상태 조회
+
+        engine.position_manager = MagicMock()
+        engine.position_manager.positions = {"ETHUSDT": MagicMock(status=PositionStatus.PENDING)}
+        engine.position_manager.can_open_position.return_value = False
+        engine.position_manager.update_position_status = AsyncMock(side_effect=slow_status)
+
+        pipeline = engine._build_pipeline()
+        stop = asyncio.Event()
+        asyncio.get_running_loop().call_later(0.31, stop.set)
+        await pipeline.run(stop)
+
+        stats = pipeline.stats()
+        assert stats["market_data"]["count"] >= 13  # 0.02초 간격 그대로
+        assert stats["execution"]["count"] <= 4
+        assert stats["signal"]["count"] >= stats["market_data"]["count"] - 1
+        assert stats["execution_queue"]["dropped"] > 0
+        assert stats["bookkeeping"]["count"] == stats["execution"]["count"]
+        assert engine.spread_monitor.fetch_spread_data.await_count == stats["market_data"]["count"]
+
+    @pytest.mark.asyncio
+    async def test_stage_queue_drop_oldest_and_block(self):
+        """drop_oldest 큐는 최신 항목만 남기고, block 큐는 빈자리를 기다림"""
+        latest = StageQueue("latest", maxsize=2)
+        for item in (1, 2, 3):
+            await latest.put(item)
+        assert latest.dropped == 1
+        assert [(await latest.get())[0] for _ in range(2)] == [2, 3]
+
+        blocking = StageQueue("blocking", maxsize=1, policy=BLOCK)
+        await blocking.put(1)
+        pending = asyncio.create_task(blocking.put(2))
+        await asyncio.sleep(0.01)
+        assert not pending.done()
+        assert (await blocking.get())[0] == 1
+        await pending
+        assert blocking.dropped == 0 and len(blocking) == 1
+
+
+class TestConfigManager:
+    def test_update_config_accepts_known_keys_only(self, tmp_path):
+        """설정 파일 또는 설정 클래스에 있는 키만 갱신 (오타 키는 추가되지 않음)"""
+        source = ConfigManager()
+        legacy = dict(source._config, monitoring={
+            key: value for key, value in source._config['monitoring'].items() if key != 'market_data_mode'
+        })
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps(legacy), encoding='utf-8')
+        config = ConfigManager(str(path))
+
+        config.update_config('monitoring', 'market_data_mode', 'stream')
+        config.update_config('trading', 'max_position', 3)
+        config.update_config('trading', 'max_positions', 3)
+
+        assert config.monitoring.market_data_mode == 'stream'
+        assert config.trading.max_positions == 3
+        assert 'max_position' not in config._config['trading']
+
 
 class TestSpreadMonitor:
     """SpreadMonitor 테스트"""
@@ -90,11 +291,17 @@ class TestSpreadMonitor:
         """목 거래소들 생성"""
         binance = AsyncMock()
         binance.name = "binance"
+        binance.circuit_breaker = CircuitBreaker()
+        binance.fee_schedule = FeeSchedule(maker_pct=0.02, taker_pct=0.05)
+        binance.normalize_symbol = MagicMock(side_effect=lambda symbol: symbol)
         binance.fetch_symbols.return_value = ["BTCUSDT", "ETHUSDT"]
         binance.fetch_tickers.return_value = {
             "BTCUSDT": MagicMock(last_price=50000.0),
             "ETHUSDT": MagicMock(last_price=3000.0)
         }
+        binance.fetch_ticker_batch.return_value = TickerBatch(
+            symbols=["BTCUSDT", "ETHUSDT"], last_prices=[50000.0, 3000.0]
+        )
         binance.fetch_24h_volumes.return_value = {
             "BTCUSDT": 10000000.0,
             "ETHUSDT": 8000000.0
@@ -102,11 +309,17 @@ class TestSpreadMonitor:
 
         bybit = AsyncMock()
         bybit.name = "bybit"
+        bybit.circuit_breaker = CircuitBreaker()
+        bybit.fee_schedule = FeeSchedule(maker_pct=0.02, taker_pct=0.05)
+        bybit.normalize_symbol = MagicMock(side_effect=lambda symbol: symbol)
         bybit.fetch_symbols.return_value = ["BTCUSDT", "ETHUSDT"]
         bybit.fetch_tickers.return_value = {
             "BTCUSDT": MagicMock(last_price=50050.0),  # 0.1% 스프레드
             "ETHUSDT": MagicMock(last_price=2985.0)  # 0.5% 스프레드
         }
+        bybit.fetch_ticker_batch.return_value = TickerBatch(
+            symbols=["BTCUSDT", "ETHUSDT"], last_prices=[50050.0, 2985.0]
+        )
         bybit.fetch_24h_volumes.return_value = {
             "BTCUSDT": 9500000.0,
             "ETHUSDT": 7500000.0
@@ -130,6 +343,32 @@ class TestSpreadMonitor:
         assert "BTCUSDT" in symbols
         assert "ETHUSDT" in symbols
 
+    @pytest.mark.asyncio
+    async def test_universe_refresh_in_background(self, spread_monitor, mock_exchanges):
+        """만료 후에도 이전 유니버스를 즉시 반환하고 백그라운드에서 교체"""
+        first = await spread_monitor.get_common_symbols()
+        diffs = []
+        spread_monitor.add_universe_listener(diffs.append)
+
+        for exchange in mock_exchanges.values():
+            exchange.fetch_symbols.return_value = ["BTCUSDT", "SOLUSDT"]
+            exchange.fetch_24h_volumes.return_value = {"BTCUSDT": 1e7, "SOLUSDT": 6e6}
+        spread_monitor._last_symbols_update = 0
+
+        assert await spread_monitor.get_common_symbols() is first
+        await spread_monitor._refresh_task
+
+        assert await spread_monitor.get_common_symbols() == ["BTCUSDT", "SOLUSDT"]
+        assert diffs[0].added == ["SOLUSDT"]
+        assert diffs[0].removed == ["ETHUSDT"]
+
+        # 거래대금만 갱신: 상장 목록은 다시 조회하지 않음
+        spread_monitor._last_volume_update = 0
+        await spread_monitor.get_common_symbols()
+        await spread_monitor._refresh_task
+        assert mock_exchanges["binance"].fetch_symbols.await_count == 2
+        assert mock_exchanges["binance"].fetch_24h_volumes.await_count == 3
+
     @pytest.mark.asyncio
     async def test_fetch_spread_data(self, spread_monitor):
         """스프레드 데이터 조회 테스트"""
@@ -142,6 +381,732 @@ class TestSpreadMonitor:
         eth_spread = next((s for s in spread_data if s.symbol == "ETHUSDT"), None)
         assert eth_spread is not None
         assert eth_spread.abs_spread_pct > 0.4  # 약 0.5% 스프레드
+        # 사이클마다 롤링 통계에 한 샘플
+        assert spread_monitor.spread_stats.counts[eth_spread.symbol_id] == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_spread_data_from_stream(self, mock_exchanges):
+        """스트리밍 모드: 살아있는 스트림은 REST 대신 보드 사용"""
+        market_stream = MagicMock()
+        market_stream.get_tickers.side_effect = lambda name: (
+            {"BTCUSDT": Ticker("BTCUSDT", 50100.0), "ETHUSDT": Ticker("ETHUSDT", 3000.0)}
+            if name == "bybit" else None
+        )
+        market_stream.is_live.side_effect = lambda name: name == "bybit"
+        monitor = SpreadMonitor(exchanges=mock_exchanges, min_volume_usdt=5000000,
+                                top_symbol_limit=10, market_stream=market_stream)
+
+        spread_data = await monitor.fetch_spread_data()
+
+        mock_exchanges["bybit"].fetch_ticker_batch.assert_not_called()
+        mock_exchanges["binance"].fetch_ticker_batch.assert_called_once()
+        btc_spread = next(s for s in spread_data if s.symbol == "BTCUSDT")
+        assert btc_spread.bybit_price == 50100.0
+
+    @pytest.mark.asyncio
+    async def test_stream_updates_ranking_incrementally(self, mock_exchanges):
+        """스트리밍 모드: 적재 후에는 티커 갱신만으로 순위가 바뀌고 조회 없음"""
+        market_stream = MarketDataStream(mock_exchanges)
+        for name, stream in market_stream.streams.items():
+            stream.connected = True
+            market_stream.board.replace(name, {
+                "BTCUSDT": Ticker("BTCUSDT", 50000.0),
+                "ETHUSDT": Ticker("ETHUSDT", 3000.0),
+            })
+        monitor = SpreadMonitor(exchanges=mock_exchanges, min_volume_usdt=5000000,
+                                top_symbol_limit=10, market_stream=market_stream)
+
+        first = await monitor.fetch_spread_data()
+        assert [s.abs_spread_pct for s in first] == [0.0, 0.0]
+
+        market_stream.board.update("bybit", "ETHUSDT", last_price=3003.0)
+        spread_data = await monitor.fetch_spread_data()
+
+        mock_exchanges["binance"].fetch_ticker_batch.assert_not_called()
+        mock_exchanges["bybit"].fetch_ticker_batch.assert_not_called()
+        assert spread_data[0].symbol == "ETHUSDT"
+        assert spread_data[0].bybit_price == 3003.0
+        assert spread_data.count_above(0.05) == 1
+        # 이전 결과는 이후 갱신의 영향을 받지 않음
+        assert first[0].abs_spread_pct == 0.0
+
+    @pytest.mark.asyncio
+    async def test_spread_events_coalesce_within_window(self, mock_exchanges):
+        """창 안의 틱은 심볼별로 병합되어 한 번에 전달"""
+        market_stream = MarketDataStream(mock_exchanges)
+        for name, stream in market_stream.streams.items():
+            stream.connected = True
+            market_stream.board.replace(name, {
+                "BTCUSDT": Ticker("BTCUSDT", 50000.0),
+                "ETHUSDT": Ticker("ETHUSDT", 3000.0),
+            })
+        monitor = SpreadMonitor(exchanges=mock_exchanges, min_volume_usdt=5000000,
+                                top_symbol_limit=10, market_stream=market_stream,
+                                event_window=0.02)
+        await monitor.fetch_spread_data()
+
+        batches = []
+
+        async def on_spreads(changed):
+            batches.append(changed)
+
+        monitor.subscribe(on_spreads)
+        market_stream.board.update("bybit", "BTCUSDT", last_price=50010.0)
+        market_stream.board.update("bybit", "ETHUSDT", last_price=3001.0)
+        market_stream.board.update("bybit", "BTCUSDT", last_price=50020.0)
+        market_stream.board.update("bybit", "DOGEUSDT", last_price=0.1)  # 비활성 심볼
+        await asyncio.sleep(0.05)
+
+        assert len(batches) == 1
+        assert [s.symbol for s in batches[0]] == ["BTCUSDT", "ETHUSDT"]
+        assert batches[0][0].bybit_price == 50020.0
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_exchange(self, spread_monitor, mock_exchanges):
+        """회로 차단 중인 거래소는 요청 없이 사이클에서 제외"""
+        breaker = mock_exchanges["bybit"].circuit_breaker
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure()
+
+        spread_data = await spread_monitor.fetch_spread_data()
+
+        assert spread_data == []
+        mock_exchanges["bybit"].fetch_ticker_batch.assert_not_called()
+
+
+class TestSpreadEngine:
+    """벡터 스프레드 엔진 테스트"""
+
+    def test_vectorized_spreads(self):
+        """정렬/방향/필터가 행 단위 계산과 일치"""
+        engine = SpreadEngine(max_spread_pct=5.0)
+        engine.set_symbols(["BTCUSDT", "ETHUSDT", "XRPUSDT", "BADUSDT", "NEWUSDT"],
+                           {"BTCUSDT": 1e9})
+        batches = {
+            "binance": TickerBatch(
+                symbols=["ETHUSDT", "BTCUSDT", "XRPUSDT", "BADUSDT", "OTHERUSDT"],
+                last_prices=[3000.0, 50000.0, 0.5, 1.0, 1.0]
+            ),
+            "bybit": TickerBatch(
+                symbols=["BTCUSDT", "ETHUSDT", "XRPUSDT", "BADUSDT", "NEWUSDT"],
+                last_prices=[50050.0, 2985.0, 0.5, 2.0, 1.0]
+            ),
+        }
+
+        table = engine.compute(batches)
+
+        # BADUSDT(100%)는 비현실적 스프레드로 제외, NEWUSDT는 바이낸스 가격 없음
+        assert [row.symbol for row in table] == ["ETHUSDT", "BTCUSDT", "XRPUSDT"]
+        eth = table[0]
+        assert eth.direction == Direction.BINANCE_GT_BYBIT
+        assert eth.spread_pct == pytest.approx((3000.0 - 2985.0) / 2985.0 * 100)
+        btc = table[1]
+        assert btc.direction == Direction.BYBIT_GT_BINANCE
+        assert btc.spread_pct < 0
+        assert btc.volume_24h == 1e9
+
+    def test_table_slicing_matches_list(self):
+        """SpreadTable 슬라이스는 음수 step 포함 list와 동일"""
+        engine = SpreadEngine(max_spread_pct=50.0)
+        symbols = [f"S{i}USDT" for i in range(12)]
+        engine.set_symbols(symbols)
+        batches = {
+            "binance": TickerBatch(symbols=symbols, last_prices=[100.0 + i for i in range(12)]),
+            "bybit": TickerBatch(symbols=symbols, last_prices=[100.0] * 12),
+        }
+        table = engine.compute(batches)
+        rows = list(table)
+
+        for index in (slice(None, None, -1), slice(5, 1, -1), slice(-3, None), slice(1, 9, 3), slice(4, 2)):
+            assert table[index] == rows[index]
+
+    def test_direction_independent_of_venue_order(self):
+        """설정의 거래소 순서가 바뀌어도 부호/방향은 거래소 이름 기준으로 동일"""
+        batches = {
+            "binance": TickerBatch(symbols=["BTCUSDT", "ETHUSDT"], last_prices=[50000.0, 3000.0]),
+            "bybit": TickerBatch(symbols=["BTCUSDT", "ETHUSDT"], last_prices=[50050.0, 2985.0]),
+        }
+        results = []
+        for venues in (("binance", "bybit"), ("bybit", "binance")):
+            engine = SpreadEngine(venues=venues)
+            engine.set_symbols(["BTCUSDT", "ETHUSDT"])
+            table = engine.compute(batches)
+            btc_id = engine.universe.id_of("BTCUSDT")
+            engine.update_quote("binance", btc_id, 50100.0)  # 증분 갱신 경로도 같은 기준
+            rows = {row.symbol: row for row in table}
+            updated = {row.symbol: row for row in engine.snapshot()}
+            assert rows["BTCUSDT"].timestamp == rows["ETHUSDT"].timestamp  # 배치당 한 번 계산한 시각
+            assert time.strptime(updated["BTCUSDT"].timestamp, "%Y-%m-%d %H:%M:%S")
+            results.append([(row.spread_pct, row.direction, row.sell_exchange, row.buy_exchange)
+                            for row in (rows["BTCUSDT"], rows["ETHUSDT"], updated["BTCUSDT"])])
+
+        assert results[0] == results[1]
+        btc, eth, btc_updated = results[0]
+        assert btc[0] < 0 and btc[1] == Direction.BYBIT_GT_BINANCE
+        assert eth[0] > 0 and eth[1] == Direction.BINANCE_GT_BYBIT
+        assert btc_updated[0] > 0 and btc_updated[1] == Direction.BINANCE_GT_BYBIT
+    def test_executable_spread_subtracts_fees(self):
+        """executable 모드: 매도 bid vs 매수 ask - 양쪽 테이커 수수료, 순 기대수익 미달은 제외"""
+        fees = {"binance": FeeSchedule(0.02, 0.05), "bybit": FeeSchedule(0.02, 0.05)}
+        engine = SpreadEngine(mode="executable", fees=fees, min_net_edge_pct=0.0)
+        engine.set_symbols(["BTCUSDT", "ETHUSDT", "XRPUSDT"])
+        batches = {
+            "binance": TickerBatch(symbols=["BTCUSDT", "ETHUSDT", "XRPUSDT"],
+                                   last_prices=[100.0, 100.0, 100.0],
+                                   bids=[101.0, 99.0, 100.0], asks=[101.1, 99.1, 100.1]),
+            "bybit": TickerBatch(symbols=["BTCUSDT", "ETHUSDT", "XRPUSDT"],
+                                 last_prices=[100.0, 100.0, 100.0],
+                                 bids=[99.9, 100.0, 100.0], asks=[100.0, 100.1, 100.1]),
+        }
+
+        table = engine.compute(batches)
+
+        # BTC: 바이낸스 bid 101 매도 / 바이빗 ask 100 매수 → 1% - 0.1%
+        # ETH: 바이빗 bid 100 매도 / 바이낸스 ask 99.1 매수 → 0.908% - 0.1%
+        # XRP: 호가를 건너면 손실 → 제외
+        assert [row.symbol for row in table] == ["BTCUSDT", "ETHUSDT"]
+        btc, eth = table[0], table[1]
+        assert btc.abs_spread_pct == pytest.approx(0.9)
+        assert btc.direction == Direction.BINANCE_GT_BYBIT
+        assert (btc.binance_price, btc.bybit_price) == (101.0, 100.0)
+        assert eth.direction == Direction.BYBIT_GT_BINANCE
+        assert eth.abs_spread_pct == pytest.approx((100.0 - 99.1) / 99.1 * 100 - 0.1)
+
+        # 스트리밍 단일 갱신도 같은 규칙 (바이빗 ask 상승 → BTC 순 기대수익 감소)
+        engine.update_quote("bybit", engine.universe.id_of("BTCUSDT"), ask=100.5)
+        snapshot = engine.snapshot()
+        btc = next(row for row in snapshot if row.symbol == "BTCUSDT")
+        assert btc.abs_spread_pct == pytest.approx((101.0 - 100.5) / 100.5 * 100 - 0.1)
+        assert snapshot[0].symbol == "ETHUSDT"
+
+    def test_best_pair_across_venues(self):
+        """거래소 3곳: 심볼별로 가장 비싼 곳 매도 / 가장 싼 곳 매수 쌍 선택"""
+        engine = SpreadEngine(venues=("binance", "bybit", "bitget"))
+        engine.set_symbols(["BTCUSDT", "ETHUSDT"])
+        batches = {
+            "binance": TickerBatch(symbols=["BTCUSDT", "ETHUSDT"], last_prices=[101.0, 100.0]),
+            "bybit": TickerBatch(symbols=["BTCUSDT", "ETHUSDT"], last_prices=[100.5, 100.2]),
+            "bitget": TickerBatch(symbols=["BTCUSDT"], last_prices=[100.0]),
+        }
+
+        table = engine.compute(batches)
+
+        btc, eth = table[0], table[1]
+        assert (btc.sell_exchange, btc.buy_exchange) == ("binance", "bitget")
+        assert (btc.sell_price, btc.buy_price) == (101.0, 100.0)
+        assert btc.abs_spread_pct == pytest.approx(1.0)
+        # 비트겟 미상장 심볼은 나머지 두 곳으로 계산
+        assert (eth.sell_exchange, eth.buy_exchange) == ("bybit", "binance")
+        assert eth.direction == Direction.BYBIT_GT_BINANCE
+
+        # 스트리밍 갱신으로 최적 쌍이 바뀜
+        engine.update_price("bitget", engine.universe.id_of("BTCUSDT"), 102.0)
+        btc = next(row for row in engine.snapshot() if row.symbol == "BTCUSDT")
+        assert (btc.sell_exchange, btc.buy_exchange) == ("bitget", "bybit")
+        assert btc.abs_spread_pct == pytest.approx((102.0 - 100.5) / 100.5 * 100)
+
+    def test_funding_carry_adjusts_edge(self):
+        """보유 기간 안에 정산될 펀딩비(숏 수취 - 롱 지급)를 기대수익에 반영"""
+        engine = SpreadEngine(funding_horizon_hours=8.0)
+        engine.set_symbols(["BTCUSDT", "ETHUSDT"])
+        now_ms = 1_700_000_000_000
+        next_funding = now_ms + 3600 * 1000  # 1시간 뒤 정산 → 8시간 안에 1회
+        engine.set_funding("binance", FundingBatch(["BTCUSDT", "ETHUSDT"], [0.01, 0.0],
+                                                   [next_funding] * 2, [8.0, 8.0]), now_ms)
+        engine.set_funding("bybit", FundingBatch(["BTCUSDT", "ETHUSDT"], [0.05, -0.1],
+                                                 [next_funding] * 2, [8.0, 8.0]), now_ms)
+        batches = {
+            "binance": TickerBatch(symbols=["BTCUSDT", "ETHUSDT"], last_prices=[100.2, 100.1]),
+            "bybit": TickerBatch(symbols=["BTCUSDT", "ETHUSDT"], last_prices=[100.0, 100.0]),
+        }
+
+        table = engine.compute(batches)
+
+        # BTC: 0.2% - 롱(바이빗) 0.05% 지급 + 숏(바이낸스) 0.01% 수취
+        # ETH: 0.1% + 롱(바이빗) 0.1% 수취 → 펀딩 덕분에 BTC보다 앞섬
+        eth, btc = table[0], table[1]
+        assert eth.symbol == "ETHUSDT"
+        assert eth.carry_pct == pytest.approx(0.1)
+        assert eth.abs_spread_pct == pytest.approx(0.2)
+        assert btc.abs_spread_pct == pytest.approx(0.16)
+
+        # 스트리밍 단일 갱신도 캐리 포함
+        engine.update_price("binance", engine.universe.id_of("BTCUSDT"), 100.3)
+        btc = next(row for row in engine.snapshot() if row.symbol == "BTCUSDT")
+        assert btc.carry_pct == pytest.approx(-0.04)
+        assert btc.abs_spread_pct == pytest.approx(0.3 - 0.04)
+
+    def test_sanity_filters_count_rejections_per_rule(self):
+        """정상성 필터: 순위 전에 제외하고 규칙별로 집계"""
+        engine = SpreadEngine(filters=SpreadFilters(max_quote_age=10.0))
+        symbols = ["BTCUSDT", "ETHUSDT", "SPLITUSDT", "ZEROUSDT", "OKUSDT"]
+        engine.set_symbols(symbols)
+        now_ms = int(time.time() * 1000)
+        batches = {
+            # BTC 1.5%는 고가 구간(1%) 초과, SPLIT은 20배 차이, ZERO는 0 가격
+            "binance": TickerBatch(symbols=symbols, last_prices=[50750.0, 3000.0, 20.0, 0.0, 1.01],
+                                   timestamp=now_ms),
+            "bybit": TickerBatch(symbols=symbols, last_prices=[50000.0, 2990.0, 1.0, 1.0, 1.0],
+                                 timestamp=now_ms),
+        }
+
+        table = engine.compute(batches)
+
+        assert [row.symbol for row in table] == ["OKUSDT", "ETHUSDT"]
+        assert engine.filters.drain() == {"zero_price": 1, "ratio": 1, "price_tier": 1}
+        assert engine.filters.drain() == {}
+
+        # 한 거래소 시세가 오래되면 그 거래소가 낀 쌍 모두 제외
+        batches["bybit"].timestamp = now_ms - 60_000
+        assert len(engine.compute(batches)) == 0
+        assert engine.filters.drain()["stale"] == len(symbols)
+
+    def test_missing_quote_and_tier_on_mid(self):
+        """호가 없음은 0 가격과 따로 집계, 가격대 규칙은 호가 중간값끼리 비교"""
+        engine = SpreadEngine(mode='executable')
+        symbols = ["ONESIDEUSDT", "WIDEUSDT"]
+        engine.set_symbols(symbols)
+        nan = float('nan')
+        batches = {
+            # ONESIDE: 바이낸스 ask 없음 (bid로 매도만 가능), WIDE: 바이낸스 호가 폭이 넓음 (중간값은 동일)
+            "binance": TickerBatch.from_tickers({
+                "ONESIDEUSDT": Ticker("ONESIDEUSDT", 100.0, bid=100.0, ask=None),
+                "WIDEUSDT": Ticker("WIDEUSDT", 2000.0, bid=1980.0, ask=2020.0),
+            }),
+            "bybit": TickerBatch(symbols=symbols, last_prices=[99.0, 2000.0],
+                                 bids=[98.9, 1999.0], asks=[99.0, 2001.0]),
+        }
+        assert np.isnan(batches["binance"].asks[0])
+
+        table = engine.compute(batches)
+
+        oneside = next(row for row in table if row.symbol == "ONESIDEUSDT")
+        assert (oneside.sell_exchange, oneside.buy_exchange) == ("binance", "bybit")
+        rejections = engine.filters.drain()
+        assert rejections.get("missing_quote") == 1
+        assert "zero_price" not in rejections
+        assert "price_tier" not in rejections  # bid 1999 vs ask 2020 (1.05%)가 아니라 중간값 2000 vs 2000
+
+    def test_illiquid_last_price_still_pairs_with_skew_filter(self):
+        """바이낸스 ticker/price의 오래된 체결 시각 때문에 시각 차이 규칙에 걸리지 않음"""
+        now_ms = int(time.time() * 1000)
+        binance_raw = json.dumps([
+            {"symbol": "BTCUSDT", "price": "50100.00", "time": now_ms - 50},
+            {"symbol": "QUIETUSDT", "price": "1.0100", "time": now_ms - 45 * 60 * 1000},  # 45분 전 체결
+        ]).encode()
+        bybit_raw = json.dumps({"retCode": 0, "time": now_ms - 20, "result": {"list": [
+            {"symbol": "BTCUSDT", "lastPrice": "50000", "bid1Price": "49999", "ask1Price": "50001"},
+            {"symbol": "QUIETUSDT", "lastPrice": "1.0000", "bid1Price": "0.9999", "ask1Price": "1.0001"},
+        ]}}).encode()
+        batches = {"binance": decode_binance_prices(binance_raw, timestamp=now_ms),
+                   "bybit": decode_bybit_tickers(bybit_raw, timestamp=now_ms)}
+
+        for filters in (SpreadFilters.from_config(FilterConfig()), SpreadFilters(max_skew=1.0)):
+            engine = SpreadEngine(filters=filters)
+            engine.set_symbols(["BTCUSDT", "QUIETUSDT"])
+            table = engine.compute(batches)
+
+            assert {row.symbol for row in table} == {"BTCUSDT", "QUIETUSDT"}
+            assert "skew" not in engine.filters.drain()
+
+    def test_event_time_skew_rejects_stale_leg(self):
+        """거래소 이벤트 시각 차이가 크면 그 쌍 제외 (수신은 최근이어도)"""
+        engine = SpreadEngine(filters=SpreadFilters(max_skew=1.0))
+        engine.set_symbols(["BTCUSDT", "ETHUSDT"])
+        now_ms = int(time.time() * 1000)
+        batches = {
+            "binance": TickerBatch(symbols=["BTCUSDT", "ETHUSDT"], last_prices=[50100.0, 3010.0],
+                                   timestamp=now_ms, event_times=[now_ms - 5000, now_ms]),
+            "bybit": TickerBatch(symbols=["BTCUSDT", "ETHUSDT"], last_prices=[50000.0, 3000.0],
+                                 timestamp=now_ms, event_times=[now_ms, now_ms - 500]),
+        }
+
+        table = engine.compute(batches)
+
+        assert [row.symbol for row in table] == ["ETHUSDT"]
+        assert engine.filters.drain() == {"skew": 1}
+
+        # 오래된 쪽이 새 이벤트를 받으면 다시 포함 (스트리밍 경로도 같은 규칙)
+        btc_id = engine.universe.id_of("BTCUSDT")
+        engine.update_quote("binance", btc_id, 50100.0, timestamp=now_ms + 100)
+        assert engine.spread_of(btc_id) is not None
+        engine.update_quote("bybit", btc_id, 50010.0, timestamp=now_ms + 2000)
+        assert engine.spread_of(btc_id) is None
+
+    def test_threshold_query_builds_only_needed_rows(self):
+        """임계값 조회는 해당 행만 SpreadData로 생성"""
+        engine = SpreadEngine()
+        symbols = [f"C{i}USDT" for i in range(100)]
+        engine.set_symbols(symbols)
+        batches = {
+            "binance": TickerBatch(symbols=symbols, last_prices=[100.0 + i * 0.01 for i in range(100)]),
+            "bybit": TickerBatch(symbols=symbols, last_prices=[100.0] * 100),
+        }
+
+        table = engine.compute(batches)
+        above = table.above(0.5)
+
+        assert len(table) == 100
+        assert all(row.abs_spread_pct >= 0.5 for row in above)
+        assert len(above) == table.count_above(0.5) == 50
+        assert len(table._rows) == 50
+
+
+class TestSpreadRanking:
+    """인덱스 힙 순위 테스트"""
+
+    def test_incremental_updates_match_full_sort(self):
+        """임의 갱신/삭제 후 top-k/임계값 질의가 전체 정렬 결과와 일치"""
+        rng = np.random.default_rng(7)
+        ranking = SpreadRanking()
+        scores = {}
+        for step in range(2000):
+            key = int(rng.integers(0, 60))
+            if step % 7 == 0:
+                ranking.discard(key)
+                scores.pop(key, None)
+            else:
+                score = float(rng.integers(0, 50)) / 10  # 동률 다수
+                ranking.update(key, score)
+                scores[key] = score
+
+        expected = sorted(scores, key=lambda k: (-scores[k], k))
+        assert len(ranking) == len(scores)
+        assert ranking.top(10) == expected[:10]
+        assert ranking.above(2.5) == [k for k in expected if scores[k] >= 2.5]
+        assert ranking.count_above(2.5) == sum(1 for v in scores.values() if v >= 2.5)
+
+    def test_tie_only_updates_keep_heap_order(self):
+        """점수는 같고 tie만 바뀐 갱신도 순서에 반영"""
+        rng = np.random.default_rng(11)
+        ranking = SpreadRanking()
+        ties = {}
+        for key in range(40):
+            ties[key] = key
+            ranking.update(key, 1.0, tie=key)
+        for _ in range(500):
+            key = int(rng.integers(0, 40))
+            ties[key] = int(rng.integers(0, 1000))
+            ranking.update(key, 1.0, tie=ties[key])
+
+        expected = sorted(ties, key=lambda k: ties[k])
+        assert ranking.top(10) == expected[:10]
+        assert ranking.above(1.0) == expected
+
+    def test_vector_ranking_partial_selection(self):
+        """부분 선택도 동률 시 입력 순서 유지"""
+        ranking = VectorRanking(np.array([10, 11, 12, 13, 14]), np.array([1.0, 3.0, 3.0, 0.5, 3.0]))
+
+        assert list(ranking.top(2)) == [11, 12]
+        assert list(ranking.above(1.0)) == [11, 12, 14, 10]
+        assert ranking.count_above(3.0) == 3
+
+
+class TestSymbolUniverse:
+    """정수 심볼 ID 테스트"""
+
+    def test_ids_shared_across_exchanges(self):
+        """거래소가 달라도 같은 표준 심볼이면 같은 ID"""
+        universe = SymbolUniverse()
+        binance_ids = universe.register_exchange("binance", ["BTCUSDT", "ETHUSDT"])
+        bybit_ids = universe.register_exchange(
+            "bybit", ["ETH-USDT", "BTC-USDT", "BAD"],
+            normalize=lambda s: s.replace("-", "") if "-" in s else None
+        )
+
+        assert list(binance_ids) == [0, 1]
+        assert list(bybit_ids) == [1, 0]
+        assert universe.native("bybit", 0) == "BTC-USDT"
+        assert universe.id_of("BAD") is None
+
+        prices = universe.scatter("bybit", ["BTC-USDT", "XRP-USDT"], [50000.0, 0.5])
+        assert prices[0] == 50000.0
+        assert np.isnan(prices[1])
+
+    def test_id_history_ring_buffer(self):
+        """용량 초과 시 오래된 값부터 밀려남"""
+        history = IdHistory(3, initial_size=2)
+        for value in [1.0, 2.0, 3.0, 4.0]:
+            history.append(5, value)
+
+        assert history.is_full(5)
+        assert list(history.values(5)) == [2.0, 3.0, 4.0]
+        assert history.count(0) == 0
+        assert not history.is_full(100)
+
+
+class TestSpreadStats:
+    """롤링 스프레드 통계 테스트"""
+
+    def test_incremental_stats_match_window(self):
+        """증분 합계가 창 전체 재계산과 같고, 단일/배치 갱신 결과가 같음"""
+        rng = np.random.default_rng(0)
+        batch = SpreadStats(window=8, ewma_halflife=4.0, min_periods=5)
+        single = SpreadStats(window=8, ewma_halflife=4.0, min_periods=5)
+        history = []
+        value = 0.0
+        for _ in range(30):
+            value = 0.6 * value + rng.normal()
+            history.append(value)
+            batch.update_many(np.array([3]), np.array([value]))
+            single.update(3, value)
+
+        window = np.array(history[-8:])
+        assert batch.mean()[3] == pytest.approx(window.mean())
+        assert batch.std()[3] == pytest.approx(window.std())
+        phi = np.polyfit(window[:-1], window[1:], 1)[0]
+        assert batch.half_life()[3] == pytest.approx(-np.log(2) / np.log(phi))
+        assert batch.zscore_of(3) == pytest.approx(
+            (history[-1] - batch.ewma_mean()[3]) / batch.ewma_std()[3])
+
+        for name in ("mean", "std", "ewma_mean", "ewma_std", "zscore", "half_life"):
+            assert np.allclose(getattr(batch, name)(), getattr(single, name)(), equal_nan=True)
+        # 샘플이 없는 심볼은 NaN
+        assert np.isnan(batch.zscore()[0])
+
+
+class TestExecutionPrep:
+    """주문 준비 (레버리지/마진 캐시, 주문 템플릿) 테스트"""
+
+    @pytest.fixture
+    def exchanges(self):
+        async def slow_leverage(symbol, leverage):
+            await asyncio.sleep(0.02)
+            return True
+
+        def make_exchange(rules, params):
+            exchange = MagicMock()
+            exchange.set_margin_mode = AsyncMock(return_value=True)
+            exchange.set_leverage = AsyncMock(side_effect=slow_leverage)
+            exchange.market_rules.return_value = rules
+            exchange.order_params.return_value = params
+            return exchange
+
+        return {
+            'binance': make_exchange(MarketRules(min_qty=0.001, qty_step=0.001, tick_size=0.1), {}),
+            'bybit': make_exchange(MarketRules(min_qty=0.01, qty_step=0.01, tick_size=0.5), {'category': 'linear'}),
+        }
+
+    @pytest.mark.asyncio
+    async def test_arm_once_per_symbol_and_cache(self, exchanges):
+        """동시 요청은 병합되고 확인된 심볼은 다시 설정하지 않음"""
+        prep = ExecutionPrep(exchanges, leverage=2, margin_mode="isolated")
+
+        prep.schedule("BTCUSDT", ("binance", "bybit"))
+        assert await prep.arm("BTCUSDT")
+        assert await prep.arm("BTCUSDT")
+        prep.schedule("BTCUSDT", ("binance", "bybit"))
+
+        for exchange in exchanges.values():
+            exchange.set_margin_mode.assert_awaited_once_with("BTCUSDT", "isolated")
+            exchange.set_leverage.assert_awaited_once_with("BTCUSDT", 2)
+        assert prep.armed("BTCUSDT")
+        exchanges['bybit'].market_rules.assert_called_once_with("BTCUSDT")  # 템플릿도 미리 계산
+
+        prep.invalidate(exchange="bybit")
+        assert prep.is_armed("binance", "BTCUSDT") and not prep.armed("BTCUSDT")
+        assert await prep.arm("BTCUSDT")
+        assert exchanges['binance'].set_leverage.await_count == 1
+        assert exchanges['bybit'].set_leverage.await_count == 2
+        await prep.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_arm_waits_before_retry(self, exchanges):
+        """설정 실패는 캐시하지 않고 retry_after 동안 백그라운드 재시도 보류"""
+        exchanges['bybit'].set_leverage = AsyncMock(side_effect=Exception("rate limited"))
+        prep = ExecutionPrep(exchanges, retry_after=60.0)
+
+        assert not await prep.arm("ETHUSDT")
+        assert prep.is_armed("binance", "ETHUSDT") and not prep.is_armed("bybit", "ETHUSDT")
+
+        prep.schedule("ETHUSDT")
+        await asyncio.sleep(0)
+        assert exchanges['bybit'].set_leverage.await_count == 1
+        await prep.close()
+
+    def test_order_templates_and_pair_quantity(self, exchanges):
+        """템플릿은 단위/파라미터를 미리 담고, 양쪽 수량은 두 거래소 규칙을 모두 만족"""
+        prep = ExecutionPrep(exchanges)
+
+        assert prep.pair_quantity("BTCUSDT", "binance", "bybit", price=50000.0, target_usdt=100) == 0.01
+        assert prep.pair_quantity("ETHUSDT", "binance", "bybit", price=3000.0, target_usdt=100) == 0.03
+
+        order = prep.template("bybit", "ETHUSDT").order(OrderSide.SELL, OrderType.LIMIT, 0.03, price=3000.26)
+        assert order == {'symbol': "ETHUSDT", 'side': OrderSide.SELL, 'order_type': OrderType.LIMIT,
+                         'amount': 0.03, 'price': 3000.5, 'params': {'category': 'linear'}}
+        assert prep.template("binance", "ETHUSDT").quantity(0.0336999) == 0.033
+
+
+class TestExecutionEngine:
+    """2-다리 동시 주문 테스트"""
+
+    @pytest.fixture
+    def exchanges(self):
+        def make_exchange(name, delay=0.05, fail=False, accepted_on_error=False):
+            async def create_order(symbol, side, order_type, amount, price=None, params=None):
+                await asyncio.sleep(delay)
+                if fail:
+                    raise Exception("insufficient balance")
+                return Order(id=f"{name}-{side.value}", symbol=symbol, side=side, type=order_type,
+                             amount=amount, price=price, status='new')
+
+            async def fetch_order_by_client_id(client_order_id, symbol):
+                if not accepted_on_error:
+                    return None
+                return Order(id=f"{name}-accepted", symbol=symbol, side=OrderSide.BUY, type=OrderType.MARKET,
+                             amount=0.001, price=None, filled=0.001, status='filled')
+
+            exchange = MagicMock()
+            exchange.name = name
+            exchange.client_order_id_param = "newClientOrderId"
+            exchange.reduce_only_params = {"reduceOnly": "true"}
+            exchange.fetch_order_by_client_id = AsyncMock(side_effect=fetch_order_by_client_id)
+            exchange.set_margin_mode = AsyncMock(return_value=True)
+            exchange.set_leverage = AsyncMock(return_value=True)
+            exchange.market_rules.return_value = MarketRules(min_qty=0.001, qty_step=0.001)
+            exchange.order_params.return_value = {}
+            exchange.create_order = AsyncMock(side_effect=create_order)
+            return exchange
+
+        return make_exchange
+
+    @pytest.fixture
+    def spread_item(self):
+        return SpreadData(timestamp="", symbol="BTCUSDT", binance_price=50100.0, bybit_price=50000.0,
+                          spread_pct=0.2, abs_spread_pct=0.2, direction=Direction.BINANCE_GT_BYBIT,
+                          volume_24h=1e9, sell_exchange="binance", buy_exchange="bybit",
+                          sell_price=50100.0, buy_price=50000.0)
+
+    def make_engine(self, exchanges, **kwargs):
+        prep = ExecutionPrep(exchanges)
+        return ExecutionEngine(exchanges, PositionManager(max_positions=3), prep,
+                               performance_monitor=MagicMock(), **kwargs)
+
+    @pytest.mark.asyncio
+    async def test_both_legs_sent_concurrently(self, exchanges, spread_item):
+        """두 다리는 동시에 전송되고 포지션은 PENDING으로 등록됨"""
+        venues = {'binance': exchanges('binance'), 'bybit': exchanges('bybit')}
+        engine = self.make_engine(venues)
+
+        start = time.perf_counter()
+        result = await engine.enter(spread_item, target_usdt=100)
+        elapsed = time.perf_counter() - start
+
+        assert result.success and not result.rolled_back
+        assert elapsed < 0.09  # 순차 전송이면 0.1초 이상
+        assert result.send_skew < 0.005
+        assert result.long.exchange == "bybit" and result.short.exchange == "binance"
+        venues['bybit'].create_order.assert_awaited_once_with(
+            symbol="BTCUSDT", side=OrderSide.BUY, order_type=OrderType.MARKET,
+            amount=0.001, price=None, params={"newClientOrderId": result.long.client_order_id})
+        assert result.long.client_order_id.startswith("arb-")
+        assert result.long.client_order_id != result.short.client_order_id
+
+        position = engine.position_manager.positions["BTCUSDT"]
+        assert position.status == PositionStatus.PENDING
+        assert (position.long_order_id, position.short_order_id) == ("bybit-buy", "binance-sell")
+        send_skew, ack_skew, ack_times = engine.performance_monitor.record_leg_execution.call_args.args
+        assert send_skew == result.send_skew and set(ack_times) == {"binance", "bybit"}
+
+    @pytest.mark.asyncio
+    async def test_failed_leg_rolls_back_other(self, exchanges, spread_item):
+        """한쪽 다리 실패 시 체결된 다리를 반대 주문으로 되돌리고 재시도 대기"""
+        venues = {'binance': exchanges('binance'), 'bybit': exchanges('bybit', fail=True)}
+        engine = self.make_engine(venues)
+
+        assert engine.submit(spread_item, target_usdt=100)
+        assert not engine.submit(spread_item, target_usdt=100)  # 진행 중
+        await engine.close()
+
+        assert "BTCUSDT" not in engine.position_manager.positions
+        rollback = venues['binance'].create_order.await_args_list[-1].kwargs
+        assert (rollback['side'], rollback['order_type'], rollback['amount']) == \
+               (OrderSide.BUY, OrderType.MARKET, 0.001)
+        assert rollback['params']['reduceOnly'] == "true"  # 반대 포지션을 새로 열지 않음
+        engine.performance_monitor.record_error.assert_called_with("leg_rollback")
+        assert not engine.can_submit("BTCUSDT")  # entry_cooldown
+        # 실패한 다리는 클라이언트 주문 ID로 접수 여부 확인 (미접수 → 되돌릴 것 없음)
+        venues['bybit'].fetch_order_by_client_id.assert_awaited_once()
+        assert venues['bybit'].create_order.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_errored_leg_accepted_is_rolled_back(self, exchanges, spread_item):
+        """오류 응답이었지만 접수 확인된 다리는 실패로 치고 양쪽 모두 되돌림"""
+        venues = {'binance': exchanges('binance'),
+                  'bybit': exchanges('bybit', fail=True, accepted_on_error=True)}
+        engine = self.make_engine(venues)
+
+        result = await engine.enter(spread_item, target_usdt=100)
+
+        assert not result.success and result.rolled_back
+        assert result.long.accepted and not result.long.ok
+        client_order_id = venues['bybit'].create_order.await_args_list[0].kwargs['params']['newClientOrderId']
+        venues['bybit'].fetch_order_by_client_id.assert_awaited_once_with(client_order_id, "BTCUSDT")
+        bybit_rollback = venues['bybit'].create_order.await_args_list[-1].kwargs
+        assert venues['bybit'].create_order.await_count == 2
+        assert (bybit_rollback['side'], bybit_rollback['amount']) == (OrderSide.SELL, 0.001)
+        assert venues['binance'].create_order.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_late_leg_rolled_back_after_ack(self, exchanges, spread_item):
+        """마감을 넘긴 다리는 진입을 취소하고, 늦게 응답하면 그 다리도 되돌림"""
+        venues = {'binance': exchanges('binance', delay=0.0), 'bybit': exchanges('bybit', delay=0.1)}
+        engine = self.make_engine(venues, leg_timeout=0.03)
+
+        result = await engine.enter(spread_item, target_usdt=100)
+        assert not result.success and result.rolled_back
+        assert venues['binance'].create_order.await_count == 2  # 진입 + 되돌림
+        assert venues['bybit'].create_order.await_count == 1
+
+        await engine.close()
+        late_rollback = venues['bybit'].create_order.await_args_list[-1].kwargs
+        assert venues['bybit'].create_order.await_count == 2
+        assert late_rollback['side'] == OrderSide.SELL
+
+    @pytest.mark.asyncio
+    async def test_leg_rolled_back_once(self, exchanges, spread_item):
+        """같은 다리에 되돌리기가 두 번 불려도 반대 주문은 한 번만"""
+        venues = {'binance': exchanges('binance'), 'bybit': exchanges('bybit')}
+        engine = self.make_engine(venues)
+        order = await venues['binance'].create_order("BTCUSDT", OrderSide.SELL, OrderType.MARKET, 0.001)
+        leg = LegResult('binance', OrderSide.SELL, 0.001, order=order)
+
+        await asyncio.gather(engine._rollback("BTCUSDT", leg), engine._rollback("BTCUSDT", leg))
+
+        assert leg.rolled_back
+        assert venues['binance'].create_order.await_count == 2  # 원 주문 + 되돌림 1회
+
+
+class TestLoopLagMonitor:
+    """이벤트 루프 지연 측정 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_blocking_call_shows_as_lag_and_slow_callback(self):
+        """루프를 막는 동기 작업은 스케줄링 지연과 느린 콜백으로 기록됨"""
+        performance_monitor = MagicMock()
+        monitor = LoopLagMonitor(performance_monitor, interval=0.01, slow_callback_ms=20)
+        loop = asyncio.get_running_loop()
+        debug_before = loop.get_debug()
+
+        monitor.start()
+        await asyncio.sleep(0.03)
+
+        async def blocking():
+            time.sleep(0.05)  # 동기 I/O 흉내
+
+        await asyncio.create_task(blocking())
+        await asyncio.sleep(0.03)
+        await monitor.stop()
+
+        assert monitor.samples >= 3
+        assert monitor.max_lag >= 0.03
+        assert performance_monitor.record_loop_lag.call_count == monitor.samples
+
+        assert any(duration >= 0.05 and "blocking" in callback
+                   for callback, duration in monitor.slow_callbacks)
+        performance_monitor.record_slow_callback.assert_called()
+        assert loop.get_debug() == debug_before
+        assert not monitor.running
 
 
 class TestPositionManager:
@@ -1,9 +1,24 @@
 # arb_trading/tests/test_exchanges.py
+import asyncio
+import math
 import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 from unittest.mock import AsyncMock, MagicMock
-from arb_trading.exchanges.base import BaseExchange, OrderType, OrderSide, Ticker
+from arb_trading.exchanges.base import BaseExchange, OrderType, OrderSide, Ticker, SnapshotCache
 from arb_trading.exchanges.binance import BinanceExchange
 from arb_trading.exchanges.bybit import BybitExchange
+from arb_trading.exchanges.decoders import (
+    decode_binance_book, decode_binance_funding, decode_binance_prices, decode_bybit_funding, decode_bybit_tickers
+)
+from arb_trading.exchanges.rate_limiter import RateLimiter, TokenBucket
+from arb_trading.exchanges.endpoints import EndpointPool
+from arb_trading.exchanges.resilience import CircuitBreaker, CircuitOpenError, RetryPolicy
+from arb_trading.exchanges.hedging import DeadlineExceededError, deadline_scope
+from arb_trading.utils.http_session import SessionRegistry
+from arb_trading.exchanges.streams import (
+    TickerBoard, MarketDataStream, BinanceTickerStream, BybitTickerStream
+)
 
 
 class TestBaseExchange:
@@ -117,3 +132,593 @@ class TestBybitExchange:
         """수량 계산 테스트"""
         quantity = bybit_exchange.calculate_quantity("BTCUSDT", 50000.0, 1000.0)
         assert quantity == 0.02  # 1000 / 50000
+
+    @pytest.mark.asyncio
+    async def test_ticker_batch_decodes_raw_bytes(self, bybit_exchange):
+        """티커 컬럼 조회는 bytes 응답을 디코더로 바로 넘김 (dict 변환 없음)"""
+        raw = (b'{"retCode":0,"result":{"list":['
+               b'{"symbol":"BTCUSDT","lastPrice":"50000","bid1Price":"49999","ask1Price":"50001"}]},'
+               b'"time":1700000000000}')
+        bybit_exchange._request = AsyncMock(return_value=raw)
+
+        batch = await bybit_exchange.fetch_ticker_batch()
+
+        assert batch.symbols == ["BTCUSDT"]
+        assert bybit_exchange._request.call_args.kwargs['raw'] is True
+
+
+class TestMarketDataStream:
+    """실시간 시세 스트림 테스트"""
+
+    @pytest.fixture
+    def board(self):
+        return TickerBoard()
+
+    def test_board_partial_update(self, board):
+        """부분 갱신 시 기존 필드 유지"""
+        board.update("bybit", "BTCUSDT", last_price=50000.0, bid=49999.0, ask=50001.0)
+        board.update("bybit", "BTCUSDT", bid=49998.0)
+
+        ticker = board.snapshot("bybit")["BTCUSDT"]
+        assert ticker.last_price == 50000.0
+        assert ticker.bid == 49998.0
+        assert ticker.ask == 50001.0
+
+    def test_bybit_delta_message(self, board):
+        """바이빗 delta 메시지 병합"""
+        stream = BybitTickerStream(BybitExchange(), board)
+        stream._handle_message({
+            "topic": "tickers.ETHUSDT", "type": "snapshot",
+            "data": {"symbol": "ETHUSDT", "lastPrice": "3000.5", "bid1Price": "3000.4",
+                     "ask1Price": "3000.6", "turnover24h": "123456.0"}
+        })
+        stream._handle_message({
+            "topic": "tickers.ETHUSDT", "type": "delta",
+            "data": {"symbol": "ETHUSDT", "lastPrice": "3001.0"}
+        })
+
+        ticker = board.snapshot("bybit")["ETHUSDT"]
+        assert ticker.last_price == 3001.0
+        assert ticker.bid == 3000.4
+        assert ticker.volume_24h == 123456.0
+
+    def test_binance_combined_stream(self, board):
+        """바이낸스 결합 스트림 처리"""
+        stream = BinanceTickerStream(BinanceExchange("", ""), board)
+        stream._handle_message({
+            "stream": "!ticker@arr",
+            "data": [{"s": "BTCUSDT", "c": "50000.0", "q": "1000000.0", "E": 1700000000000}]
+        })
+        stream._handle_message({
+            "stream": "!bookTicker",
+            "data": {"s": "BTCUSDT", "b": "49999.9", "a": "50000.1", "E": 1700000000250}
+        })
+
+        ticker = board.snapshot("binance")["BTCUSDT"]
+        assert ticker.last_price == 50000.0
+        assert ticker.ask == 50000.1
+        # 수신 시각이 아닌 거래소 이벤트 시각
+        assert ticker.timestamp == 1700000000250
+
+    def test_stale_stream_falls_back(self):
+        """연결되지 않은 스트림은 None 반환 (REST 사용)"""
+        market_stream = MarketDataStream({"bybit": BybitExchange()})
+        market_stream.board.update("bybit", "BTCUSDT", last_price=50000.0)
+        assert market_stream.get_tickers("bybit") is None
+
+        market_stream.streams["bybit"].connected = True
+        assert "BTCUSDT" in market_stream.get_tickers("bybit")
+
+
+class TestRateLimiter:
+    """토큰 버킷 레이트 리미터 테스트"""
+
+    @pytest.fixture
+    def limiter(self):
+        return RateLimiter(
+            buckets={'weight': TokenBucket(capacity=100, window=1.0, reserve_ratio=0.0)},
+            weights={'/ticker/24hr': (40, 1)}
+        )
+
+    def test_weight_lookup(self, limiter):
+        """전체/단일 심볼 가중치 구분"""
+        assert limiter.weight_for('/ticker/24hr') == 40
+        assert limiter.weight_for('/ticker/24hr', {'symbol': 'BTCUSDT'}) == 1
+        assert limiter.weight_for('/unknown') == 1
+
+    @pytest.mark.asyncio
+    async def test_no_wait_under_budget(self, limiter):
+        """예산 내에서는 대기 없음"""
+        await limiter.acquire('/ticker/24hr', 40)
+        await limiter.acquire('/ticker/24hr', 40)
+        assert limiter.total_wait == 0.0
+
+    @pytest.mark.asyncio
+    async def test_wait_when_exhausted(self, limiter):
+        """예산 소진 시 재충전 시간만큼 대기"""
+        for _ in range(2):
+            await limiter.acquire('/ticker/24hr', 40)
+        await limiter.acquire('/ticker/24hr', 40)
+        assert 0.1 < limiter.total_wait < 0.3
+
+    def test_header_sync(self, limiter):
+        """서버 사용량 헤더로 보정"""
+        limiter.sync_used('weight', 90)
+        assert not limiter.has_capacity('/ticker/24hr', 40)
+
+    def test_binance_header_sync(self):
+        """바이낸스 X-MBX-USED-WEIGHT-1M 반영"""
+        binance = BinanceExchange("", "")
+        binance._sync_rate_limit('/fapi/v1/ticker/24hr', {'X-MBX-USED-WEIGHT-1M': '2390'})
+        assert binance.rate_limiter.buckets['weight'].available() < 20
+
+    @pytest.mark.asyncio
+    async def test_order_lookup_skips_order_bucket(self):
+        """바이낸스 주문 조회(GET)는 주문 수 버킷을 쓰지 않고 생성/취소만 차감"""
+        binance = BinanceExchange("", "")
+        orders = binance.rate_limiter.buckets['orders']
+        before = orders.available()
+
+        await binance.rate_limiter.acquire('/fapi/v1/order', 1, 'GET')
+        assert orders.available() == pytest.approx(before, abs=0.5)
+
+        await binance.rate_limiter.acquire('/fapi/v1/order', 1, 'POST')
+        await binance.rate_limiter.acquire('/fapi/v1/order', 1, 'DELETE')
+        assert orders.available() == pytest.approx(before - 2, abs=0.5)
+
+
+class TestTickerDecoders:
+    """티커 디코더 테스트"""
+
+    def test_binance_prices(self):
+        """바이낸스 ticker/price → 컬럼"""
+        raw = b'[{"symbol":"BTCUSDT","price":"50000.10","time":1},{"symbol":"ETHUSDT","price":"3000","time":1}]'
+        batch = decode_binance_prices(raw)
+        assert batch.price_map() == {"BTCUSDT": 50000.10, "ETHUSDT": 3000.0}
+        assert batch.event_times is None  # 마지막 체결 시각은 시세 기준 시각이 아님 (수신 시각 사용)
+
+    def test_binance_book(self):
+        """바이낸스 ticker/bookTicker → 호가 컬럼 (체결가 자리는 중간값)"""
+        raw = b'[{"symbol":"BTCUSDT","bidPrice":"49999","bidQty":"1","askPrice":"50001","askQty":"2"}]'
+        batch = decode_binance_book(raw)
+        assert batch.bids == [49999.0]
+        assert batch.asks == [50001.0]
+        assert batch.last_prices == [50000.0]
+
+    def test_bybit_tickers_filters_futures(self):
+        """바이빗: 만료 선물/무효 가격 제외, 빈 호가는 NaN"""
+        raw = (b'{"retCode":0,"result":{"list":['
+               b'{"symbol":"BTCUSDT","lastPrice":"50000","bid1Price":"49999","ask1Price":"50001"},'
+               b'{"symbol":"BTCUSDT-26DEC25","lastPrice":"51000","bid1Price":"","ask1Price":""},'
+               b'{"symbol":"XYZUSDT","lastPrice":"0","bid1Price":"","ask1Price":""},'
+               b'{"symbol":"ETHUSDT","lastPrice":"3000","bid1Price":"","ask1Price":"3001"}]},'
+               b'"time":1700000000000}')
+        batch = decode_bybit_tickers(raw, timestamp=1700000000100)
+        assert batch.symbols == ["BTCUSDT", "ETHUSDT"]
+        assert batch.bids[0] == 49999.0 and math.isnan(batch.bids[1])
+        assert batch.event_times == [1700000000000, 1700000000000]
+
+    def test_funding_rates(self):
+        """펀딩비 → % 단위 컬럼 (바이낸스 주기 기본 8시간, 바이빗은 응답 주기 사용)"""
+        raw = (b'[{"symbol":"BTCUSDT","lastFundingRate":"0.00010000","nextFundingTime":1700000000000},'
+               b'{"symbol":"ETHUSDT_240628","lastFundingRate":"","nextFundingTime":0}]')
+        batch = decode_binance_funding(raw)
+        assert batch.symbols == ["BTCUSDT"]
+        assert batch.rates_pct == [pytest.approx(0.01)]
+        assert batch.interval_hours == [8.0]
+
+        raw = (b'{"retCode":0,"result":{"list":['
+               b'{"symbol":"BTCUSDT","fundingRate":"-0.0005","nextFundingTime":"1700000000000",'
+               b'"fundingIntervalHour":"4"},'
+               b'{"symbol":"BTCUSDT-26DEC25","fundingRate":"","nextFundingTime":"0"}]}}')
+        batch = decode_bybit_funding(raw)
+        assert batch.symbols == ["BTCUSDT"]
+        assert batch.rates_pct == [pytest.approx(-0.05)]
+        assert batch.next_funding_times == [1700000000000]
+        assert batch.interval_hours == [4.0]
+
+    def test_bybit_error_response(self):
+        """retCode 오류 시 예외"""
+        with pytest.raises(Exception):
+            decode_bybit_tickers(b'{"retCode":10001,"retMsg":"error"}')
+
+
+class TestSnapshotCache:
+    """단일 비행 스냅샷 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_single_flight(self):
+        """동시 요청은 한 번만 실행"""
+        cache = SnapshotCache(default_ttl=1.0)
+        calls = 0
+
+        async def fetcher():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"value": calls}
+
+        results = await asyncio.gather(*(cache.get("tickers", fetcher) for _ in range(5)))
+        assert calls == 1
+        assert all(r == {"value": 1} for r in results)
+
+        # TTL 내 재조회는 캐시 사용
+        await cache.get("tickers", fetcher)
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry_and_errors(self):
+        """TTL 만료 시 재조회, 실패 결과는 캐시하지 않음"""
+        cache = SnapshotCache(default_ttl=0.0)
+        fetcher = AsyncMock(side_effect=[Exception("timeout"), {"ok": True}])
+
+        with pytest.raises(Exception):
+            await cache.get("tickers", fetcher)
+        assert await cache.get("tickers", fetcher) == {"ok": True}
+
+    @pytest.mark.asyncio
+    async def test_bybit_volumes_share_ticker_snapshot(self):
+        """바이빗 거래량 조회는 티커 스냅샷 재사용"""
+        bybit = BybitExchange()
+        bybit._request = AsyncMock(return_value={
+            "retCode": 0,
+            "result": {"list": [{"symbol": "BTCUSDT", "lastPrice": "50000", "turnover24h": "1000"}]}
+        })
+
+        await bybit.fetch_tickers()
+        volumes = await bybit.fetch_24h_volumes()
+
+        assert volumes == {"BTCUSDT": 1000.0}
+        assert bybit._request.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_binance_fields_select_endpoints(self):
+        """바이낸스: 필요한 필드의 엔드포인트만 호출"""
+        binance = BinanceExchange("", "")
+        binance._request = AsyncMock(return_value=[{"symbol": "BTCUSDT", "price": "50000"}])
+
+        tickers = await binance.fetch_tickers(fields={'last_price'})
+
+        assert tickers["BTCUSDT"].last_price == 50000.0
+        assert binance._request.call_count == 1
+        assert binance._request.call_args[0][1].endswith("/fapi/v1/ticker/price")
+
+
+class TestCompositeFetch:
+    """복합 조회 (동시 하위 요청) 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_sub_requests_run_concurrently(self):
+        """하위 요청 동시 실행 + 하위 요청별 타이밍 기록"""
+        binance = BinanceExchange("", "")
+        binance.performance_monitor = MagicMock()
+
+        async def slow_24hr():
+            await asyncio.sleep(0.05)
+            return [{"symbol": "BTCUSDT", "lastPrice": "50000", "quoteVolume": "1000"}]
+
+        async def slow_book():
+            await asyncio.sleep(0.05)
+            return [{"symbol": "BTCUSDT", "bidPrice": "49999", "askPrice": "50001"}]
+
+        binance._fetch_24hr_list = slow_24hr
+        binance._fetch_book_list = slow_book
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        tickers = await binance.fetch_tickers(fields={'last_price', 'volume_24h', 'bid', 'ask'})
+        elapsed = loop.time() - start
+
+        assert elapsed < 0.09
+        assert tickers["BTCUSDT"].bid == 49999.0
+        assert tickers["BTCUSDT"].volume_24h == 1000.0
+        operations = {c.args[1] for c in binance.performance_monitor.record_exchange_fetch.call_args_list}
+        assert operations == {"tickers:24hr", "tickers:book"}
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_siblings(self):
+        """하위 요청 실패 시 나머지 취소"""
+        binance = BinanceExchange("", "")
+        cancelled = asyncio.Event()
+
+        async def failing():
+            raise Exception("HTTP 500")
+
+        async def slow():
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(Exception):
+            await binance._fetch_composite("tickers", {"a": failing, "b": slow})
+        await asyncio.sleep(0)
+        assert cancelled.is_set()
+
+
+class TestSessionRegistry:
+    """공유 HTTP 세션 레지스트리 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_shared_session_refcount(self):
+        """같은 키는 세션 공유, 마지막 반환 시 종료"""
+        registry = SessionRegistry(pool_size=50, pool_per_host=10, keepalive_timeout=60)
+        first = registry.acquire("binance")
+        second = registry.acquire("binance")
+        other = registry.acquire("bybit")
+
+        assert first is second
+        assert first is not other
+        assert first.connector.limit == 50
+        assert first.connector.limit_per_host == 10
+
+        await registry.release("binance")
+        assert not first.closed
+        await registry.release("binance")
+        assert first.closed
+
+        await registry.close_all()
+        assert other.closed
+        assert registry.stats() == {}
+
+
+class TestRequestHedging:
+    """요청 마감 / 헤지 테스트 (로컬 aiohttp 서버)"""
+
+    @staticmethod
+    async def start_server(delays):
+        """요청 순서별 지연(초)을 주입한 가격 엔드포인트"""
+        calls = []
+
+        async def handler(request):
+            delay = delays[min(len(calls), len(delays) - 1)]
+            calls.append(delay)
+            await asyncio.sleep(delay)
+            return web.json_response([{"symbol": "BTCUSDT", "price": "50000"}])
+
+        app = web.Application()
+        app.router.add_get("/fapi/v1/ticker/price", handler)
+        server = TestServer(app)
+        await server.start_server()
+        return server, calls
+
+    @pytest.mark.asyncio
+    async def test_deadline_bounds_slow_request(self):
+        """마감 초과 시 재시도 없이 즉시 실패"""
+        server, calls = await self.start_server([1.0])
+        binance = BinanceExchange("", "")
+        try:
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            with pytest.raises(DeadlineExceededError):
+                with deadline_scope(0.1):
+                    await binance._request("GET", str(server.make_url("/fapi/v1/ticker/price")))
+            assert loop.time() - start < 0.5
+            assert len(calls) == 1
+        finally:
+            await binance.disconnect()
+            await server.close()
+
+    @pytest.mark.asyncio
+    async def test_hedge_after_p95(self):
+        """p95 경과 후 헤지 요청이 먼저 응답하면 그 결과 사용"""
+        server, calls = await self.start_server([1.0, 0.0])
+        binance = BinanceExchange("", "")
+        binance.configure_hedging(max_ratio=1.0)
+        for _ in range(20):
+            binance.latency_tracker.record("/fapi/v1/ticker/price", 0.02)
+        try:
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            data = await binance._hedged_request("GET", str(server.make_url("/fapi/v1/ticker/price")))
+            assert loop.time() - start < 0.5
+            assert data[0]["symbol"] == "BTCUSDT"
+            assert len(calls) == 2
+            assert binance.hedge_budget.won == 1
+        finally:
+            await binance.disconnect()
+            await server.close()
+
+    @pytest.mark.asyncio
+    async def test_hedge_budget_exhausted(self):
+        """헤지 예산이 없으면 원 요청만 기다림"""
+        server, calls = await self.start_server([0.2])
+        binance = BinanceExchange("", "")
+        binance.configure_hedging(max_ratio=0.0)
+        binance.hedge_budget.credit = 0.0
+        for _ in range(20):
+            binance.latency_tracker.record("/fapi/v1/ticker/price", 0.02)
+        try:
+            await binance._hedged_request("GET", str(server.make_url("/fapi/v1/ticker/price")))
+            assert len(calls) == 1
+            assert binance.hedge_budget.fired == 0
+        finally:
+            await binance.disconnect()
+            await server.close()
+
+
+class TestOrderRequests:
+    """주문 요청 테스트 (로컬 대역 서버)"""
+
+    @pytest.mark.asyncio
+    async def test_order_post_is_not_retried(self):
+        """주문 생성은 5xx에도 재전송하지 않음 (중복 주문 방지)"""
+        calls = []
+
+        async def handler(request):
+            calls.append(request.query.get('newClientOrderId'))
+            return web.Response(status=503, text="busy")
+
+        app = web.Application()
+        app.router.add_post("/fapi/v1/order", handler)
+        server = TestServer(app)
+        await server.start_server()
+        binance = BinanceExchange("key", "secret", base_urls=[str(server.make_url("")).rstrip("/")])
+        binance.configure_resilience(max_attempts=3)
+        try:
+            with pytest.raises(Exception):
+                await binance.create_order("BTCUSDT", OrderSide.BUY, OrderType.MARKET, 0.001,
+                                           params={'newClientOrderId': 'arb-test'})
+            assert calls == ['arb-test']
+        finally:
+            await binance.disconnect()
+            await server.close()
+
+
+class TestEndpointFailover:
+    """다중 엔드포인트 순위/장애 전환 테스트 (로컬 대역 서버)"""
+
+    @staticmethod
+    async def start_server(delay):
+        async def handler(request):
+            await asyncio.sleep(delay)
+            return web.json_response({"retCode": 0, "result": {"timeSecond": "0"}})
+
+        app = web.Application()
+        app.router.add_get("/v5/market/time", handler)
+        server = TestServer(app)
+        await server.start_server()
+        return server
+
+    @staticmethod
+    def base(server):
+        return str(server.make_url("")).rstrip("/")
+
+    @pytest.mark.asyncio
+    async def test_routes_to_fastest(self):
+        """예열 ping 지연 시간으로 가장 빠른 호스트 선택"""
+        slow = await self.start_server(0.1)
+        fast = await self.start_server(0.0)
+        bybit = BybitExchange(base_urls=[self.base(slow), self.base(fast)])
+        try:
+            assert bybit.base_url == self.base(slow)  # 측정 전에는 설정 순서
+            assert await bybit.warm_up(connections=1) == 2
+            assert bybit.base_url == self.base(fast)
+        finally:
+            await bybit.disconnect()
+            await slow.close()
+            await fast.close()
+
+    @pytest.mark.asyncio
+    async def test_connector_error_fails_over_immediately(self):
+        """연결 오류 시 대기 없이 다음 호스트로 전환"""
+        live = await self.start_server(0.0)
+        dead = await self.start_server(0.0)
+        dead_url = self.base(dead)
+        await dead.close()
+
+        bybit = BybitExchange(base_urls=[dead_url, self.base(live)])
+        try:
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            data = await bybit._request("GET", "/v5/market/time")
+            assert data["retCode"] == 0
+            assert loop.time() - start < 1.0
+            assert bybit.base_url == self.base(live)
+            assert not bybit.endpoints.stats()[0]["정상"]
+        finally:
+            await bybit.disconnect()
+            await live.close()
+
+    def test_error_score_demotes_endpoint(self):
+        """실패율이 높은 호스트는 지연이 짧아도 후순위"""
+        pool = EndpointPool(["https://a", "https://b"])
+        pool.record_success("https://a", 0.05)
+        pool.record_success("https://b", 0.08)
+        assert pool.best() == "https://a"
+
+        for _ in range(3):
+            pool.record_failure("https://a")
+        assert pool.best() == "https://b"
+
+
+class TestCircuitBreaker:
+    """회로 차단기 / 지터 재시도 테스트"""
+
+    def test_state_transitions(self):
+        """연속 실패 → 열림, 복구 대기 후 시험 1건 → 닫힘"""
+        states = []
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=0.0,
+                                 on_state_change=states.append)
+        breaker.record_failure()
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+
+        assert breaker.allow_request()  # 시험 요청
+        assert not breaker.allow_request()  # 시험 중 추가 요청 거절
+        breaker.record_success()
+        assert states == ["open", "half_open", "closed"]
+
+    def test_decorrelated_jitter_bounds(self):
+        """대기 시간은 [base, cap] 범위"""
+        policy = RetryPolicy(base=0.1, cap=1.0)
+        delay = None
+        for _ in range(50):
+            delay = policy.next_delay(delay)
+            assert 0.1 <= delay <= 1.0
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self):
+        """연결 실패가 이어지면 회로가 열리고 이후 요청은 즉시 실패"""
+        server = TestServer(web.Application())
+        await server.start_server()
+        dead_url = str(server.make_url("")).rstrip("/")
+        await server.close()
+
+        bybit = BybitExchange(base_urls=[dead_url])
+        bybit.configure_resilience(failure_threshold=2, recovery_timeout=60,
+                                   max_attempts=1)
+        bybit.performance_monitor = MagicMock()
+        try:
+            for _ in range(2):
+                with pytest.raises(Exception):
+                    await bybit._request("GET", "/v5/market/time")
+
+            with pytest.raises(CircuitOpenError):
+                await bybit._request("GET", "/v5/market/time")
+            bybit.performance_monitor.record_circuit_state.assert_called_with("bybit", "open")
+        finally:
+            await bybit.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_deadline_before_send_is_not_a_failure(self):
+        """요청 전 마감 초과(레이트 리밋 대기 등)는 실패로 집계하지 않고 시험 요청 슬롯만 반납"""
+        bybit = BybitExchange()
+        bybit.configure_resilience(failure_threshold=1, recovery_timeout=0.0, max_attempts=1)
+        bybit.circuit_breaker.record_failure()
+        assert bybit.circuit_breaker.state == CircuitBreaker.OPEN
+        bybit.session = MagicMock()  # 요청이 나가면 안 됨
+
+        with pytest.raises(DeadlineExceededError):
+            with deadline_scope(0.0):
+                await bybit._request("GET", "/v5/market/time")
+
+        assert bybit.circuit_breaker.consecutive_failures == 1
+        assert bybit.circuit_breaker.state == CircuitBreaker.HALF_OPEN
+        assert bybit.circuit_breaker.allow_request()  # 시험 요청 슬롯 반납됨
+        bybit.session.request.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_keepalive_ping_bypasses_limiter_and_breaker(self):
+        """유휴 ping 실패는 회로 차단기/레이트 리밋/엔드포인트 점수에 반영되지 않음"""
+        server = TestServer(web.Application())
+        await server.start_server()
+        dead_url = str(server.make_url("")).rstrip("/")
+        await server.close()
+
+        bybit = BybitExchange(base_urls=[dead_url])
+        bybit.configure_resilience(failure_threshold=1)
+        await bybit.connect()
+        ip_before = bybit.rate_limiter.buckets['ip'].available()
+        try:
+            bybit.start_keepalive(interval=0.01, connections=2)
+            await asyncio.sleep(0.1)
+
+            assert bybit.circuit_breaker.state == CircuitBreaker.CLOSED
+            assert bybit.circuit_breaker.consecutive_failures == 0
+            assert bybit.rate_limiter.buckets['ip'].available() >= ip_before
+            assert bybit.endpoints.best() == dead_url
+        finally:
+            await bybit.disconnect()
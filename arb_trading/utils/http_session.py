@@ -0,0 +1,103 @@
+# arb_trading/utils/http_session.py
+"""프로세스 전역 HTTP 세션 레지스트리
+
+거래소/알림 등 호출 대상별로 하나의 aiohttp 세션(= 호스트별 커넥션 풀)을 공유한다.
+- 매 요청/메시지마다 TCP+TLS 핸드셰이크를 새로 하지 않도록 keep-alive 연결 재사용
+- aiohttp는 HTTP/1.1 파이프라이닝을 하지 않으므로 한 연결에 요청이 순차 재사용됨
+- 풀 크기와 keep-alive 유지 시간은 MonitoringConfig로 설정
+"""
+
+import asyncio
+import logging
+from typing import Dict, Optional
+
+import aiohttp
+
+from .platform_utils import get_optimal_connector
+
+
+class SessionRegistry:
+    """키(거래소 이름 등)별 공유 세션 관리 (참조 카운트)"""
+
+    def __init__(self, pool_size: int = 100, pool_per_host: int = 20,
+                 keepalive_timeout: float = 120.0):
+        self.pool_size = pool_size
+        self.pool_per_host = pool_per_host
+        self.keepalive_timeout = keepalive_timeout
+
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
+        self._loops: Dict[str, asyncio.AbstractEventLoop] = {}
+        self._refcounts: Dict[str, int] = {}
+        self.logger = logging.getLogger(__name__)
+
+    def configure(self, pool_size: Optional[int] = None, pool_per_host: Optional[int] = None,
+                  keepalive_timeout: Optional[float] = None):
+        """풀 설정 변경 (이후 생성되는 세션부터 적용)"""
+        if pool_size is not None:
+            self.pool_size = pool_size
+        if pool_per_host is not None:
+            self.pool_per_host = pool_per_host
+        if keepalive_timeout is not None:
+            self.keepalive_timeout = keepalive_timeout
+
+    def _is_usable(self, key: str) -> bool:
+        session = self._sessions.get(key)
+        if session is None or session.closed:
+            return False
+        # 다른 이벤트 루프에서 만든 세션은 재사용 불가
+        return self._loops.get(key) is asyncio.get_running_loop()
+
+    def acquire(self, key: str, headers: Optional[Dict[str, str]] = None,
+                timeout: Optional[aiohttp.ClientTimeout] = None) -> aiohttp.ClientSession:
+        """공유 세션 획득 (없으면 생성)"""
+        if not self._is_usable(key):
+            connector = get_optimal_connector(
+                limit=self.pool_size,
+                limit_per_host=self.pool_per_host,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            self._sessions[key] = aiohttp.ClientSession(
+                connector=connector,
+                headers=headers,
+                timeout=timeout or aiohttp.ClientTimeout(total=30, connect=10)
+            )
+            self._loops[key] = asyncio.get_running_loop()
+            self._refcounts[key] = 0
+            self.logger.debug(f"HTTP 세션 생성: {key}")
+
+        self._refcounts[key] += 1
+        return self._sessions[key]
+
+    async def release(self, key: str):
+        """세션 반환 (마지막 사용자가 반환하면 종료)"""
+        if key not in self._refcounts:
+            return
+
+        self._refcounts[key] -= 1
+        if self._refcounts[key] <= 0:
+            await self._close(key)
+
+    async def _close(self, key: str):
+        session = self._sessions.pop(key, None)
+        self._loops.pop(key, None)
+        self._refcounts.pop(key, None)
+        if session and not session.closed:
+            await session.close()
+
+    async def close_all(self):
+        """모든 세션 종료"""
+        for key in list(self._sessions.keys()):
+            await self._close(key)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """세션별 참조 수 / 유휴 연결 수"""
+        result = {}
+        for key, session in self._sessions.items():
+            connector = session.connector
+            idle = sum(len(conns) for conns in getattr(connector, '_conns', {}).values())
+            result[key] = {"참조": self._refcounts.get(key, 0), "유휴 연결": idle}
+        return result
+
+
+# 프로세스 전역 레지스트리
+session_registry = SessionRegistry()
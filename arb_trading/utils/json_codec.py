@@ -0,0 +1,33 @@
+# arb_trading/utils/json_codec.py
+"""JSON 디코더 선택 (orjson → msgspec → 표준 json)
+
+설치된 가장 빠른 디코더를 사용하고, 없으면 표준 라이브러리로 대체한다.
+모든 loads 구현은 bytes/str 입력을 모두 받는다.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+
+    BACKEND = "orjson"
+
+    def loads(data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+except ImportError:
+    try:
+        import msgspec
+
+        BACKEND = "msgspec"
+        _decoder = msgspec.json.Decoder()
+
+        def loads(data: Union[bytes, str]) -> Any:
+            return _decoder.decode(data)
+
+    except ImportError:
+        BACKEND = "json"
+
+        def loads(data: Union[bytes, str]) -> Any:
+            return json.loads(data)
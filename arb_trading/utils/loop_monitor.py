@@ -0,0 +1,113 @@
+# arb_trading/utils/loop_monitor.py
+"""이벤트 루프 지연 측정
+
+- 지연 샘플러: interval 초마다 잠들었다 깨어나며 예정 시각보다 늦게 깨어난 만큼을
+  스케줄링 지연으로 기록한다 (루프를 막는 동기 작업이 있으면 커진다).
+- 느린 콜백 캡처: asyncio 디버그 모드의 slow_callback_duration 경고
+  ("Executing <Handle ...> took N seconds")를 가로채 어떤 콜백이 루프를 막았는지 남긴다.
+  디버그 모드는 추가 검사로 루프가 느려지므로 원인을 찾을 때만 켠다.
+
+기록은 PerformanceMonitor로 넘긴다 (지연 구간별 히스토그램, 느린 콜백 목록).
+"""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Deque, Optional, Tuple
+
+
+class _SlowCallbackHandler(logging.Handler):
+    """asyncio 로거의 느린 콜백 경고 → LoopLagMonitor"""
+
+    def __init__(self, monitor: 'LoopLagMonitor'):
+        super().__init__(logging.WARNING)
+        self.monitor = monitor
+
+    def emit(self, record: logging.LogRecord):
+        # base_events: logger.warning('Executing %s took %.3f seconds', handle, dt)
+        if isinstance(record.msg, str) and record.msg.startswith('Executing ') and len(record.args or ()) == 2:
+            callback, duration = record.args
+            self.monitor.record_slow_callback(str(callback), float(duration))
+
+
+class LoopLagMonitor:
+    """이벤트 루프 스케줄링 지연 샘플러 + 느린 콜백 캡처"""
+
+    def __init__(self, performance_monitor=None, interval: float = 0.1,
+                 slow_callback_ms: float = 0.0, logger: Optional[logging.Logger] = None):
+        """
+        Args:
+            performance_monitor: 지연/느린 콜백 기록 대상
+            interval: 지연 샘플링 간격 (초)
+            slow_callback_ms: 이보다 오래 걸린 콜백을 기록 (밀리초, 0이면 디버그 모드 미사용)
+        """
+        self.performance_monitor = performance_monitor
+        self.interval = interval
+        self.slow_callback_ms = slow_callback_ms
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.samples = 0
+        self.max_lag = 0.0
+        self.slow_callbacks: Deque[Tuple[str, float]] = deque(maxlen=50)
+
+        self._task: Optional[asyncio.Task] = None
+        self._handler: Optional[_SlowCallbackHandler] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._previous_debug = False
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        """실행 중인 루프에서 샘플링 시작 (느린 콜백 캡처는 slow_callback_ms > 0 일 때)"""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+
+        if self.slow_callback_ms > 0:
+            self._previous_debug = self._loop.get_debug()
+            self._loop.slow_callback_duration = self.slow_callback_ms / 1000
+            self._loop.set_debug(True)
+            self._handler = _SlowCallbackHandler(self)
+            logging.getLogger('asyncio').addHandler(self._handler)
+
+        self._task = asyncio.create_task(self._sample())
+        self.logger.info(
+            f"⏱️ 이벤트 루프 지연 측정 시작 ({type(self._loop).__module__}, {self.interval * 1000:.0f}ms 간격"
+            f"{f', 느린 콜백 > {self.slow_callback_ms:.0f}ms' if self._handler else ''})"
+        )
+
+    async def stop(self):
+        if self._handler:
+            logging.getLogger('asyncio').removeHandler(self._handler)
+            self._handler = None
+            if self._loop and not self._loop.is_closed():
+                self._loop.set_debug(self._previous_debug)
+
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _sample(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.record_lag(max(0.0, loop.time() - expected))
+
+    def record_lag(self, lag: float):
+        self.samples += 1
+        if lag > self.max_lag:
+            self.max_lag = lag
+        if self.performance_monitor:
+            self.performance_monitor.record_loop_lag(lag)
+
+    def record_slow_callback(self, callback: str, duration: float):
+        self.slow_callbacks.append((callback, duration))
+        if self.performance_monitor:
+            self.performance_monitor.record_slow_callback(callback, duration)
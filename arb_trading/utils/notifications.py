@@ -6,6 +6,7 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import Optional, Dict
 import json
+from .http_session import session_registry
 
 
 class NotificationManager:
@@ -17,6 +18,22 @@ class NotificationManager:
         self.telegram_token = telegram_token
         self.telegram_chat_id = telegram_chat_id
         self.email_config = email_config or {}
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """공유 세션 (메시지마다 새 TCP+TLS 연결을 만들지 않음)"""
+        if self._session is None or self._session.closed:
+            self._session = session_registry.acquire(
+                "notifications",
+                timeout=aiohttp.ClientTimeout(total=10, connect=5)
+            )
+        return self._session
+
+    async def close(self):
+        """공유 세션 반환"""
+        if self._session is not None:
+            self._session = None
+            await session_registry.release("notifications")
 
     async def send_slack_notification(self, message: str, level: str = "INFO"):
         """슬랙 알림 발송"""
@@ -43,10 +60,10 @@ class NotificationManager:
                 }]
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(self.slack_webhook, json=payload) as response:
-                    if response.status != 200:
-                        print(f"슬랙 알림 발송 실패: {response.status}")
+            session = self._get_session()
+            async with session.post(self.slack_webhook, json=payload) as response:
+                if response.status != 200:
+                    print(f"슬랙 알림 발송 실패: {response.status}")
 
         except Exception as e:
             print(f"슬랙 알림 발송 중 오류: {e}")
@@ -64,10 +81,10 @@ class NotificationManager:
                 "parse_mode": "Markdown"
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=payload) as response:
-                    if response.status != 200:
-                        print(f"텔레그램 알림 발송 실패: {response.status}")
+            session = self._get_session()
+            async with session.post(url, json=payload) as response:
+                if response.status != 200:
+                    print(f"텔레그램 알림 발송 실패: {response.status}")
 
         except Exception as e:
             print(f"텔레그램 알림 발송 중 오류: {e}")
@@ -1,5 +1,6 @@
 # arb_trading/utils/performance.py (상세 로깅 추가)
 import time
+from bisect import bisect_left
 import psutil
 import threading
 import os
@@ -23,6 +24,32 @@ class PerformanceMetrics:
     api_call_counts: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
     error_counts: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
 
+    # 거래소별 회로 차단기 상태
+    circuit_states: Dict[str, str] = field(default_factory=dict)
+    circuit_open_counts: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+    # 심볼별 스프레드 이벤트 (배치 크기, 첫 갱신 → 전달 지연)
+    spread_event_sizes: deque = field(default_factory=lambda: deque(maxlen=1000))
+    spread_event_delays: deque = field(default_factory=lambda: deque(maxlen=1000))
+
+    # 시세 정상성 필터 규칙별 제외 수
+    filter_rejections: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+    # 파이프라인 단계별 처리 시간/큐 대기 시간, 큐별 버림 수
+    stage_times: Dict[str, deque] = field(default_factory=lambda: defaultdict(lambda: deque(maxlen=100)))
+    stage_waits: Dict[str, deque] = field(default_factory=lambda: defaultdict(lambda: deque(maxlen=100)))
+    queue_drops: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+    # 이벤트 루프 스케줄링 지연 (구간별 히스토그램 + 최근 샘플), 느린 콜백 (콜백, 초)
+    loop_lag_histogram: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    loop_lags: deque = field(default_factory=lambda: deque(maxlen=1000))
+    slow_callbacks: deque = field(default_factory=lambda: deque(maxlen=50))
+
+    # 2-다리 주문: 전송 시차/응답 시차 (초), 거래소별 주문 응답 지연
+    leg_send_skews: deque = field(default_factory=lambda: deque(maxlen=200))
+    leg_ack_skews: deque = field(default_factory=lambda: deque(maxlen=200))
+    leg_ack_times: Dict[str, deque] = field(default_factory=lambda: defaultdict(lambda: deque(maxlen=200)))
+
     # 프로세스별 리소스 사용량
     process_cpu_usage: deque = field(default_factory=lambda: deque(maxlen=50))
     process_memory_usage: deque = field(default_factory=lambda: deque(maxlen=50))
@@ -43,6 +70,9 @@ class FetchTiming:
 class PerformanceMonitor:
     """성능 모니터링 클래스"""
 
+    # 루프 지연 히스토그램 구간 상한 (밀리초)
+    LOOP_LAG_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+
     def __init__(self, enabled: bool = False):
         self.enabled = enabled
         self.metrics = PerformanceMetrics()
@@ -194,6 +224,65 @@ class PerformanceMonitor:
         if self.enabled:
             self.metrics.error_counts[error_type] += 1
 
+    def record_circuit_state(self, exchange: str, state: str):
+        """거래소 회로 차단기 상태 전환 기록"""
+        self.metrics.circuit_states[exchange] = state
+        if state == "open":
+            self.metrics.circuit_open_counts[exchange] += 1
+
+        if self.enabled:
+            icon = {"open": "🔴", "half_open": "🟡", "closed": "🟢"}.get(state, "⚪")
+            self.logger.info(f"{icon} {exchange.upper()} 회로 차단기: {state}")
+
+    def record_spread_event(self, batch_size: int, delay: float):
+        """스프레드 이벤트 배치 기록 (틱마다 호출되므로 로그 없음)"""
+        if self.enabled:
+            self.metrics.spread_event_sizes.append(batch_size)
+            self.metrics.spread_event_delays.append(delay)
+
+    def record_filter_rejections(self, rejections: Dict[str, int]):
+        """시세 필터 규칙별 제외 수 누적 (사이클마다 한 번)"""
+        if self.enabled:
+            for rule, count in rejections.items():
+                self.metrics.filter_rejections[rule] += count
+
+    def record_stage(self, stage: str, duration: float, wait: float = 0.0):
+        """파이프라인 단계 처리 시간과 입력 큐 대기 시간 기록"""
+        if self.enabled:
+            self.metrics.stage_times[stage].append(duration)
+            self.metrics.stage_waits[stage].append(wait)
+
+    def record_queue_drop(self, queue: str):
+        """가득 찬 단계 큐에서 오래된 항목을 버린 횟수"""
+        if self.enabled:
+            self.metrics.queue_drops[queue] += 1
+
+    def record_loop_lag(self, lag: float):
+        """이벤트 루프 스케줄링 지연 샘플 기록 (초)"""
+        if self.enabled:
+            self.metrics.loop_lags.append(lag)
+            index = bisect_left(self.LOOP_LAG_BUCKETS_MS, lag * 1000)
+            if index < len(self.LOOP_LAG_BUCKETS_MS):
+                bucket = f"≤{self.LOOP_LAG_BUCKETS_MS[index]}ms"
+            else:
+                bucket = f">{self.LOOP_LAG_BUCKETS_MS[-1]}ms"
+            self.metrics.loop_lag_histogram[bucket] += 1
+
+    def record_slow_callback(self, callback: str, duration: float):
+        """루프를 막은 느린 콜백 기록"""
+        if self.enabled:
+            self.metrics.slow_callbacks.append((callback, duration))
+            self.logger.warning(f"🐢 느린 콜백 {duration * 1000:.1f}ms: {callback}")
+
+    def record_leg_execution(self, send_skew: float, ack_skew: float, ack_times: Dict[str, float]):
+        """2-다리 주문 전송 시차/응답 시차, 거래소별 응답 지연 기록 (응답이 없으면 ack_skew NaN)"""
+        if self.enabled:
+            self.metrics.leg_send_skews.append(send_skew)
+            if ack_skew == ack_skew:
+                self.metrics.leg_ack_skews.append(ack_skew)
+            for exchange, duration in ack_times.items():
+                self.metrics.leg_ack_times[exchange].append(duration)
+
     def get_exchange_performance_summary(self) -> Dict[str, Any]:
         """거래소별 성능 요약"""
         if not self.enabled:
@@ -212,6 +301,10 @@ class PerformanceMonitor:
 
         return summary
 
+    def _bucket_order(self, bucket: str) -> float:
+        limit = float(bucket[1:-2])
+        return limit if bucket.startswith("≤") else limit + 0.5
+
     def get_performance_summary(self) -> Dict[str, Any]:
         """성능 요약 정보 반환"""
         if not self.enabled:
@@ -229,6 +322,69 @@ class PerformanceMonitor:
             "에러 발생 통계": dict(self.metrics.error_counts)
         }
 
+        if self.metrics.circuit_states:
+            summary["회로 차단기"] = {
+                exchange: f"{state} (열림 {self.metrics.circuit_open_counts.get(exchange, 0)}회)"
+                for exchange, state in self.metrics.circuit_states.items()
+            }
+
+        if self.metrics.spread_event_delays:
+            delays = sorted(self.metrics.spread_event_delays)
+            sizes = self.metrics.spread_event_sizes
+            summary["스프레드 이벤트"] = {
+                "평균 배치": f"{sum(sizes) / len(sizes):.1f}개",
+                "전달 지연 p50": f"{delays[len(delays) // 2] * 1000:.2f}ms",
+                "전달 지연 최대": f"{delays[-1] * 1000:.2f}ms"
+            }
+
+        if self.metrics.filter_rejections:
+            summary["시세 필터 제외"] = dict(self.metrics.filter_rejections)
+
+        if self.metrics.stage_times:
+            stages = {}
+            for stage, times in self.metrics.stage_times.items():
+                ordered = sorted(times)
+                waits = self.metrics.stage_waits[stage]
+                stages[stage] = (
+                    f"평균 {sum(ordered) / len(ordered) * 1000:.1f}ms, "
+                    f"p95 {ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000:.1f}ms, "
+                    f"대기 {sum(waits) / len(waits) * 1000:.1f}ms"
+                )
+            summary["파이프라인 단계"] = stages
+        if self.metrics.queue_drops:
+            summary["큐 버림"] = dict(self.metrics.queue_drops)
+
+        if self.metrics.loop_lags:
+            lags = sorted(self.metrics.loop_lags)
+            histogram = self.metrics.loop_lag_histogram
+            summary["이벤트 루프 지연"] = {
+                "p50": f"{lags[len(lags) // 2] * 1000:.2f}ms",
+                "p99": f"{lags[min(len(lags) - 1, int(len(lags) * 0.99))] * 1000:.2f}ms",
+                "최대": f"{lags[-1] * 1000:.2f}ms",
+                "분포": {bucket: histogram[bucket] for bucket in sorted(histogram, key=self._bucket_order)}
+            }
+        if self.metrics.slow_callbacks:
+            callback, duration = max(self.metrics.slow_callbacks, key=lambda item: item[1])
+            summary["느린 콜백"] = {
+                "최근 기록": f"{len(self.metrics.slow_callbacks)}개",
+                "최대": f"{duration * 1000:.1f}ms {callback[:120]}"
+            }
+
+        if self.metrics.leg_send_skews:
+            send_skews = sorted(self.metrics.leg_send_skews)
+            ack_skews = sorted(self.metrics.leg_ack_skews)
+            legs = {
+                "진입 시도": f"{len(send_skews)}회 (되돌림 {self.metrics.error_counts.get('leg_rollback', 0)}회)",
+                "전송 시차 p50": f"{send_skews[len(send_skews) // 2] * 1000:.2f}ms",
+                "전송 시차 최대": f"{send_skews[-1] * 1000:.2f}ms",
+            }
+            if ack_skews:
+                legs["응답 시차 p50"] = f"{ack_skews[len(ack_skews) // 2] * 1000:.1f}ms"
+                legs["응답 시차 최대"] = f"{ack_skews[-1] * 1000:.1f}ms"
+            for exchange, times in self.metrics.leg_ack_times.items():
+                legs[f"{exchange} 응답 평균"] = f"{sum(times) / len(times) * 1000:.1f}ms"
+            summary["2-다리 주문"] = legs
+
         # 프로세스 리소스 정보
         if self.metrics.process_cpu_usage and self.metrics.process_memory_mb:
             avg_cpu = sum(self.metrics.process_cpu_usage) / len(self.metrics.process_cpu_usage)
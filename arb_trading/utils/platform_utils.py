@@ -3,6 +3,7 @@ import asyncio
 import sys
 import platform
 import logging
+from typing import Optional
 
 
 def setup_windows_event_loop():
@@ -18,35 +19,48 @@ def setup_windows_event_loop():
             asyncio.set_event_loop(loop)
 
 
-def get_optimal_connector():
+def install_event_loop(backend: str = "asyncio") -> str:
+    """이벤트 루프 구현 선택 (uvloop 미설치/미지원 플랫폼이면 기본 루프) → 실제 사용 구현 반환"""
+    if backend != "uvloop":
+        return "asyncio"
+    if platform.system() == 'Windows':
+        return "asyncio"  # uvloop는 Windows 미지원
+
+    try:
+        import uvloop
+    except ImportError:
+        return "asyncio"
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return "uvloop"
+
+
+def get_optimal_connector(limit: int = 100, limit_per_host: Optional[int] = None,
+                          keepalive_timeout: Optional[float] = None):
     """플랫폼에 최적화된 aiohttp 커넥터 반환"""
     import aiohttp
 
-    if platform.system() == 'Windows':
-        # Windows에서는 기본 커넥터 사용 (DNS 해상도 문제 방지)
-        return aiohttp.TCPConnector(
-            limit=100,
-            limit_per_host=10,
-            ttl_dns_cache=300,
-            use_dns_cache=True,
-            enable_cleanup_closed=True
-        )
-    else:
-        # Linux/Mac에서는 성능 최적화된 커넥터
-        try:
-            import aiohttp_speedups  # 선택적 성능 향상
-            return aiohttp.TCPConnector(
-                limit=100,
-                limit_per_host=20,
-                ttl_dns_cache=300,
-                use_dns_cache=True,
-                enable_cleanup_closed=True
-            )
-        except ImportError:
-            return aiohttp.TCPConnector(
-                limit=100,
-                limit_per_host=10,
-                ttl_dns_cache=300,
-                use_dns_cache=True,
-                enable_cleanup_closed=True
-            )
+    if limit_per_host is None:
+        if platform.system() == 'Windows':
+            # Windows에서는 기본 커넥터 사용 (DNS 해상도 문제 방지)
+            limit_per_host = 10
+        else:
+            # Linux/Mac에서는 성능 최적화된 커넥터
+            try:
+                import aiohttp_speedups  # 선택적 성능 향상
+                limit_per_host = 20
+            except ImportError:
+                limit_per_host = 10
+
+    options = {}
+    if keepalive_timeout is not None:
+        options['keepalive_timeout'] = keepalive_timeout  # 유휴 연결 유지 시간
+
+    return aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        ttl_dns_cache=300,
+        use_dns_cache=True,
+        enable_cleanup_closed=True,
+        **options
+    )
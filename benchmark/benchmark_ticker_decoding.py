@@ -0,0 +1,166 @@
+"""
+🔬 전체 시장 티커 디코딩 벤치마크 (기존 Ticker 파싱 vs 경량 디코더)
+
+녹화된 응답 본문(bytes)으로 파싱 비용만 측정한다 (네트워크 제외).
+
+사용법:
+  python benchmark/benchmark_ticker_decoding.py --record   # 실제 응답 녹화 후 측정
+  python benchmark/benchmark_ticker_decoding.py            # 녹화본 사용 (없으면 합성 데이터)
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from arb_trading.exchanges.base import Ticker
+from arb_trading.exchanges.decoders import decode_binance_prices, decode_bybit_tickers
+from arb_trading.utils import json_codec
+
+REPEAT = 200
+PAYLOAD_DIR = Path(__file__).parent / "payloads"
+BINANCE_FILE = PAYLOAD_DIR / "binance_ticker_price.json"
+BYBIT_FILE = PAYLOAD_DIR / "bybit_tickers_linear.json"
+
+
+def record_payloads():
+    import requests
+
+    PAYLOAD_DIR.mkdir(parents=True, exist_ok=True)
+    BINANCE_FILE.write_bytes(requests.get("https://fapi.binance.com/fapi/v1/ticker/price").content)
+    BYBIT_FILE.write_bytes(
+        requests.get("https://api.bybit.com/v5/market/tickers", params={"category": "linear"}).content
+    )
+    print(f"💾 응답 녹화 완료: {PAYLOAD_DIR}")
+
+
+def synthetic_payloads(count: int = 600):
+    """녹화본이 없을 때 실제 응답 형태를 흉내 낸 합성 데이터"""
+    rng = random.Random(42)
+    symbols = [f"COIN{i}USDT" for i in range(count)]
+
+    binance = [
+        {"symbol": s, "price": f"{rng.uniform(0.001, 60000):.6f}", "time": 1700000000000}
+        for s in symbols
+    ]
+    bybit_list = []
+    for s in symbols:
+        price = rng.uniform(0.001, 60000)
+        bybit_list.append({
+            "symbol": s, "lastPrice": f"{price:.6f}", "indexPrice": f"{price:.6f}",
+            "markPrice": f"{price:.6f}", "prevPrice24h": f"{price:.6f}", "price24hPcnt": "0.01",
+            "highPrice24h": f"{price * 1.05:.6f}", "lowPrice24h": f"{price * 0.95:.6f}",
+            "prevPrice1h": f"{price:.6f}", "openInterest": "1000", "openInterestValue": "1000",
+            "turnover24h": f"{rng.uniform(1e5, 1e9):.2f}", "volume24h": "12345",
+            "fundingRate": "0.0001", "nextFundingTime": "1700000000000",
+            "bid1Price": f"{price * 0.9999:.6f}", "bid1Size": "1",
+            "ask1Price": f"{price * 1.0001:.6f}", "ask1Size": "1",
+        })
+    bybit = {"retCode": 0, "retMsg": "OK", "result": {"category": "linear", "list": bybit_list}}
+    return json.dumps(binance).encode(), json.dumps(bybit).encode()
+
+
+def load_payloads():
+    if BINANCE_FILE.exists() and BYBIT_FILE.exists():
+        print(f"📂 녹화본 사용: {PAYLOAD_DIR}")
+        return BINANCE_FILE.read_bytes(), BYBIT_FILE.read_bytes()
+    print("🧪 녹화본 없음 → 합성 데이터 사용 (--record 로 실제 응답 녹화)")
+    return synthetic_payloads()
+
+
+def _safe_float(value, default: float = 0.0) -> float:
+    if value is None or value == '' or value == '0':
+        return default
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return default
+
+
+def legacy_binance(raw: bytes):
+    """기존 경로: json + 심볼당 Ticker 생성"""
+    data = json.loads(raw)
+    now = int(time.time() * 1000)
+    tickers = {}
+    for item in data:
+        tickers[item['symbol']] = Ticker(
+            symbol=item['symbol'], last_price=float(item['price']),
+            bid=None, ask=None, volume_24h=0.0, timestamp=now
+        )
+    return {symbol: ticker.last_price for symbol, ticker in tickers.items()}
+
+
+def legacy_bybit(raw: bytes):
+    """기존 경로: json + _safe_float + 심볼당 Ticker 생성"""
+    data = json.loads(raw)
+    now = int(time.time() * 1000)
+    tickers = {}
+    for item in data['result']['list']:
+        symbol = item['symbol']
+        if '-' in symbol or not symbol.endswith('USDT'):
+            continue
+        last_price = float(item['lastPrice'])
+        if last_price <= 0:
+            continue
+        bid_price = _safe_float(item.get('bid1Price'))
+        ask_price = _safe_float(item.get('ask1Price'))
+        tickers[symbol] = Ticker(
+            symbol=symbol, last_price=last_price,
+            bid=bid_price if bid_price > 0 else None,
+            ask=ask_price if ask_price > 0 else None,
+            volume_24h=_safe_float(item.get('turnover24h')), timestamp=now
+        )
+    return {symbol: ticker.last_price for symbol, ticker in tickers.items()}
+
+
+def lean_binance(raw: bytes):
+    return decode_binance_prices(raw).price_map()
+
+
+def lean_bybit(raw: bytes):
+    return decode_bybit_tickers(raw).price_map()
+
+
+def benchmark(func, raw: bytes):
+    durations = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func(raw)
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def report(name, durations):
+    print(f"📊 {name} ({len(durations)}회)")
+    print(f" - 평균: {statistics.mean(durations) * 1000:.3f}ms")
+    print(f" - 중앙값: {statistics.median(durations) * 1000:.3f}ms")
+    print(f" - 최솟값: {min(durations) * 1000:.3f}ms")
+    print(f" - 최댓값: {max(durations) * 1000:.3f}ms")
+    print("-" * 40)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="티커 디코딩 벤치마크")
+    parser.add_argument("--record", action="store_true", help="실제 응답 녹화 후 측정")
+    args = parser.parse_args()
+
+    if args.record:
+        record_payloads()
+
+    binance_raw, bybit_raw = load_payloads()
+
+    # 두 경로 결과 일치 확인
+    assert legacy_binance(binance_raw) == lean_binance(binance_raw)
+    assert legacy_bybit(bybit_raw) == lean_bybit(bybit_raw)
+
+    print(f"🔬 티커 디코딩 벤치마크 (JSON 백엔드: {json_codec.BACKEND})\n")
+    print("📈 결과 비교")
+    report("바이낸스 기존: json + Ticker", benchmark(legacy_binance, binance_raw))
+    report(f"바이낸스 경량: {json_codec.BACKEND} + 컬럼", benchmark(lean_binance, binance_raw))
+    report("바이빗 기존: json + Ticker", benchmark(legacy_bybit, bybit_raw))
+    report(f"바이빗 경량: {json_codec.BACKEND} + 컬럼", benchmark(lean_bybit, bybit_raw))